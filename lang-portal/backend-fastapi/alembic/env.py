@@ -16,6 +16,10 @@ from app.models.word_group import WordGroup
 from app.models.activity import Activity
 from app.models.session import Session
 from app.models.word_review_item import WordReviewItem
+from app.models.word_stats import WordStats
+from app.models.word_schedule import WordSchedule
+from app.models.word_part import WordPart
+from app.models.cache_generation import CacheGeneration
 from app.core.config import get_settings
 
 # this is the Alembic Config object, which provides
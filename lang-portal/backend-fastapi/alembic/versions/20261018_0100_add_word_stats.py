@@ -0,0 +1,54 @@
+"""add word_stats rollup table
+
+Revision ID: 20261018_0100
+Revises: 20250217_0400
+Create Date: 2026-10-18 01:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0100'
+down_revision: Union[str, None] = '20250217_0400'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'word_stats',
+        sa.Column('word_id', sa.Integer(), nullable=False),
+        sa.Column('correct_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('wrong_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_reviewed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['word_id'], ['words.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('word_id'),
+    )
+    op.create_index(
+        'idx_word_stats_correct_count', 'word_stats', ['correct_count', 'word_id']
+    )
+    op.create_index(
+        'idx_word_stats_wrong_count', 'word_stats', ['wrong_count', 'word_id']
+    )
+
+    # Backfill from the existing review history
+    op.execute("""
+        INSERT INTO word_stats (word_id, correct_count, wrong_count, last_reviewed_at)
+        SELECT
+            word_id,
+            SUM(CASE WHEN correct THEN 1 ELSE 0 END),
+            SUM(CASE WHEN correct THEN 0 ELSE 1 END),
+            MAX(created_at)
+        FROM word_review_items
+        GROUP BY word_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_word_stats_wrong_count', table_name='word_stats')
+    op.drop_index('idx_word_stats_correct_count', table_name='word_stats')
+    op.drop_table('word_stats')
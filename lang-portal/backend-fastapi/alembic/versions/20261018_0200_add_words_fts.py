@@ -0,0 +1,75 @@
+"""add words_fts search index
+
+Revision ID: 20261018_0200
+Revises: 20261018_0100
+Create Date: 2026-10-18 02:00:00.000000
+
+"""
+import re
+from typing import Any, Dict, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0200'
+down_revision: Union[str, None] = '20261018_0100'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of the search document of this revision; the app's own
+# builder may change after it
+KANJI_PATTERN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]")
+
+
+def search_document(word: Any) -> Dict[str, Any]:
+    """Build the words_fts row of a words row."""
+    parts_kanji = []
+    for part in word.parts or []:
+        for char in KANJI_PATTERN.findall(str(part.get("kanji", ""))):
+            if char not in parts_kanji:
+                parts_kanji.append(char)
+    return {
+        "rowid": word.id,
+        "kanji": word.kanji,
+        "romaji": word.romaji,
+        "english": word.english,
+        "parts_kanji": " ".join(parts_kanji),
+    }
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE VIRTUAL TABLE words_fts USING fts5(
+            kanji, romaji, english, parts_kanji,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '1 2 3'
+        )
+    """)
+
+    # Backfill from the existing vocabulary
+    words = sa.table(
+        'words',
+        sa.column('id', sa.Integer),
+        sa.column('kanji', sa.String),
+        sa.column('romaji', sa.String),
+        sa.column('english', sa.String),
+        sa.column('parts', sa.JSON),
+    )
+    words_fts = sa.table(
+        'words_fts',
+        sa.column('rowid', sa.Integer),
+        sa.column('kanji', sa.String),
+        sa.column('romaji', sa.String),
+        sa.column('english', sa.String),
+        sa.column('parts_kanji', sa.String),
+    )
+    bind = op.get_bind()
+    rows = [search_document(row) for row in bind.execute(sa.select(words))]
+    if rows:
+        bind.execute(sa.insert(words_fts), rows)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS words_fts")
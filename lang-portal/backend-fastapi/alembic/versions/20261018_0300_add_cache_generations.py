@@ -0,0 +1,31 @@
+"""add cache_generations table
+
+Revision ID: 20261018_0300
+Revises: 20261018_0200
+Create Date: 2026-10-18 03:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0300'
+down_revision: Union[str, None] = '20261018_0200'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'cache_generations',
+        sa.Column('table_name', sa.String(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('table_name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('cache_generations')
@@ -0,0 +1,49 @@
+"""add indexes for list, join and lookup queries
+
+Revision ID: 20261018_0400
+Revises: 20261018_0300
+Create Date: 2026-10-18 04:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0400'
+down_revision: Union[str, None] = '20261018_0300'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns); databases created by init_db.py may have some already
+INDEXES = [
+    ('idx_words_kanji', 'words', ['kanji']),
+    ('idx_words_romaji', 'words', ['romaji']),
+    ('idx_words_english', 'words', ['english']),
+    ('idx_groups_name', 'groups', ['name']),
+    ('idx_groups_words_count', 'groups', ['words_count']),
+    ('idx_activities_name', 'activities', ['name']),
+    ('idx_word_groups_group_id', 'word_groups', ['group_id', 'word_id']),
+    ('idx_word_review_items_word_id', 'word_review_items', ['word_id']),
+    # Reviews of a session in id order, for paging
+    ('idx_word_review_items_session_id', 'word_review_items', ['session_id']),
+    # Correct counts per session without reading the reviews
+    ('idx_word_review_items_session_correct', 'word_review_items', ['session_id', 'correct']),
+    ('idx_word_review_items_created_at', 'word_review_items', ['created_at']),
+]
+
+# Indexes init_db.py used to create on fewer columns than they now cover
+WIDENED = ['idx_word_groups_group_id']
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        if name in WIDENED:
+            op.drop_index(name, table_name=table, if_exists=True)
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
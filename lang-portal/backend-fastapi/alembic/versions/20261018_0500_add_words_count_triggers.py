@@ -0,0 +1,56 @@
+"""maintain groups.words_count with triggers
+
+Revision ID: 20261018_0500
+Revises: 20261018_0400
+Create Date: 2026-10-18 05:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0500'
+down_revision: Union[str, None] = '20261018_0400'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The triggers as created by this revision
+WORDS_COUNT_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS word_groups_count_insert "
+    "AFTER INSERT ON word_groups BEGIN "
+    "UPDATE groups SET words_count = COALESCE(words_count, 0) + 1 WHERE id = NEW.group_id; "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS word_groups_count_delete "
+    "AFTER DELETE ON word_groups BEGIN "
+    "UPDATE groups SET words_count = COALESCE(words_count, 0) - 1 WHERE id = OLD.group_id; "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS word_groups_count_update "
+    "AFTER UPDATE OF group_id ON word_groups "
+    "WHEN OLD.group_id IS NOT NEW.group_id BEGIN "
+    "UPDATE groups SET words_count = COALESCE(words_count, 0) - 1 WHERE id = OLD.group_id; "
+    "UPDATE groups SET words_count = COALESCE(words_count, 0) + 1 WHERE id = NEW.group_id; "
+    "END",
+]
+DROP_WORDS_COUNT_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS word_groups_count_insert",
+    "DROP TRIGGER IF EXISTS word_groups_count_delete",
+    "DROP TRIGGER IF EXISTS word_groups_count_update",
+]
+
+
+def upgrade() -> None:
+    # Start from correct counts; word deletions never decremented them
+    op.execute("""
+        UPDATE groups SET words_count = (
+            SELECT COUNT(*) FROM word_groups WHERE word_groups.group_id = groups.id
+        )
+    """)
+    for statement in WORDS_COUNT_TRIGGERS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in DROP_WORDS_COUNT_TRIGGERS:
+        op.execute(statement)
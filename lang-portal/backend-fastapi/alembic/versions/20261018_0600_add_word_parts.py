@@ -0,0 +1,71 @@
+"""add word_parts component index
+
+Revision ID: 20261018_0600
+Revises: 20261018_0500
+Create Date: 2026-10-18 06:00:00.000000
+
+"""
+import re
+from typing import Any, Dict, List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0600'
+down_revision: Union[str, None] = '20261018_0500'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of the component rows of this revision; the app's own
+# builder may change after it
+KANJI_PATTERN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]")
+
+
+def component_rows(word: Any) -> List[Dict[str, Any]]:
+    """Build the word_parts rows of a words row: one per part that contains kanji."""
+    rows = []
+    for position, part in enumerate(word.parts or []):
+        component = str(part.get("kanji", ""))
+        if not KANJI_PATTERN.search(component):
+            continue
+        romaji = part.get("romaji", [])
+        rows.append({
+            "word_id": word.id,
+            "position": position,
+            "component": component,
+            "reading": "".join(romaji) if isinstance(romaji, list) else str(romaji),
+        })
+    return rows
+
+
+def upgrade() -> None:
+    word_parts = op.create_table(
+        'word_parts',
+        sa.Column('word_id', sa.Integer(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('component', sa.String(), nullable=False),
+        sa.Column('reading', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['word_id'], ['words.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('word_id', 'position')
+    )
+    op.create_index(
+        'idx_word_parts_component', 'word_parts', ['component', 'reading', 'word_id']
+    )
+
+    # Backfill from the parts of the existing vocabulary
+    words = sa.table(
+        'words',
+        sa.column('id', sa.Integer),
+        sa.column('parts', sa.JSON),
+    )
+    bind = op.get_bind()
+    rows = [row for word in bind.execute(sa.select(words)) for row in component_rows(word)]
+    if rows:
+        bind.execute(sa.insert(word_parts), rows)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_word_parts_component', table_name='word_parts')
+    op.drop_table('word_parts')
@@ -0,0 +1,68 @@
+"""add word_groups.position for random sampling
+
+Revision ID: 20261018_0700
+Revises: 20261018_0600
+Create Date: 2026-10-18 07:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0700'
+down_revision: Union[str, None] = '20261018_0600'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The SQL of this revision: number every group's members 0..n-1, then keep
+# positions dense with triggers
+RENUMBER_POSITIONS_SQL = (
+    "UPDATE word_groups SET position = numbered.position FROM ("
+    "SELECT word_id, group_id, "
+    "ROW_NUMBER() OVER (PARTITION BY group_id ORDER BY word_id) - 1 AS position "
+    "FROM word_groups) AS numbered "
+    "WHERE numbered.word_id = word_groups.word_id AND numbered.group_id = word_groups.group_id"
+)
+_FILL_POSITION = (
+    "UPDATE word_groups SET position = OLD.position "
+    "WHERE group_id = OLD.group_id AND position > OLD.position AND position = ("
+    "SELECT MAX(position) FROM word_groups WHERE group_id = OLD.group_id); "
+)
+_APPEND_POSITION = (
+    "UPDATE word_groups SET position = ("
+    "SELECT COALESCE(MAX(position) + 1, 0) FROM word_groups "
+    "WHERE group_id = NEW.group_id AND word_id != NEW.word_id) "
+    "WHERE word_id = NEW.word_id AND group_id = NEW.group_id; "
+)
+POSITION_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS word_groups_position_insert "
+    "AFTER INSERT ON word_groups BEGIN " + _APPEND_POSITION + "END",
+    "CREATE TRIGGER IF NOT EXISTS word_groups_position_delete "
+    "AFTER DELETE ON word_groups BEGIN " + _FILL_POSITION + "END",
+    "CREATE TRIGGER IF NOT EXISTS word_groups_position_update "
+    "AFTER UPDATE OF group_id ON word_groups "
+    "WHEN OLD.group_id IS NOT NEW.group_id BEGIN " + _FILL_POSITION + _APPEND_POSITION + "END",
+]
+DROP_POSITION_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS word_groups_position_insert",
+    "DROP TRIGGER IF EXISTS word_groups_position_delete",
+    "DROP TRIGGER IF EXISTS word_groups_position_update",
+]
+
+
+def upgrade() -> None:
+    op.add_column('word_groups', sa.Column('position', sa.Integer(), nullable=True))
+    op.execute(RENUMBER_POSITIONS_SQL)
+    op.create_index('idx_word_groups_position', 'word_groups', ['group_id', 'position'])
+    for statement in POSITION_TRIGGERS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in DROP_POSITION_TRIGGERS:
+        op.execute(statement)
+    op.drop_index('idx_word_groups_position', table_name='word_groups')
+    op.drop_column('word_groups', 'position')
@@ -0,0 +1,120 @@
+"""add word_schedule spaced-repetition table
+
+Revision ID: 20261018_0800
+Revises: 20261018_0700
+Create Date: 2026-10-18 08:00:00.000000
+
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0800'
+down_revision: Union[str, None] = '20261018_0700'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of the SM-2 schedule of this revision; the app's own
+# scheduler may change after it
+GRADE_CORRECT = 4
+GRADE_WRONG = 1
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+MAX_INTERVAL_DAYS = 36500.0
+REPLAY_CHUNK_SIZE = 5000
+
+SELECT_REVIEWS = sa.text(
+    "SELECT word_id, correct, created_at FROM word_review_items "
+    "ORDER BY word_id, created_at, id"
+).columns(
+    sa.column('word_id', sa.Integer),
+    sa.column('correct', sa.Boolean),
+    sa.column('created_at', sa.DateTime),
+)
+INSERT_SCHEDULE = sa.text(
+    "INSERT INTO word_schedule "
+    "(word_id, repetitions, interval_days, ease, last_reviewed_at, next_due) "
+    "VALUES (:word_id, :repetitions, :interval_days, :ease, :last_reviewed_at, :next_due)"
+).bindparams(
+    sa.bindparam('last_reviewed_at', type_=sa.DateTime),
+    sa.bindparam('next_due', type_=sa.DateTime),
+)
+
+
+def sm2_step(state: Optional[Dict], correct: bool, reviewed_at: datetime) -> Dict:
+    """Apply one review to a word's SM-2 state."""
+    repetitions = state["repetitions"] if state else 0
+    interval_days = state["interval_days"] if state else 0.0
+    ease = state["ease"] if state else INITIAL_EASE
+
+    grade = GRADE_CORRECT if correct else GRADE_WRONG
+    if correct:
+        if repetitions == 0:
+            interval_days = 1.0
+        elif repetitions == 1:
+            interval_days = 6.0
+        else:
+            interval_days = min(interval_days * ease, MAX_INTERVAL_DAYS)
+        repetitions += 1
+    else:
+        repetitions = 0
+        interval_days = 1.0
+    ease = max(MIN_EASE, ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+
+    return {
+        "repetitions": repetitions,
+        "interval_days": interval_days,
+        "ease": ease,
+        "last_reviewed_at": reviewed_at,
+        "next_due": reviewed_at + timedelta(days=interval_days),
+    }
+
+
+def replay_history(connection: sa.Connection) -> None:
+    """Write the schedule of every reviewed word by replaying its reviews in order."""
+    reviews = connection.execute(
+        SELECT_REVIEWS.execution_options(yield_per=REPLAY_CHUNK_SIZE)
+    )
+    rows: List[Dict] = []
+    current: Optional[Dict] = None
+    for word_id, correct, created_at in reviews:
+        if current is not None and current["word_id"] != word_id:
+            rows.append(current)
+            current = None
+            if len(rows) >= REPLAY_CHUNK_SIZE:
+                connection.execute(INSERT_SCHEDULE, rows)
+                rows = []
+        current = {"word_id": word_id, **sm2_step(current, correct, created_at)}
+    if current is not None:
+        rows.append(current)
+    if rows:
+        connection.execute(INSERT_SCHEDULE, rows)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'word_schedule',
+        sa.Column('word_id', sa.Integer(), nullable=False),
+        sa.Column('repetitions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('interval_days', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('ease', sa.Float(), nullable=False, server_default='2.5'),
+        sa.Column('last_reviewed_at', sa.DateTime(), nullable=False),
+        sa.Column('next_due', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['word_id'], ['words.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('word_id'),
+    )
+    op.create_index(
+        'idx_word_schedule_next_due', 'word_schedule', ['next_due', 'word_id']
+    )
+
+    # Backfill by replaying the existing review history
+    replay_history(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_index('idx_word_schedule_next_due', table_name='word_schedule')
+    op.drop_table('word_schedule')
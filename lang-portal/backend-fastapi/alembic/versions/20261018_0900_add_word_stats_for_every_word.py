@@ -0,0 +1,43 @@
+"""give every word a word_stats row
+
+Revision ID: 20261018_0900
+Revises: 20261018_0800
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0900'
+down_revision: Union[str, None] = '20261018_0800'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # New words start with zero counts
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS words_stats_insert
+        AFTER INSERT ON words BEGIN
+            INSERT OR IGNORE INTO word_stats (word_id, correct_count, wrong_count)
+            VALUES (NEW.id, 0, 0);
+        END
+    """)
+
+    # Words never reviewed get theirs now
+    op.execute("""
+        INSERT INTO word_stats (word_id, correct_count, wrong_count)
+        SELECT id, 0, 0 FROM words
+        WHERE id NOT IN (SELECT word_id FROM word_stats)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS words_stats_insert")
+    op.execute("""
+        DELETE FROM word_stats
+        WHERE correct_count = 0 AND wrong_count = 0 AND last_reviewed_at IS NULL
+    """)
@@ -1,21 +1,27 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import CachedRoute, cache_response
+from app.core.database import get_db, get_read_db
+from app.core.pagination import next_cursor, page_count
 from app.schemas.activity import Activity, ActivityCreate, ActivityUpdate
 from app.schemas.base import PaginatedResponse
 from app.services.activity_service import ActivityService
 from app.core.exceptions import AppHTTPException
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 @router.get("")
+@cache_response("activities")
 async def get_activities(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     sort_by: str = Query("name", regex="^(name)$", description="Field to sort by"),
     order: str = Query("asc", regex="^(asc|desc)$", description="Sort order"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    count: str = Query("exact", regex="^(exact|estimate|none)$", description="How to compute total"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get paginated list of activities.
@@ -25,17 +31,24 @@ async def get_activities(
         per_page: Number of items per page (max 100)
         sort_by: Field to sort by (name)
         order: Sort order (asc or desc)
+        cursor: Opaque next_cursor of a previous page; takes precedence over page
+        count: exact (COUNT(*)), estimate (cached count) or none (total is null)
     """
     skip = (page - 1) * per_page
-    activities, total = await ActivityService.get_activities(
-        db,
-        skip=skip,
-        limit=per_page,
-        order_by=sort_by,
-        order=order
-    )
+    try:
+        activities, total = await ActivityService.get_activities(
+            db,
+            skip=skip,
+            limit=per_page,
+            order_by=sort_by,
+            order=order,
+            cursor=cursor,
+            count_mode=count
+        )
+    except ValueError as e:
+        raise AppHTTPException(status_code=400, detail=str(e))
     
-    total_pages = (total + per_page - 1) // per_page
+    total_pages = page_count(total, per_page)
     
     return {
         "data": {
@@ -43,15 +56,17 @@ async def get_activities(
             "total": total,
             "page": page,
             "per_page": per_page,
-            "total_pages": total_pages
+            "total_pages": total_pages,
+            "next_cursor": next_cursor(activities, sort_by, per_page)
         },
         "error": None
     }
 
 @router.get("/{activity_id}")
+@cache_response("activities")
 async def get_activity(
     activity_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get an activity by ID.
@@ -1,23 +1,36 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.schemas.group import Group, GroupCreate, GroupUpdate, GroupWithWords
+from app.core.cache import CachedRoute, cache_response, etag_matches
+from app.core.database import get_db, get_read_db
+from app.core.pagination import next_cursor, page_count
+from app.schemas.group import (
+    Group,
+    GroupCreate,
+    GroupPack,
+    GroupSample,
+    GroupUpdate,
+    GroupWithWords,
+)
 from app.schemas.word import Word
 from app.schemas.base import PaginatedResponse
 from app.services.group_service import GroupService
+from app.services.word_pack import accepts_gzip
 from app.core.exceptions import AppHTTPException
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 @router.get("", response_model=PaginatedResponse[Group])
+@cache_response("groups")
 async def get_groups(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     sort_by: str = Query("name", regex="^(name|words_count)$"),
     order: str = Query("asc", regex="^(asc|desc)$"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    count: str = Query("exact", regex="^(exact|estimate|none)$", description="How to compute total"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get paginated list of word groups.
@@ -27,34 +40,43 @@ async def get_groups(
         per_page: Number of items per page (max 100)
         sort_by: Field to sort by (name, words_count)
         order: Sort order (asc or desc)
+        cursor: Opaque next_cursor of a previous page; takes precedence over page
+        count: exact (COUNT(*)), estimate (cached count) or none (total is null)
     """
     skip = (page - 1) * per_page
-    groups, total = await GroupService.get_groups(
-        db,
-        skip=skip,
-        limit=per_page,
-        order_by=sort_by,
-        order=order
-    )
+    try:
+        groups, total = await GroupService.get_groups(
+            db,
+            skip=skip,
+            limit=per_page,
+            order_by=sort_by,
+            order=order,
+            cursor=cursor,
+            count_mode=count
+        )
+    except ValueError as e:
+        raise AppHTTPException(status_code=400, detail=str(e))
     
-    total_pages = (total + per_page - 1) // per_page
+    total_pages = page_count(total, per_page)
     
     return {
         "items": [Group.model_validate(g) for g in groups],
         "total": total,
         "page": page,
         "per_page": per_page,
-        "total_pages": total_pages
+        "total_pages": total_pages,
+        "next_cursor": next_cursor(groups, sort_by, per_page)
     }
 
 @router.get("/{group_id}", response_model=GroupWithWords)
+@cache_response("groups", "word_groups", "words")
 async def get_group_words(
     group_id: int,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     sort_by: str = Query("romaji", regex="^(kanji|romaji|english)$"),
     order: str = Query("asc", regex="^(asc|desc)$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get words from a specific group.
@@ -77,13 +99,92 @@ async def get_group_words(
         skip=skip,
         limit=per_page,
         order_by=sort_by,
-        order=order
+        order=order,
+        # The response carries no page total, so skip counting
+        count_mode="none"
     )
     
     group_dict = Group.model_validate(group).model_dump()
     group_dict["words"] = [Word.model_validate(w) for w in words]
     return GroupWithWords(**group_dict)
 
+@router.get("/{group_id}/sample", response_model=GroupSample)
+async def sample_group_words(
+    group_id: int,
+    n: int = Query(20, ge=1, le=100),
+    strategy: str = Query("uniform", regex="^(uniform|weak)$"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get a random study set of words from a group.
+    
+    Not cached: every request draws a new set.
+    
+    Parameters:
+        group_id: ID of the group
+        n: Number of words (max 100); the whole group when it is smaller
+        strategy: uniform, or weak to pick often missed words more often
+    """
+    try:
+        words = await GroupService.sample_words(
+            db,
+            group_id=group_id,
+            n=n,
+            strategy=strategy
+        )
+    except ValueError as e:
+        raise AppHTTPException(status_code=404, detail=str(e))
+    
+    return GroupSample(
+        group_id=group_id,
+        strategy=strategy,
+        items=[Word.model_validate(w) for w in words]
+    )
+
+@router.get(
+    "/{group_id}/pack",
+    response_class=Response,
+    responses={200: {"model": GroupPack, "description": "Every word of the group in columns"}},
+)
+async def get_group_pack(
+    group_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get every word of a group in one columnar document, for games to preload.
+    
+    gzip-encoded when the client accepts it. The ETag is a hash of the
+    content, so If-None-Match gets a 304 for as long as the group's words
+    are unchanged, on any worker.
+    
+    Parameters:
+        group_id: ID of the group
+    """
+    try:
+        pack = await GroupService.get_word_pack(db, group_id)
+    except ValueError as e:
+        raise AppHTTPException(status_code=404, detail=str(e))
+
+    gzipped = pack.gzip_body is not None and accepts_gzip(
+        request.headers.get("accept-encoding", "")
+    )
+    headers = {
+        "ETag": pack.etag(gzipped),
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+    return Response(
+        content=pack.gzip_body if gzipped else pack.body,
+        media_type="application/json",
+        headers=headers,
+    )
+
 @router.post("", response_model=Group)
 async def create_group(
     *,
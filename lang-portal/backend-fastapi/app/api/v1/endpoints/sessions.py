@@ -1,26 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+import json
+from contextlib import suppress
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.responses import JSONResponse
 from typing import Optional
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.pagination import next_cursor, page_count
 from app.schemas.session import (
     Session,
     SessionCreate,
+    SessionStatsBatchRequest,
     WordReview,
-    WordReviewCreate
+    WordReviewCreate,
+    WordReviewBatchCreate
 )
+from app.services.review_buffer import ReviewBuffer, ReviewBufferUnavailable, get_review_buffer
+from app.services.review_stream import ReviewStream
 from app.services.session_service import SessionService
 
 router = APIRouter()
 
+# Close code of review streams whose session does not exist (4000-4999 are for applications)
+WS_SESSION_NOT_FOUND = 4404
+# Messages read ahead of the writer; beyond that the client is slowed down
+WS_INCOMING_MESSAGES = 100
+
 @router.get("", response_model=dict)
 async def list_sessions(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(25, ge=1, le=100, description="Items per page"),
     sort_by: Optional[str] = Query(None, description="Field to sort by"),
     order: Optional[str] = Query("asc", description="Sort order (asc or desc)"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    count: str = Query("exact", regex="^(exact|estimate|none)$", description="How to compute total"),
+    include: str = Query("reviews", regex="^(reviews|summary)$", description="Embed reviews or only their statistics"),
 ):
     """
     List sessions with pagination and sorting.
@@ -30,9 +46,14 @@ async def list_sessions(
         per_page: Number of items per page
         sort_by: Field to sort by (created_at, group_id, activity_id)
         order: Sort order (asc or desc)
+        cursor: Opaque next_cursor of a previous page; takes precedence over page
+        count: exact (COUNT(*)), estimate (cached count) or none (total is null)
+        include: reviews (every review of each session) or summary (total,
+            correct and accuracy per session; reviews are paged separately
+            at /sessions/{session_id}/reviews)
     
     Returns:
-        Paginated list of sessions with their reviews
+        Paginated list of sessions with their reviews or review statistics
     """
     skip = (page - 1) * per_page
     
@@ -58,19 +79,32 @@ async def list_sessions(
         )
     
     try:
-        sessions, total = await SessionService.get_sessions(
-            db,
-            skip=skip,
-            limit=per_page,
-            order_by=sort_by,
-            order=order
-        )
+        if include == "summary":
+            sessions, total = await SessionService.get_session_summaries(
+                db,
+                skip=skip,
+                limit=per_page,
+                order_by=sort_by,
+                order=order,
+                cursor=cursor,
+                count_mode=count
+            )
+            session_list = sessions
+        else:
+            sessions, total = await SessionService.get_sessions(
+                db,
+                skip=skip,
+                limit=per_page,
+                order_by=sort_by,
+                order=order,
+                cursor=cursor,
+                count_mode=count
+            )
+            # Convert SQLAlchemy models to Pydantic models
+            session_list = [Session.model_validate(session) for session in sessions]
         
         # Calculate pagination info
-        total_pages = (total + per_page - 1) // per_page
-        
-        # Convert SQLAlchemy models to Pydantic models
-        session_list = [Session.model_validate(session) for session in sessions]
+        total_pages = page_count(total, per_page)
         
         return {
             "data": {
@@ -78,10 +112,16 @@ async def list_sessions(
                 "total": total,
                 "page": page,
                 "per_page": per_page,
-                "total_pages": total_pages
+                "total_pages": total_pages,
+                "next_cursor": next_cursor(sessions, sort_by, per_page)
             },
             "error": None
         }
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={"data": None, "error": str(e)}
+        )
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -141,10 +181,36 @@ async def create_session(
             content={"data": None, "error": error_msg}
         )
 
+@router.post("/stats", response_model=dict)
+async def get_sessions_stats(
+    *,
+    stats_in: SessionStatsBatchRequest,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get review statistics for many sessions in one request.
+    
+    Parameters:
+        stats_in: IDs of the sessions (up to 500)
+    
+    Returns:
+        Total reviews, correct reviews and accuracy per session in request
+        order (zero for sessions without reviews), plus the IDs of sessions
+        that don't exist
+    """
+    items, missing = await SessionService.get_sessions_stats(db, stats_in.session_ids)
+    return {
+        "data": {
+            "items": [item.model_dump() for item in items],
+            "missing": missing
+        },
+        "error": None
+    }
+
 @router.get("/{session_id}", response_model=dict)
 async def get_session(
     session_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get details of a specific session.
@@ -171,27 +237,103 @@ async def get_session(
         "error": None
     }
 
+@router.get("/{session_id}/reviews", response_model=dict)
+async def list_session_reviews(
+    session_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(100, ge=1, le=500, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+):
+    """
+    List the reviews of a session, oldest first.
+    
+    Parameters:
+        session_id: ID of the session
+        page: Page number (1-indexed)
+        per_page: Number of items per page
+        cursor: Opaque next_cursor of a previous page; takes precedence over page
+    
+    Returns:
+        Paginated list of the session's reviews
+    
+    Raises:
+        HTTPException: If the session doesn't exist
+    """
+    try:
+        reviews, total = await SessionService.get_session_reviews(
+            db,
+            session_id,
+            skip=(page - 1) * per_page,
+            limit=per_page,
+            cursor=cursor
+        )
+    except ValueError as e:
+        error_msg = str(e)
+        status_code = 404 if "not found" in error_msg.lower() else 400
+        return JSONResponse(
+            status_code=status_code,
+            content={"data": None, "error": error_msg}
+        )
+
+    return {
+        "data": {
+            "items": [WordReview.model_validate(review).model_dump() for review in reviews],
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "total_pages": page_count(total, per_page),
+            "next_cursor": next_cursor(reviews, None, per_page)
+        },
+        "error": None
+    }
+
 @router.post("/{session_id}/review", response_model=dict)
 async def create_word_review(
     *,
     session_id: int,
     review_in: WordReviewCreate,
     db: AsyncSession = Depends(get_db),
+    buffer: Optional[ReviewBuffer] = Depends(get_review_buffer),
 ):
     """
     Log a review attempt for a word during a session.
+
+    With the write-behind buffer enabled the review is validated, queued
+    and answered with 202 before it is written, so it has no ID yet.
     
     Parameters:
         session_id: ID of the session
         review_in: Review data including word_id and correct status
     
     Returns:
-        The created review item
+        The created review item, or the queued review (202)
     
     Raises:
-        HTTPException: If the session doesn't exist or the word isn't in the session's group
+        HTTPException: If the session doesn't exist or the word isn't in the
+            session's group, or 503 if the write-behind buffer is full
     """
     try:
+        if buffer is not None:
+            queued = await SessionService.queue_review(
+                db,
+                buffer,
+                session_id=session_id,
+                word_id=review_in.word_id,
+                correct=review_in.correct
+            )
+            return JSONResponse(
+                status_code=202,
+                content={
+                    "data": {
+                        "id": None,
+                        **queued,
+                        "created_at": queued["created_at"].isoformat(),
+                        "queued": True
+                    },
+                    "error": None
+                }
+            )
         db_review = await SessionService.add_review(
             db,
             session_id=session_id,
@@ -218,4 +360,131 @@ async def create_word_review(
         return JSONResponse(
             status_code=400,
             content={"data": None, "error": error_msg}
-        ) 
\ No newline at end of file
+        )
+    except ReviewBufferUnavailable as e:
+        return JSONResponse(
+            status_code=503,
+            content={"data": None, "error": str(e)},
+            headers={"Retry-After": "1"}
+        )
+
+@router.post("/{session_id}/reviews/batch", response_model=dict)
+async def create_word_reviews_batch(
+    *,
+    session_id: int,
+    batch_in: WordReviewBatchCreate,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Log many review attempts for a session in one request.
+    
+    Parameters:
+        session_id: ID of the session
+        batch_in: Reviews to log, each with word_id and correct status
+    
+    Returns:
+        One result per item in request order, with the created review ID or
+        the reason the item was rejected, plus accepted/rejected counts
+    
+    Raises:
+        HTTPException: If the session doesn't exist
+    """
+    try:
+        results = await SessionService.add_reviews(
+            db,
+            session_id=session_id,
+            reviews=batch_in.reviews
+        )
+    except ValueError as e:
+        error_msg = str(e)
+        status_code = 404 if "not found" in error_msg.lower() else 400
+        return JSONResponse(
+            status_code=status_code,
+            content={"data": None, "error": error_msg}
+        )
+
+    accepted = sum(1 for result in results if result.error is None)
+    return {
+        "data": {
+            "session_id": session_id,
+            "accepted": accepted,
+            "rejected": len(results) - accepted,
+            "results": [result.model_dump() for result in results]
+        },
+        "error": None
+    }
+
+
+async def _receive_messages(websocket: WebSocket, incoming: asyncio.Queue) -> None:
+    """Put the body of every client message on `incoming`, then None once it disconnects."""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            await incoming.put(None)
+            return
+        body = message.get("text")
+        await incoming.put(body if body is not None else message.get("bytes", b""))
+
+
+@router.websocket("/{session_id}/ws")
+async def stream_word_reviews(
+    websocket: WebSocket,
+    session_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Stream review attempts of a session, for games that log them rapidly.
+
+    Each client message is a review, {"word_id": 1, "correct": true}, or a
+    list of them. Reviews are validated like the batch endpoint and written
+    in batches; after each batch the server sends the results and the
+    session's running statistics, in the standard envelope. The first
+    message is the statistics at connect time. Invalid messages get an
+    error message and are skipped; reviews still waiting when the client
+    disconnects are written.
+
+    Parameters:
+        session_id: ID of the session
+
+    The connection is closed with code 4404 if the session doesn't exist,
+    or stops existing.
+    """
+    await websocket.accept()
+    try:
+        stream = await ReviewStream.open(db, session_id)
+    except ValueError as e:
+        await websocket.send_json({"data": None, "error": str(e)})
+        await websocket.close(code=WS_SESSION_NOT_FOUND)
+        return
+    await websocket.send_json(stream.message([]))
+
+    incoming: asyncio.Queue = asyncio.Queue(WS_INCOMING_MESSAGES)
+    reader = asyncio.create_task(_receive_messages(websocket, incoming))
+    try:
+        while True:
+            try:
+                body = await asyncio.wait_for(incoming.get(), stream.time_to_flush())
+            except asyncio.TimeoutError:
+                pass
+            else:
+                if body is None:
+                    break
+                try:
+                    stream.add(ReviewStream.parse(json.loads(body)))
+                except ValueError as e:
+                    await websocket.send_json({"data": None, "error": str(e)})
+            if stream.due():
+                await websocket.send_json(stream.message(await stream.flush(db)))
+    except WebSocketDisconnect:
+        pass
+    except ValueError as e:
+        # The session was deleted while streaming
+        await websocket.send_json({"data": None, "error": str(e)})
+        await websocket.close(code=WS_SESSION_NOT_FOUND)
+        return
+    finally:
+        reader.cancel()
+
+    # The client left; keep the reviews it sent
+    with suppress(ValueError):
+        await stream.flush(db)
@@ -0,0 +1,32 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import CachedRoute
+from app.core.database import get_read_db
+from app.schemas.study import StudyQueue
+from app.services.study_service import StudyService
+from app.core.exceptions import AppHTTPException
+
+router = APIRouter(route_class=CachedRoute)
+
+@router.get("/due", response_model=StudyQueue)
+async def get_due_words(
+    group_id: Optional[int] = Query(None, description="Only words of this group"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get the words due for review, most overdue first.
+    
+    Not cached: what is due changes with the clock, not only with writes.
+    
+    Parameters:
+        group_id: Only words of this group
+        limit: Maximum number of words (max 100)
+    """
+    try:
+        items = await StudyService.get_due_words(db, group_id=group_id, limit=limit)
+    except ValueError as e:
+        raise AppHTTPException(status_code=404, detail=str(e))
+    return StudyQueue(items=items)
@@ -2,21 +2,35 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.schemas.word import Word, WordCreate, WordUpdate
+from app.core.cache import CachedRoute, cache_response
+from app.core.database import get_db, get_read_db
+from app.core.pagination import next_cursor, page_count
+from app.schemas.word import (
+    AnswerCheck,
+    AnswerCheckBatch,
+    AnswerCheckBatchResult,
+    AnswerCheckResult,
+    RelatedWord,
+    Word,
+    WordCreate,
+    WordUpdate,
+)
 from app.schemas.base import PaginatedResponse
 from app.services.word_service import WordService
 from app.core.exceptions import AppHTTPException
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 @router.get("", response_model=PaginatedResponse[Word])
+@cache_response("words", "word_stats")
 async def get_words(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     sort_by: str = Query("romaji", regex="^(kanji|romaji|english|correct_count|wrong_count)$"),
     order: str = Query("asc", regex="^(asc|desc)$"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    count: str = Query("exact", regex="^(exact|estimate|none)$", description="How to compute total"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get paginated list of words with review statistics.
@@ -26,24 +40,104 @@ async def get_words(
         per_page: Number of items per page (max 100)
         sort_by: Field to sort by (kanji, romaji, english, correct_count, wrong_count)
         order: Sort order (asc or desc)
+        cursor: Opaque next_cursor of a previous page; takes precedence over page
+        count: exact (COUNT(*)), estimate (cached count) or none (total is null)
+    """
+    skip = (page - 1) * per_page
+    try:
+        words, total = await WordService.get_words_with_stats(
+            db,
+            skip=skip,
+            limit=per_page,
+            order_by=sort_by,
+            order=order,
+            cursor=cursor,
+            count_mode=count
+        )
+    except ValueError as e:
+        raise AppHTTPException(status_code=400, detail=str(e))
+    
+    total_pages = page_count(total, per_page)
+    
+    return {
+        "items": words,
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "total_pages": total_pages,
+        "next_cursor": next_cursor(words, sort_by, per_page)
+    }
+
+@router.get("/search", response_model=PaginatedResponse[Word])
+@cache_response("words", "word_stats")
+async def search_words(
+    q: str = Query(..., min_length=1, max_length=100, description="Search text"),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Search words by kanji, romaji, English or the kanji of their parts.
+    
+    Every term of the query is matched as a prefix, so partial input works
+    for type-ahead. Results are ranked by relevance.
+    
+    Parameters:
+        q: Search text
+        page: Page number (starts from 1)
+        per_page: Number of items per page (max 100)
     """
     skip = (page - 1) * per_page
-    words, total = await WordService.get_words_with_stats(
+    words, total = await WordService.search_words(
         db,
+        q=q,
         skip=skip,
-        limit=per_page,
-        order_by=sort_by,
-        order=order
+        limit=per_page
     )
     
-    total_pages = (total + per_page - 1) // per_page
+    return {
+        "items": words,
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "total_pages": page_count(total, per_page),
+        "next_cursor": None
+    }
+
+@router.get("/by-component", response_model=PaginatedResponse[Word])
+@cache_response("words", "word_stats")
+async def get_words_by_component(
+    component: str = Query(..., min_length=1, max_length=10, description="Kanji of a word part"),
+    reading: Optional[str] = Query(None, min_length=1, max_length=50, description="Romaji reading of the part"),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get words that contain a kanji component, e.g. every word with 動.
+    
+    Parameters:
+        component: Kanji of a word part
+        reading: Only match the component when read this way, e.g. "dou"
+        page: Page number (starts from 1)
+        per_page: Number of items per page (max 100)
+    """
+    skip = (page - 1) * per_page
+    words, total = await WordService.get_words_by_component(
+        db,
+        component=component,
+        reading=reading,
+        skip=skip,
+        limit=per_page
+    )
     
     return {
         "items": words,
         "total": total,
         "page": page,
         "per_page": per_page,
-        "total_pages": total_pages
+        "total_pages": page_count(total, per_page),
+        "next_cursor": None
     }
 
 @router.post("", response_model=Word)
@@ -75,10 +169,33 @@ async def create_word(
     except ValueError as e:
         raise AppHTTPException(status_code=400, detail=str(e))
 
+@router.post("/check", response_model=AnswerCheckBatchResult)
+async def check_answers(
+    *,
+    batch_in: AnswerCheckBatch,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Check typed romaji answers to many words at once.
+    
+    Parameters:
+        batch_in: Items with word_id and the answer typed so far
+    
+    Returns:
+        One result per item in request order, with its status or the
+        reason it could not be checked
+    """
+    results = await WordService.check_answers(
+        db,
+        [(item.word_id, item.answer) for item in batch_in.items]
+    )
+    return AnswerCheckBatchResult(items=results)
+
 @router.get("/{word_id}", response_model=Word)
+@cache_response("words")
 async def get_word(
     word_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get a word by ID.
@@ -97,6 +214,76 @@ async def get_word(
         raise AppHTTPException(status_code=404, detail=f"Word {word_id} not found")
     return word
 
+@router.get("/{word_id}/related", response_model=PaginatedResponse[RelatedWord])
+@cache_response("words", "word_stats")
+async def get_related_words(
+    word_id: int,
+    page: int = Query(1, ge=1),
+    per_page: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get words that share kanji components with a word, most shared first.
+    
+    Parameters:
+        word_id: ID of the word
+        page: Page number (starts from 1)
+        per_page: Number of items per page (max 100)
+    
+    Returns:
+        Related words, each with the components it shares with the word
+    
+    Raises:
+        AppHTTPException: If the word is not found
+    """
+    skip = (page - 1) * per_page
+    try:
+        words, total = await WordService.get_related_words(
+            db,
+            word_id,
+            skip=skip,
+            limit=per_page
+        )
+    except ValueError as e:
+        raise AppHTTPException(status_code=404, detail=str(e))
+    
+    return {
+        "items": words,
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "total_pages": page_count(total, per_page),
+        "next_cursor": None
+    }
+
+@router.post("/{word_id}/check", response_model=AnswerCheckResult)
+async def check_answer(
+    *,
+    word_id: int,
+    check_in: AnswerCheck,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Check a typed romaji answer to a word, complete or not.
+    
+    Every romanization of the word's readings is accepted (e.g. "shi" or
+    "si"); answers that could still become correct are "partial".
+    
+    Parameters:
+        word_id: ID of the word
+        check_in: The answer typed so far
+    
+    Returns:
+        The status (correct, partial or wrong) and how many characters matched
+    
+    Raises:
+        AppHTTPException: If the word is not found
+    """
+    try:
+        return await WordService.check_answer(db, word_id=word_id, answer=check_in.answer)
+    except ValueError as e:
+        raise AppHTTPException(status_code=404, detail=str(e))
+
 @router.put("/{word_id}", response_model=Word)
 async def update_word(
     *,
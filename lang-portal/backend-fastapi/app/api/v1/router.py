@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import words, groups, sessions, activities
+from app.api.v1.endpoints import words, groups, sessions, activities, study
 
 api_router = APIRouter()
 
@@ -22,4 +22,9 @@ api_router.include_router(
     activities.router,
     prefix="/activities",
     tags=["activities"]
-) 
\ No newline at end of file
+)
+api_router.include_router(
+    study.router,
+    prefix="/study",
+    tags=["study"]
+)
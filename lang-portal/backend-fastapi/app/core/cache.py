@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.core.config import get_settings
+from app.core.invalidation import table_versions
+
+settings = get_settings()
+
+
+@dataclass
+class CachedResponse:
+    etag: str
+    body: bytes
+    media_type: Optional[str]
+
+
+class ResponseCache:
+    """Bounded LRU of rendered GET responses, keyed by URL and ETag."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+    def get(self, key: str, etag: str) -> Optional[CachedResponse]:
+        """Return the entry for `key` if it was built at `etag`."""
+        entry = self._entries.get(key)
+        if entry is None or entry.etag != etag:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store `entry`, evicting the least recently used ones over maxsize."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.not_modified = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring; 304 answers count as hits."""
+        lookups = self.hits + self.misses + self.not_modified
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits + self.not_modified) / lookups if lookups else 0.0,
+        }
+
+
+response_cache = ResponseCache(maxsize=settings.RESPONSE_CACHE_SIZE)
+
+
+def cache_response(*tables: str) -> Callable:
+    """
+    Mark a GET endpoint as cacheable until one of `tables` is written.
+
+    Apply it below the router decorator, on routers using `CachedRoute`.
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__cache_tables__ = tables
+        return endpoint
+    return decorator
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against `etag`."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class CachedRoute(APIRoute):
+    """
+    Route that serves endpoints marked with `cache_response` conditionally.
+
+    The ETag is computed from table versions before the endpoint runs, so
+    a matching If-None-Match is answered with 304 and a repeated URL is
+    replayed from the cache, both without opening a database connection.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        tables = getattr(self.endpoint, "__cache_tables__", None)
+        if not tables:
+            return handler
+
+        async def cached_handler(request: Request) -> Response:
+            if request.method != "GET":
+                return await handler(request)
+
+            etag = table_versions.etag(tables)
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match and etag_matches(if_none_match, etag):
+                response_cache.not_modified += 1
+                return Response(status_code=304, headers=headers)
+
+            key = f"{request.url.path}?{request.url.query}"
+            entry = response_cache.get(key, etag)
+            if entry is not None:
+                return Response(
+                    content=entry.body,
+                    media_type=entry.media_type,
+                    headers=headers,
+                )
+
+            response = await handler(request)
+            if response.status_code == 200:
+                response.headers.update(headers)
+                response_cache.set(
+                    key, CachedResponse(etag, response.body, response.media_type)
+                )
+            return response
+
+        return cached_handler
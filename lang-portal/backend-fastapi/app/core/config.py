@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 from pydantic_settings import BaseSettings
 from pydantic import validator
 from functools import lru_cache
@@ -16,6 +16,49 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_ECHO: bool = False  # Log every SQL statement; independent of DEBUG
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a pooled connection
+
+    # SQLite connection tuning, applied to every new connection
+    # WAL lets readers proceed while a review is being written
+    SQLITE_JOURNAL_MODE: Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"] = "WAL"
+    # NORMAL is durable enough under WAL and only syncs at checkpoints
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # Bytes
+    SQLITE_CACHE_SIZE: int = -64 * 1024  # Negative values are KiB, i.e. 64 MiB
+    SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    
+    # Number of rendered GET responses kept for conditional requests (0 disables)
+    RESPONSE_CACHE_SIZE: int = 512
+    # "shared" keeps caches coherent across worker processes using the same
+    # SQLite file; "local" only sees writes made by the current process
+    CACHE_INVALIDATION: Literal["local", "shared"] = "shared"
+    # Number of compiled romaji answer matchers kept in memory (0 disables)
+    MATCHER_CACHE_SIZE: int = 4096
+    # Number of encoded group word packs kept in memory (0 disables)
+    WORD_PACK_CACHE_SIZE: int = 32
+
+    # Write-behind buffer for single review POSTs: reviews are answered
+    # with 202 once queued and written in grouped transactions
+    REVIEW_WRITE_BEHIND: bool = False
+    REVIEW_BUFFER_SIZE: int = 10000  # Queued reviews before submitters wait
+    REVIEW_FLUSH_INTERVAL_MS: int = 50  # Longest a review waits for a flush...
+    REVIEW_FLUSH_SIZE: int = 500  # ...unless this many are queued first
+    REVIEW_SUBMIT_TIMEOUT: float = 1.0  # Seconds to wait for room before a 503
+
+    # Prometheus metrics of requests and the connection pool at /metrics
+    METRICS: bool = True
+
+    # Per-request SQL statement counts and timings (Server-Timing header and
+    # a log line); the engine hooks are not installed when off
+    SQL_INSTRUMENTATION: bool = False
+    # Flag a request as a likely N+1 above this many statements in total...
+    SQL_STATEMENT_THRESHOLD: int = 25
+    # ...or when one statement runs this many times
+    SQL_REPEAT_THRESHOLD: int = 10
     
     # Frontend
     FRONTEND_URL: str = "http://localhost:5173"
@@ -1,16 +1,160 @@
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+import logging
+import time
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
+from sqlalchemy import event, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    create_async_engine,
+    AsyncSession,
+    async_sessionmaker,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import Settings, get_settings
+from app.core.instrumentation import install_query_instrumentation
+from app.core.metrics import db_pool_checkout, registry
 
-from app.core.config import get_settings
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# Integer values SQLite reports back for the named pragma settings
+_SYNCHRONOUS_LEVELS = {"OFF": 0, "NORMAL": 1, "FULL": 2, "EXTRA": 3}
+_TEMP_STORE_LEVELS = {"DEFAULT": 0, "FILE": 1, "MEMORY": 2}
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout takes, by pool name."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout.observe(time.perf_counter() - started, self.logging_name or "default")
+
+
+def engine_options(settings: Settings) -> Dict[str, Any]:
+    """Keyword arguments for `create_async_engine` derived from settings."""
+    options: Dict[str, Any] = {"echo": settings.DB_ECHO}
+    url = make_url(settings.DATABASE_URL)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory databases use a single static connection, no pool to size
+        return options
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    if settings.METRICS:
+        options["poolclass"] = MeasuredQueuePool
+    return options
+
+
+def sqlite_pragmas(settings: Settings) -> Dict[str, Any]:
+    """PRAGMA values applied to every new SQLite connection, in order."""
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+    }
+
+
+def read_only_url(database_url: str) -> Optional[URL]:
+    """
+    URL that opens the same SQLite file in read-only mode.
+
+    Returns None for in-memory and non-SQLite databases, where a second
+    connection would not see the same data or has no read-only mode.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return None
+    return url.set(
+        database=f"file:{url.database}",
+        query={**url.query, "mode": "ro", "uri": "true"},
+    )
+
+
+def install_sqlite_pragmas(engine: AsyncEngine, pragmas: Dict[str, Any]) -> None:
+    """Run `pragmas` on each connection the engine's pool opens."""
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
+    **engine_options(settings),
+    pool_logging_name="write",
 )
 
+if engine.dialect.name == "sqlite":
+    install_sqlite_pragmas(engine, sqlite_pragmas(settings))
+
+
+def create_read_engine(settings: Settings, write_engine: AsyncEngine) -> AsyncEngine:
+    """
+    Engine with its own pool of read-only connections for GET requests.
+
+    Falls back to `write_engine` when the database has no read-only URL.
+    """
+    url = read_only_url(settings.DATABASE_URL)
+    if url is None:
+        return write_engine
+    read_engine = create_async_engine(
+        url,
+        **engine_options(settings),
+        pool_logging_name="read",
+        # Nothing is ever written on these connections, so skip the
+        # rollback that normally runs when one goes back to the pool
+        pool_reset_on_return=None,
+    )
+    pragmas = sqlite_pragmas(settings)
+    # The journal mode is a property of the file, set by the write engine
+    del pragmas["journal_mode"]
+    pragmas["query_only"] = "ON"
+    install_sqlite_pragmas(read_engine, pragmas)
+    return read_engine
+
+
+read_engine = create_read_engine(settings, engine)
+
+
+def pool_connections() -> Dict[Tuple[str, ...], float]:
+    """Connections each pool has checked out and idle, for the metrics gauge."""
+    values: Dict[Tuple[str, ...], float] = {}
+    for name, pool in (("write", engine.pool), ("read", read_engine.pool)):
+        if isinstance(pool, QueuePool) and (name == "write" or read_engine is not engine):
+            values[(name, "checked_out")] = pool.checkedout()
+            values[(name, "idle")] = pool.checkedin()
+    return values
+
+
+if settings.METRICS:
+    registry.gauge(
+        "db_pool_connections",
+        "Database connections per pool and state",
+        ("engine", "state"),
+        collect=pool_connections,
+    )
+
+if settings.SQL_INSTRUMENTATION:
+    install_query_instrumentation(engine)
+    if read_engine is not engine:
+        install_query_instrumentation(read_engine)
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -19,6 +163,13 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 
 class Base(DeclarativeBase):
     pass
@@ -33,4 +184,57 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.rollback()
             raise
         finally:
-            await session.close() 
\ No newline at end of file
+            await session.close()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for requests that only read, such as GET endpoints.
+
+    Uses read-only connections, so it never waits for the write lock, and
+    skips the commit/rollback round trips of `get_db`.
+    """
+    async with ReadSessionLocal() as session:
+        yield session
+
+
+async def check_database(
+    engine: AsyncEngine = engine,
+    settings: Settings = settings
+) -> Dict[str, Any]:
+    """
+    Startup self-check: report the connection settings actually in effect.
+
+    Reads each pragma back from a live connection and logs a warning for any
+    value SQLite did not accept (e.g. WAL on an in-memory database, or an
+    mmap_size above the compile-time limit).
+
+    Returns:
+        Dict with the pool configuration and the effective value of each pragma
+    """
+    pool = engine.pool
+    report: Dict[str, Any] = {"echo": engine.echo, "pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        report.update(
+            pool_size=pool.size(),
+            max_overflow=pool._max_overflow,
+            pool_timeout=pool.timeout(),
+        )
+    if engine.dialect.name != "sqlite":
+        logger.info(f"Database settings: {report}")
+        return report
+
+    expected = sqlite_pragmas(settings)
+    expected["journal_mode"] = expected["journal_mode"].lower()
+    expected["synchronous"] = _SYNCHRONOUS_LEVELS[expected["synchronous"]]
+    expected["temp_store"] = _TEMP_STORE_LEVELS[expected["temp_store"]]
+
+    async with engine.connect() as conn:
+        for name, wanted in expected.items():
+            actual = (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+            report[name] = actual
+            if actual != wanted:
+                logger.warning(f"SQLite {name} is {actual!r}, configured {wanted!r}")
+
+    logger.info(f"Database settings: {report}")
+    return report
@@ -0,0 +1,160 @@
+import json
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Longest statement text quoted in a log line
+_STATEMENT_PREVIEW = 200
+
+
+@dataclass
+class RequestQueries:
+    """Statements executed while serving one request."""
+
+    statements: int = 0
+    duration: float = 0.0  # Seconds spent in the database driver
+    # Statement text -> executions; parameters are bound separately, so
+    # running the same query for different rows repeats the same text
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.statements += 1
+        self.duration += duration
+        self.shapes[statement] += 1
+
+    def most_repeated(self) -> Tuple[Optional[str], int]:
+        """The statement executed most often and its count."""
+        if not self.shapes:
+            return None, 0
+        return self.shapes.most_common(1)[0]
+
+
+current_queries: ContextVar[Optional[RequestQueries]] = ContextVar("current_queries", default=None)
+
+
+def _start_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    # Statements on one connection never overlap, and a failed one is
+    # simply overwritten by the next
+    conn.info["query_started"] = time.perf_counter()
+
+
+def _stop_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started"]
+    queries = current_queries.get()
+    if queries is not None:
+        queries.record(statement, elapsed)
+
+
+def install_query_instrumentation(engine: AsyncEngine) -> None:
+    """
+    Time every statement the engine runs into the current request's stats.
+
+    Statements run outside a request (startup checks, scripts) are ignored.
+    Installing twice has no effect.
+    """
+    target = engine.sync_engine
+    if not event.contains(target, "before_cursor_execute", _start_timer):
+        event.listen(target, "before_cursor_execute", _start_timer)
+        event.listen(target, "after_cursor_execute", _stop_timer)
+
+
+def uninstall_query_instrumentation(engine: AsyncEngine) -> None:
+    """Remove the hooks added by `install_query_instrumentation`."""
+    target = engine.sync_engine
+    if event.contains(target, "before_cursor_execute", _start_timer):
+        event.remove(target, "before_cursor_execute", _start_timer)
+        event.remove(target, "after_cursor_execute", _stop_timer)
+
+
+def server_timing(queries: RequestQueries, total: float) -> str:
+    """`Server-Timing` header value for the database and whole-request time."""
+    return (
+        f'db;dur={queries.duration * 1000:.2f};desc="{queries.statements} queries", '
+        f"app;dur={total * 1000:.2f}"
+    )
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Report the statements each HTTP request ran.
+
+    Adds a `Server-Timing` header to the response and logs one JSON line per
+    request. A request that runs more than `statement_threshold` statements,
+    or the same statement `repeat_threshold` times or more, is logged as a
+    warning with `n_plus_one` set, as it most likely queries inside a loop.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        statement_threshold: int = 25,
+        repeat_threshold: int = 10
+    ) -> None:
+        self.app = app
+        self.statement_threshold = statement_threshold
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries()
+        token = current_queries.set(queries)
+        started = time.perf_counter()
+        status: Optional[int] = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing(queries, time.perf_counter() - started))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_queries.reset(token)
+            self.report(scope, status, queries, time.perf_counter() - started)
+
+    def report(
+        self,
+        scope: Scope,
+        status: Optional[int],
+        queries: RequestQueries,
+        total: float
+    ) -> Dict[str, Any]:
+        """Log the request's query stats; returns the logged fields."""
+        statement, repeats = queries.most_repeated()
+        n_plus_one = (
+            queries.statements > self.statement_threshold
+            or repeats >= self.repeat_threshold
+        )
+        fields: Dict[str, Any] = {
+            "event": "sql_request",
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status,
+            "statements": queries.statements,
+            "db_ms": round(queries.duration * 1000, 2),
+            "total_ms": round(total * 1000, 2),
+            "n_plus_one": n_plus_one,
+        }
+        if n_plus_one:
+            fields["repeats"] = repeats
+            fields["repeated_statement"] = " ".join(statement.split())[:_STATEMENT_PREVIEW]
+            logger.warning(json.dumps(fields, ensure_ascii=False))
+        else:
+            logger.info(json.dumps(fields, ensure_ascii=False))
+        return fields
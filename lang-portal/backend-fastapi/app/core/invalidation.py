@@ -0,0 +1,144 @@
+import logging
+import os
+import secrets
+import sqlite3
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+_RECORD_WRITE_SQL = text(
+    "INSERT INTO cache_generations (table_name, version) VALUES (:table_name, 1) "
+    "ON CONFLICT (table_name) DO UPDATE SET version = version + 1"
+)
+
+
+async def record_writes(db: AsyncSession, tables: Iterable[str]) -> None:
+    """
+    Bump the shared generation of `tables` in the current transaction.
+
+    Call it right before committing a write, so other processes see the
+    new generations exactly when they can see the new data. Does not commit.
+    """
+    rows = [{"table_name": table} for table in dict.fromkeys(tables)]
+    if rows:
+        await db.execute(_RECORD_WRITE_SQL, rows)
+
+
+class TableVersions:
+    """
+    Per-table write counters used to derive ETags, local to this process.
+
+    The CRUD layer bumps a table after every committed write to it, so a
+    response built from a set of tables stays valid for as long as their
+    versions are unchanged. Writes made by other processes are not seen.
+    """
+
+    def __init__(self) -> None:
+        self._versions: Dict[str, int] = {}
+        # Distinguishes this process, so ETags issued by another worker or
+        # before a restart never match by accident
+        self.epoch = secrets.token_hex(4)
+
+    def bump(self, *tables: str) -> None:
+        """Record a committed write to `tables`."""
+        for table in tables:
+            self._versions[table] = self._versions.get(table, 0) + 1
+
+    def get(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        """Current versions of `tables`, in order."""
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+    def etag(self, tables: Iterable[str]) -> str:
+        """Strong ETag for a response built from `tables`."""
+        versions = ".".join(str(v) for v in self.get(tables))
+        return f'"{self.epoch}-{versions}"'
+
+    def close(self) -> None:
+        """Release resources; local versions hold none."""
+
+
+class SharedTableVersions(TableVersions):
+    """
+    Table versions shared by every process using the same SQLite file.
+
+    Versions come from the cache_generations table, which `record_writes`
+    updates inside each writing transaction. A dedicated read-only
+    connection polls `PRAGMA data_version`, which changes only when another
+    connection commits, so the table is re-read only after some process
+    wrote. Polling costs no I/O otherwise.
+    """
+
+    def __init__(self, database_path: str) -> None:
+        super().__init__()
+        self.database_path = database_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        self._failing = False
+        self.reloads = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                f"file:{self.database_path}?mode=ro",
+                uri=True,
+                timeout=1.0,
+                check_same_thread=False,
+            )
+            # The file identity keeps ETags from matching across a recreated
+            # database, while staying the same for every worker
+            self.epoch = format(os.stat(self.database_path).st_ino, "x")
+        return self._conn
+
+    def refresh(self) -> None:
+        """Reload the versions if any connection committed since the last call."""
+        try:
+            conn = self._connect()
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version == self._data_version:
+                return
+            rows = conn.execute("SELECT table_name, version FROM cache_generations")
+            self._versions = dict(rows.fetchall())
+            self._data_version = data_version
+            self._failing = False
+            self.reloads += 1
+        except sqlite3.Error as e:
+            # Without shared versions, never let an old ETag match
+            if not self._failing:
+                logger.warning(f"Could not read cache generations: {e}")
+            self._failing = True
+            self.close()
+            self._data_version = None
+            self.epoch = secrets.token_hex(4)
+
+    def bump(self, *tables: str) -> None:
+        """Writes are recorded in the database; the next read picks them up."""
+
+    def get(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        self.refresh()
+        return super().get(tables)
+
+    def close(self) -> None:
+        """Close the polling connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def create_table_versions(settings: Settings) -> TableVersions:
+    """Shared versions for SQLite files when configured, local ones otherwise."""
+    if settings.CACHE_INVALIDATION == "shared":
+        url = make_url(settings.DATABASE_URL)
+        if url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:"):
+            return SharedTableVersions(url.database)
+    return TableVersions()
+
+
+table_versions = create_table_versions(settings)
@@ -0,0 +1,277 @@
+import bisect
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LabelValues = Tuple[str, ...]
+
+# Prometheus' default latency buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+# Checkouts normally take microseconds; the upper buckets catch pool exhaustion
+POOL_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Route label of requests that match no route, e.g. 404s
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metric:
+    """A metric family with a fixed set of label names."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, Sequence[str], float]]:
+        """(suffix, label values, extra label pairs, value) of every sample."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, values, extra, value in self.samples():
+            names = self.label_names + tuple(extra[0::2])
+            all_values = tuple(values) + tuple(extra[1::2])
+            lines.append(f"{self.name}{suffix}{_format_labels(names, all_values)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self):
+        for labels, value in sorted(self._values.items()):
+            yield "_total", labels, (), value
+
+
+class Gauge(Metric):
+    """
+    A value that goes up and down.
+
+    With `collect`, the values are read from the callable at scrape time
+    instead of being set, as {label values: value}.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+        self.collect = collect
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self):
+        values = self.collect() if self.collect is not None else self._values
+        for labels, value in sorted(values.items()):
+            yield "", labels, (), value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 2)
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self):
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, observed in zip(self.buckets + (float("inf"),), series):
+                cumulative += observed
+                yield "_bucket", labels, ("le", _format_value(bound)), cumulative
+            yield "_sum", labels, (), series[-1]
+            yield "_count", labels, (), cumulative
+
+
+class MetricsRegistry:
+    """
+    Metrics of this process, rendered in the Prometheus text format.
+
+    Values live in memory and start from zero on every restart; with several
+    workers each one reports its own, which Prometheus sums per instance.
+    Updates happen on the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = (), **kwargs) -> Gauge:
+        return self.register(Gauge(name, documentation, labels, **kwargs))
+
+    def histogram(self, name: str, documentation: str, labels: Sequence[str] = (), **kwargs) -> Histogram:
+        return self.register(Histogram(name, documentation, labels, **kwargs))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    "http_requests", "HTTP requests by route template and status code", ("method", "route", "status")
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "Time to serve an HTTP request", ("method", "route")
+)
+http_requests_in_progress = registry.gauge(
+    "http_requests_in_progress", "HTTP requests being served", ("method",)
+)
+http_response_size = registry.histogram(
+    "http_response_size_bytes", "Size of HTTP response bodies", ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+http_request_errors = registry.counter(
+    "http_request_errors",
+    "HTTP requests answered with a 5xx status or an unhandled exception",
+    ("method", "route", "error"),
+)
+db_pool_checkout = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Time to get a database connection from the pool, including waits",
+    ("engine",),
+    buckets=POOL_WAIT_BUCKETS,
+)
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Path template of the route that served `scope`, e.g. /api/words/{word_id}.
+
+    Call it after the app handled the request: routing fills in the endpoint
+    and path parameters, whose values are put back as placeholders, last
+    parameter first. Included routers only know their own part of the path,
+    so the full path is the reliable source.
+    """
+    if "endpoint" not in scope:
+        return UNMATCHED_ROUTE
+    segments = scope["path"].split("/")
+    end = len(segments)
+    for name, value in reversed(list(scope.get("path_params", {}).items())):
+        for i in range(end - 1, -1, -1):
+            if segments[i] == str(value):
+                segments[i] = "{" + name + "}"
+                end = i
+                break
+    return "/".join(segments)
+
+
+class MetricsMiddleware:
+    """Record latency, size, status and concurrency of every HTTP request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        size = 0
+
+        async def send_and_measure(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        # The route is only known once the request was routed
+        http_requests_in_progress.inc(method)
+        started = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            await self.app(scope, receive, send_and_measure)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            http_requests_in_progress.dec(method)
+            # Labelled by template, so /words/1 and /words/2 share one series
+            labels = (method, route_template(scope))
+            http_request_duration.observe(time.perf_counter() - started, *labels)
+            http_response_size.observe(size, *labels)
+            http_requests.inc(*labels, str(status))
+            if error is None and status >= 500:
+                error = str(status)
+            if error is not None:
+                http_request_errors.inc(*labels, error)
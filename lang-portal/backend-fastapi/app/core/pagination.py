@@ -0,0 +1,136 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, and_, or_, tuple_
+from sqlalchemy.sql import ColumnElement, Select
+
+
+def encode_cursor(sort_by: Optional[str], value: Any, id: int) -> str:
+    """Encode the sort key of the last row of a page into an opaque cursor."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([sort_by, value, id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: Optional[str]) -> Tuple[Any, int]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort field
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        field, value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if field != sort_by:
+        raise ValueError("Cursor does not match the requested sort field")
+    if not isinstance(last_id, int):
+        raise ValueError("Invalid cursor")
+    return value, last_id
+
+
+def next_cursor(
+    items: Sequence[Any],
+    sort_by: Optional[str],
+    limit: int
+) -> Optional[str]:
+    """Build the cursor for the page following `items`, or None on a short page."""
+    if len(items) < limit or not items:
+        return None
+    last = items[-1]
+    value = getattr(last, sort_by) if sort_by else None
+    return encode_cursor(sort_by, value, last.id)
+
+
+def page_count(total: Optional[int], per_page: int) -> Optional[int]:
+    """Number of pages for `total` items, or None when the total was not counted."""
+    if total is None:
+        return None
+    return (total + per_page - 1) // per_page
+
+
+def apply_keyset(
+    query: Select,
+    *,
+    sort_column: Optional[ColumnElement],
+    id_column: ColumnElement,
+    order: Optional[str],
+    value: Any,
+    last_id: int,
+    limit: Optional[int] = None
+) -> Select:
+    """
+    Add a seek predicate that starts `query` right after the row (value, last_id).
+
+    Follows SQLite ordering, where NULLs sort first ascending and last descending.
+    The query must be ordered by (sort_column, id_column) in the same direction.
+    Past a non-NULL value the predicate is the row value comparison
+    (sort_column, id_column) > (value, last_id), which SQLite answers with a
+    seek on the (sort_column, id) index instead of walking it from the start.
+
+    When the rest of the order spans NULL and non-NULL rows of a nullable
+    column, each part is a seek of its own: with `limit`, both take at most
+    `limit` ids from `query` and the page is read from those.
+
+    Raises:
+        ValueError: If the cursor value does not fit the sort column
+    """
+    descending = order == "desc"
+    after_id = id_column < last_id if descending else id_column > last_id
+    if sort_column is None:
+        return query.where(after_id)
+
+    if value is not None and isinstance(getattr(sort_column, "type", None), DateTime):
+        if not isinstance(value, str):
+            raise ValueError("Invalid cursor")
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError("Invalid cursor")
+
+    if value is None:
+        seeks = [and_(sort_column.is_(None), after_id)]
+        if not descending:
+            # Past the NULLs come all the other rows
+            seeks.append(sort_column.is_not(None))
+    else:
+        key = tuple_(sort_column, id_column)
+        bound = tuple_(value, last_id)
+        seeks = [key < bound if descending else key > bound]
+        if descending and getattr(sort_column, "nullable", True):
+            # NULLs follow every value when descending
+            seeks.append(sort_column.is_(None))
+
+    if len(seeks) == 1:
+        return query.where(seeks[0])
+    if limit is None:
+        return query.where(or_(*seeks))
+    order_clauses = keyset_order(sort_column, id_column, order)
+    return query.where(or_(*(
+        id_column.in_(
+            query.with_only_columns(id_column, maintain_column_froms=True)
+            .where(seek)
+            .order_by(*order_clauses)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        for seek in seeks
+    )))
+
+
+def keyset_order(
+    sort_column: Optional[ColumnElement],
+    id_column: ColumnElement,
+    order: Optional[str]
+) -> List[ColumnElement]:
+    """ORDER BY clauses matching `apply_keyset`, with id as the tiebreaker."""
+    columns = [sort_column] if sort_column is not None else []
+    columns.append(id_column)
+    if order == "desc":
+        return [column.desc() for column in columns]
+    return columns
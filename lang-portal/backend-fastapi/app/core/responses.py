@@ -0,0 +1,56 @@
+from typing import Any
+
+import ujson
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+
+def envelope(content: Any) -> Any:
+    """Wrap content in the standard {"data": ..., "error": ...} format.
+
+    Content that already has a "data" or "error" key is treated as wrapped.
+    """
+    if isinstance(content, dict) and ("data" in content or "error" in content):
+        return content
+    return {"data": content, "error": None}
+
+
+class EnvelopeJSONResponse(JSONResponse):
+    """JSON response that applies the standard envelope while rendering.
+
+    The body is encoded exactly once with ujson, so handlers never pay for
+    a decode/re-encode round trip to get wrapped.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return ujson.dumps(
+            envelope(content),
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+        ).encode("utf-8")
+
+
+async def envelope_http_exception_handler(
+    request: Request, exc: StarletteHTTPException
+) -> Response:
+    """Framework HTTP errors (e.g. unknown routes) in the standard format."""
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return EnvelopeJSONResponse(
+        {"detail": exc.detail}, status_code=exc.status_code, headers=headers
+    )
+
+
+async def envelope_validation_exception_handler(
+    request: Request, exc: RequestValidationError
+) -> EnvelopeJSONResponse:
+    """Request validation errors in the standard format."""
+    return EnvelopeJSONResponse(
+        status_code=422,
+        content={"detail": jsonable_encoder(exc.errors())},
+    )
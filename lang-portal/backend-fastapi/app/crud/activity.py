@@ -1,8 +1,8 @@
 from typing import List, Optional, Tuple
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.base import CRUDBase
+from app.crud.base import CountMode, CRUDBase
 from app.models.activity import Activity
 from app.schemas.activity import ActivityCreate, ActivityUpdate
 
@@ -15,23 +15,24 @@ class CRUDActivity(CRUDBase[Activity, ActivityCreate, ActivityUpdate]):
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
-    ) -> Tuple[List[Activity], int]:
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[Activity], Optional[int]]:
         """Get multiple activities with pagination and total count."""
-        # Get total count
-        count_query = select(func.count()).select_from(self.model)
-        total = await db.scalar(count_query)
+        total = await self._total(db, count_mode)
 
         # Build query for items
         query = select(self.model)
         
-        if order_by and hasattr(self.model, order_by):
-            order_column = getattr(self.model, order_by)
-            if order == "desc":
-                order_column = order_column.desc()
-            query = query.order_by(order_column)
-            
-        query = query.offset(skip).limit(limit)
+        query = self._paginate(
+            query,
+            order_by=order_by,
+            order=order,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
+        )
         result = await db.execute(query)
         return result.scalars().all(), total
 
@@ -48,7 +49,7 @@ class CRUDActivity(CRUDBase[Activity, ActivityCreate, ActivityUpdate]):
             description=obj_in.description
         )
         db.add(db_obj)
-        await db.commit()
+        await self._commit(db)
         await db.refresh(db_obj)
         return db_obj
 
@@ -67,7 +68,7 @@ class CRUDActivity(CRUDBase[Activity, ActivityCreate, ActivityUpdate]):
         for field in update_data:
             setattr(db_obj, field, update_data[field])
         
-        await db.commit()
+        await self._commit(db)
         await db.refresh(db_obj)
         return db_obj
 
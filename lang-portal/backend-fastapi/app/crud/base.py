@@ -1,15 +1,24 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Literal, Optional, Tuple, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Select
 
+from app.core.invalidation import record_writes, table_versions
+from app.core.pagination import apply_keyset, decode_cursor, keyset_order
 from app.models.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# How list endpoints compute their total: COUNT(*), a cached count, or not at all
+CountMode = Literal["exact", "estimate", "none"]
+
+# Row counts by table name, with the table ETag they were taken at
+count_cache: Dict[str, Tuple[str, int]] = {}
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
@@ -21,6 +30,19 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
+    async def _commit(self, db: AsyncSession, *tables: str) -> None:
+        """
+        Commit and bump the versions of the model's table and `tables`.
+
+        The shared generations are written in the committing transaction;
+        local versions are bumped only after the commit, so a concurrent
+        read can never cache pre-commit data under the new version.
+        """
+        tables = (self.model.__tablename__, *tables)
+        await record_writes(db, tables)
+        await db.commit()
+        table_versions.bump(*tables)
+
     async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
         """Get a single record by ID."""
         result = await db.execute(select(self.model).filter(self.model.id == id))
@@ -33,27 +55,79 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None
     ) -> List[ModelType]:
         """Get multiple records with pagination and ordering."""
-        query = select(self.model)
-        
-        if order_by and hasattr(self.model, order_by):
-            order_column = getattr(self.model, order_by)
-            if order == "desc":
-                order_column = order_column.desc()
-            query = query.order_by(order_column)
-            
-        query = query.offset(skip).limit(limit)
+        query = self._paginate(
+            select(self.model),
+            order_by=order_by,
+            order=order,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
+        )
         result = await db.execute(query)
         return result.scalars().all()
 
+    def _sort_column(self, order_by: Optional[str]) -> Optional[ColumnElement]:
+        """Resolve a sort field name to a model column, if it exists."""
+        if order_by and hasattr(self.model, order_by):
+            return getattr(self.model, order_by)
+        return None
+
+    def _paginate(
+        self,
+        query: Select,
+        *,
+        order_by: Optional[str],
+        order: Optional[str],
+        skip: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort_column: Optional[ColumnElement] = None,
+        id_column: Optional[ColumnElement] = None
+    ) -> Select:
+        """
+        Order and limit a query, using OFFSET or a keyset cursor.
+
+        Rows are always ordered by (sort column, id) so that pages are stable.
+        `id_column` replaces the model's id as tie-breaker, for sort columns
+        of a joined table that are indexed together with its copy of the id.
+        When `cursor` is given, `skip` is ignored and the query seeks directly
+        past the last row of the previous page instead of scanning over it.
+
+        Raises:
+            ValueError: If the cursor is invalid or belongs to another sort field
+        """
+        if sort_column is None:
+            sort_column = self._sort_column(order_by)
+            if sort_column is None:
+                order_by = None
+        if id_column is None:
+            id_column = self.model.id
+        if cursor:
+            value, last_id = decode_cursor(cursor, order_by)
+            query = apply_keyset(
+                query,
+                sort_column=sort_column,
+                id_column=id_column,
+                order=order,
+                value=value,
+                last_id=last_id,
+                limit=limit
+            )
+        else:
+            query = query.offset(skip)
+        query = query.order_by(*keyset_order(sort_column, id_column, order))
+        return query.limit(limit)
+
     async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
         """Create a new record."""
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
-        await db.commit()
+        await self._commit(db)
         await db.refresh(db_obj)
         return db_obj
 
@@ -74,7 +148,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if field in update_data:
                 setattr(db_obj, field, update_data[field])
         db.add(db_obj)
-        await db.commit()
+        await self._commit(db)
         await db.refresh(db_obj)
         return db_obj
 
@@ -84,10 +158,33 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj = obj.scalar_one_or_none()
         if obj:
             await db.delete(obj)
-            await db.commit()
+            await self._commit(db)
         return obj
 
     async def count(self, db: AsyncSession) -> int:
         """Get total count of records."""
-        result = await db.execute(select(self.model))
-        return len(result.scalars().all()) 
\ No newline at end of file
+        return await db.scalar(select(func.count()).select_from(self.model))
+
+    async def count_estimate(self, db: AsyncSession) -> int:
+        """
+        Get the count of records, cached until the table is next written.
+
+        Exact within this process; with local cache invalidation, writes
+        made by other workers are only seen after the next local write.
+        """
+        tablename = self.model.__tablename__
+        etag = table_versions.etag([tablename])
+        cached = count_cache.get(tablename)
+        if cached is not None and cached[0] == etag:
+            return cached[1]
+        total = await self.count(db)
+        count_cache[tablename] = (etag, total)
+        return total
+
+    async def _total(self, db: AsyncSession, count_mode: CountMode) -> Optional[int]:
+        """Total for a list of all records, or None when not requested."""
+        if count_mode == "none":
+            return None
+        if count_mode == "estimate":
+            return await self.count_estimate(db)
+        return await self.count(db)
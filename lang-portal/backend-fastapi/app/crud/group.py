@@ -1,12 +1,13 @@
-from typing import List, Optional, Tuple, Union, Dict, Any
-from sqlalchemy import func, select
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from sqlalchemy import Text, delete, func, insert, select, type_coerce, update
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.base import CRUDBase
+from app.crud.base import CountMode, CRUDBase
 from app.models.group import Group
 from app.models.word import Word
 from app.models.word_group import WordGroup
+from app.models.word_stats import WordStats
 from app.schemas.group import GroupCreate, GroupUpdate
 
 
@@ -23,7 +24,7 @@ class CRUDGroup(CRUDBase[Group, GroupCreate, GroupUpdate]):
         if obj_in.word_ids:
             await self.add_words(db, group_id=db_obj.id, word_ids=obj_in.word_ids)
 
-        await db.commit()
+        await self._commit(db, "word_groups")
         await db.refresh(db_obj)
         return db_obj
 
@@ -34,23 +35,24 @@ class CRUDGroup(CRUDBase[Group, GroupCreate, GroupUpdate]):
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
-    ) -> Tuple[List[Group], int]:
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[Group], Optional[int]]:
         """Get multiple groups with pagination and total count."""
-        # Get total count
-        count_query = select(func.count()).select_from(self.model)
-        total = await db.scalar(count_query)
+        total = await self._total(db, count_mode)
 
         # Build query for items
         query = select(self.model)
         
-        if order_by and hasattr(self.model, order_by):
-            order_column = getattr(self.model, order_by)
-            if order == "desc":
-                order_column = order_column.desc()
-            query = query.order_by(order_column)
-            
-        query = query.offset(skip).limit(limit)
+        query = self._paginate(
+            query,
+            order_by=order_by,
+            order=order,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
+        )
         result = await db.execute(query)
         return result.scalars().all(), total
 
@@ -62,16 +64,22 @@ class CRUDGroup(CRUDBase[Group, GroupCreate, GroupUpdate]):
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
-    ) -> Tuple[List[Word], int]:
+        order: Optional[str] = "asc",
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[Word], Optional[int]]:
         """Get paginated words for a specific group."""
-        # Get total count
-        count_query = (
-            select(func.count(Word.id))
-            .join(WordGroup)
-            .filter(WordGroup.group_id == group_id)
-        )
-        total = await db.scalar(count_query)
+        total = None
+        if count_mode == "exact":
+            total = await db.scalar(
+                select(func.count(Word.id))
+                .join(WordGroup)
+                .filter(WordGroup.group_id == group_id)
+            )
+        elif count_mode == "estimate":
+            # The maintained counter saves the join over word_groups
+            total = await db.scalar(
+                select(self.model.words_count).filter(self.model.id == group_id)
+            )
 
         # Build query for words
         query = (
@@ -91,6 +99,76 @@ class CRUDGroup(CRUDBase[Group, GroupCreate, GroupUpdate]):
         result = await db.execute(query)
         return result.scalars().all(), total
 
+    async def get_pack_rows(
+        self,
+        db: AsyncSession,
+        *,
+        group_id: int
+    ) -> List[Tuple[int, str, str, str, str]]:
+        """
+        Get (id, kanji, romaji, english, parts JSON text) of every word in a group.
+
+        Rows are in position order and are read as plain tuples, without
+        building Word objects or decoding parts, so whole groups load quickly.
+        """
+        result = await db.execute(
+            select(
+                Word.id,
+                Word.kanji,
+                Word.romaji,
+                Word.english,
+                type_coerce(Word.parts, Text)
+            )
+            .join(WordGroup, WordGroup.word_id == Word.id)
+            .where(WordGroup.group_id == group_id)
+            .order_by(WordGroup.position, WordGroup.word_id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def get_position_count(self, db: AsyncSession, *, group_id: int) -> int:
+        """
+        Number of positions in a group: members are at 0..count-1.
+
+        Read from the end of idx_word_groups_position, so it costs the
+        same for any group size.
+        """
+        last = await db.scalar(
+            select(func.max(WordGroup.position)).where(WordGroup.group_id == group_id)
+        )
+        return 0 if last is None else last + 1
+
+    async def get_members_at(
+        self,
+        db: AsyncSession,
+        *,
+        group_id: int,
+        positions: Iterable[int]
+    ) -> Dict[int, Tuple[int, int, int]]:
+        """
+        Look up the members at some positions of a group, with review statistics.
+
+        Returns:
+            Dict of position to (word_id, correct_count, wrong_count);
+            positions without a member are left out
+        """
+        positions = list(positions)
+        if not positions:
+            return {}
+        result = await db.execute(
+            select(
+                WordGroup.position,
+                WordGroup.word_id,
+                func.coalesce(WordStats.correct_count, 0),
+                func.coalesce(WordStats.wrong_count, 0)
+            )
+            .outerjoin(WordStats, WordStats.word_id == WordGroup.word_id)
+            .where(WordGroup.group_id == group_id, WordGroup.position.in_(positions))
+        )
+        return {
+            position: (word_id, correct_count, wrong_count)
+            for position, word_id, correct_count, wrong_count in result.all()
+        }
+
     async def add_words(
         self,
         db,
@@ -98,29 +176,22 @@ class CRUDGroup(CRUDBase[Group, GroupCreate, GroupUpdate]):
         group_id: int,
         word_ids: List[int]
     ) -> Group:
-        """Add words to a group."""
+        """
+        Add words to a group with one bulk insert.
+
+        words_count is updated by the word_groups triggers. Raises
+        IntegrityError if a word is already in the group.
+        """
         # Get the group
         db_group = await self.get(db, group_id)
         if not db_group:
             return None
 
-        # Create word_group relationships
-        for word_id in word_ids:
-            word_group = WordGroup(group_id=group_id, word_id=word_id)
-            db.add(word_group)
-        
-        await db.flush()
-        
-        # Update words_count
-        count_query = (
-            select(func.count(WordGroup.word_id))
-            .filter(WordGroup.group_id == group_id)
-        )
-        count = await db.scalar(count_query)
-        db_group.words_count = count
+        added = list(dict.fromkeys(word_ids))
+        await self._insert_memberships(db, group_id=group_id, word_ids=added)
         
         # Commit all changes
-        await db.commit()
+        await self._commit(db, "word_groups")
         await db.refresh(db_group)
         
         return db_group
@@ -131,46 +202,98 @@ class CRUDGroup(CRUDBase[Group, GroupCreate, GroupUpdate]):
         *,
         group_id: int,
         word_ids: List[int]
-    ) -> None:
-        """Replace all words in a group with a new list."""
+    ) -> Optional[Group]:
+        """
+        Replace all words in a group with a new list.
+
+        Only the difference is written: memberships that are no longer
+        wanted are deleted and new ones inserted, each in one statement.
+        words_count follows through the word_groups triggers.
+        """
         # Get the group
         db_group = await self.get(db, group_id)
         if not db_group:
             return None
 
-        # Remove existing relationships
-        delete_query = (
-            WordGroup.__table__.delete()
-            .where(WordGroup.group_id == group_id)
-        )
-        await db.execute(delete_query)
-        
-        # Add new relationships
-        for word_id in word_ids:
-            word_group = WordGroup(group_id=group_id, word_id=word_id)
-            db.add(word_group)
-        
-        await db.flush()
-        
-        # Update words_count directly on the model
-        count_query = (
-            select(func.count(WordGroup.word_id))
-            .filter(WordGroup.group_id == group_id)
+        result = await db.execute(
+            select(WordGroup.word_id).filter(WordGroup.group_id == group_id)
         )
-        count = await db.scalar(count_query)
-        db_group.words_count = count
+        current = set(result.scalars().all())
+        wanted = set(word_ids)
+        removed = current - wanted
+        added = [word_id for word_id in dict.fromkeys(word_ids) if word_id not in current]
+
+        if removed:
+            await db.execute(
+                delete(WordGroup).where(
+                    WordGroup.group_id == group_id,
+                    WordGroup.word_id.in_(removed)
+                )
+            )
+        await self._insert_memberships(db, group_id=group_id, word_ids=added)
         
         # Commit all changes
-        await db.commit()
+        await self._commit(db, "word_groups")
         await db.refresh(db_group)
         
         return db_group
 
-    async def _update_words_count(self, db, group_id: int) -> None:
-        """Update the words_count for a group."""
-        # This method is no longer needed as we update the count directly
-        # in add_words and set_words
-        pass
+    async def _insert_memberships(
+        self,
+        db: AsyncSession,
+        *,
+        group_id: int,
+        word_ids: List[int]
+    ) -> None:
+        """Insert word_groups rows for `word_ids` in one executemany."""
+        if word_ids:
+            await db.execute(
+                insert(WordGroup),
+                [{"group_id": group_id, "word_id": word_id} for word_id in word_ids]
+            )
+
+    def _actual_words_count(self):
+        """Correlated COUNT(*) of a group's memberships."""
+        return (
+            select(func.count())
+            .select_from(WordGroup)
+            .where(WordGroup.group_id == self.model.id)
+            .scalar_subquery()
+        )
+
+    async def find_words_count_drift(
+        self,
+        db: AsyncSession
+    ) -> List[Tuple[int, Optional[int], int]]:
+        """
+        Find groups whose stored words_count disagrees with word_groups.
+
+        Returns:
+            List of (group_id, stored count, actual count)
+        """
+        actual = self._actual_words_count()
+        result = await db.execute(
+            select(self.model.id, self.model.words_count, actual)
+            .where(self.model.words_count.is_distinct_from(actual))
+            .order_by(self.model.id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def repair_words_counts(self, db: AsyncSession) -> int:
+        """
+        Recount words_count of every drifted group and commit.
+
+        Returns the number of groups that were corrected.
+        """
+        actual = self._actual_words_count()
+        result = await db.execute(
+            update(self.model)
+            .where(self.model.words_count.is_distinct_from(actual))
+            .values(words_count=actual)
+            .execution_options(synchronize_session=False)
+        )
+        await self._commit(db)
+        return result.rowcount
 
     async def update(
         self,
@@ -201,7 +324,7 @@ class CRUDGroup(CRUDBase[Group, GroupCreate, GroupUpdate]):
             await self.set_words(db, group_id=id, word_ids=word_ids)
 
         db.add(db_obj)
-        await db.commit()
+        await self._commit(db, "word_groups")
         await db.refresh(db_obj)
         return db_obj
 
@@ -217,7 +340,7 @@ class CRUDGroup(CRUDBase[Group, GroupCreate, GroupUpdate]):
             return None
             
         await db.delete(obj)
-        await db.commit()
+        await self._commit(db, "word_groups")
         return obj
 
 
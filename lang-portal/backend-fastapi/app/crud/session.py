@@ -1,9 +1,13 @@
-from typing import List, Optional, Dict, Tuple
-from sqlalchemy import func, select, Integer, case
+from datetime import datetime
+from typing import Iterable, List, Optional, Dict, Tuple
+from sqlalchemy import func, insert, select, Integer, case
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.base import CRUDBase
+from app.core.pagination import apply_keyset, decode_cursor
+from app.crud.base import CountMode, CRUDBase
+from app.crud.word_schedule import word_schedule
+from app.crud.word_stats import word_stats
 from app.models.session import Session
 from app.models.word_review_item import WordReviewItem
 from app.schemas.session import (
@@ -22,22 +26,22 @@ class CRUDSession(CRUDBase[Session, SessionCreate, SessionUpdate]):
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
-    ) -> Tuple[List[Session], int]:
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[Session], Optional[int]]:
         """Get multiple sessions with pagination and total count."""
-        # Get total count
-        count_query = select(func.count()).select_from(self.model)
-        total = await db.scalar(count_query)
+        total = await self._total(db, count_mode)
 
         # Get items with pagination
-        query = select(self.model)
-        if order_by and hasattr(self.model, order_by):
-            order_column = getattr(self.model, order_by)
-            if order == "desc":
-                order_column = order_column.desc()
-            query = query.order_by(order_column)
-        
-        query = query.offset(skip).limit(limit)
+        query = self._paginate(
+            select(self.model),
+            order_by=order_by,
+            order=order,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
+        )
         result = await db.execute(query)
         items = result.scalars().all()
         
@@ -50,26 +54,26 @@ class CRUDSession(CRUDBase[Session, SessionCreate, SessionUpdate]):
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
-    ) -> Tuple[List[Session], int]:
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[Session], Optional[int]]:
         """Get multiple sessions with their reviews."""
-        # Get total count
-        count_query = select(func.count()).select_from(self.model)
-        total = await db.scalar(count_query)
+        total = await self._total(db, count_mode)
 
         # Build main query with reviews
         query = (
             select(self.model)
             .options(selectinload(self.model.reviews))
         )
-        
-        if order_by:
-            column = getattr(self.model, order_by)
-            if order == "desc":
-                column = column.desc()
-            query = query.order_by(column)
-            
-        query = query.offset(skip).limit(limit)
+        query = self._paginate(
+            query,
+            order_by=order_by,
+            order=order,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
+        )
         
         result = await db.execute(query)
         sessions = result.scalars().all()
@@ -90,6 +94,45 @@ class CRUDSession(CRUDBase[Session, SessionCreate, SessionUpdate]):
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_reviews(
+        self,
+        db: AsyncSession,
+        session_id: int,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[WordReviewItem], int]:
+        """
+        Get one page of a session's reviews in the order they were logged.
+
+        Returns:
+            Tuple of (reviews, total number of reviews of the session)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        in_session = WordReviewItem.session_id == session_id
+        total = await db.scalar(
+            select(func.count()).select_from(WordReviewItem).where(in_session)
+        )
+
+        query = select(WordReviewItem).where(in_session)
+        if cursor:
+            _, last_id = decode_cursor(cursor, None)
+            query = apply_keyset(
+                query,
+                sort_column=None,
+                id_column=WordReviewItem.id,
+                order="asc",
+                value=None,
+                last_id=last_id
+            )
+        else:
+            query = query.offset(skip)
+        result = await db.execute(query.order_by(WordReviewItem.id).limit(limit))
+        return list(result.scalars().all()), total
+
     async def create_word_review(
         self,
         db: AsyncSession,
@@ -106,41 +149,118 @@ class CRUDSession(CRUDBase[Session, SessionCreate, SessionUpdate]):
             correct=review.correct
         )
         db.add(db_review)
-        await db.commit()
+        await db.flush()
+
+        # Keep the per-word rollup and schedule in the same transaction as the review
+        reviewed = [(db_review.word_id, db_review.correct, db_review.created_at)]
+        await word_stats.record_reviews(db, reviewed)
+        await word_schedule.record_reviews(db, reviewed)
+        await self._commit(db, "word_review_items", "word_stats", "word_schedule")
         await db.refresh(db_review)
         return db_review
 
-    async def get_session_statistics(
+    async def create_word_reviews(
         self,
         db: AsyncSession,
-        session_id: int
-    ) -> Optional[SessionStats]:
-        """Get statistics for a session."""
-        # Verify session exists
-        session = await self.get(db, session_id)
-        if not session:
-            return None
-
-        # Get review stats
-        stats_query = (
+        *,
+        session_id: int,
+        reviews: List[Tuple[int, bool]]
+    ) -> List[Dict]:
+        """
+        Insert many (word_id, correct) reviews for a session in one transaction.
+
+        All rows go through a single executemany INSERT, and the word_stats
+        rollup and word schedules are updated before the one commit. Returns
+        the inserted rows in the same order as `reviews`.
+        """
+        created_at = datetime.utcnow()
+        return await self.insert_reviews(
+            db,
+            [
+                {
+                    "session_id": session_id,
+                    "word_id": word_id,
+                    "correct": correct,
+                    "created_at": created_at
+                }
+                for word_id, correct in reviews
+            ]
+        )
+
+    async def insert_reviews(
+        self,
+        db: AsyncSession,
+        rows: List[Dict]
+    ) -> List[Dict]:
+        """
+        Insert review rows of any number of sessions and commit once.
+
+        Each row has session_id, word_id, correct and created_at. The rows
+        are inserted with one executemany and folded into word_stats and
+        word_schedule in the same transaction. Each row gets its new "id";
+        returns `rows`.
+        """
+        if not rows:
+            return []
+
+        result = await db.execute(
+            insert(WordReviewItem).returning(
+                WordReviewItem.id, sort_by_parameter_order=True
+            ),
+            rows
+        )
+        for row, review_id in zip(rows, result.scalars().all()):
+            row["id"] = review_id
+
+        reviewed = [(row["word_id"], row["correct"], row["created_at"]) for row in rows]
+        await word_stats.record_reviews(db, reviewed)
+        await word_schedule.record_reviews(db, reviewed)
+        await self._commit(db, "word_review_items", "word_stats", "word_schedule")
+        return rows
+
+    async def get_statistics_many(
+        self,
+        db: AsyncSession,
+        session_ids: Iterable[int]
+    ) -> Dict[int, SessionStats]:
+        """
+        Get review statistics of many sessions in one grouped query.
+
+        Sessions without reviews get zeroed statistics; IDs of sessions that
+        do not exist are left out of the result.
+        """
+        ids = list(dict.fromkeys(session_ids))
+        if not ids:
+            return {}
+
+        query = (
             select(
-                func.count().label("total_reviews"),
+                self.model.id,
+                func.count(WordReviewItem.id).label("total_reviews"),
                 func.sum(func.cast(WordReviewItem.correct, Integer)).label("correct_reviews")
             )
-            .where(WordReviewItem.session_id == session_id)
-        )
-        result = await db.execute(stats_query)
-        row = result.one()
-        
-        total = row.total_reviews or 0
-        correct = row.correct_reviews or 0
-        accuracy = (correct / total) if total > 0 else 0.0
-
-        return SessionStats(
-            total_reviews=total,
-            correct_reviews=correct,
-            accuracy=accuracy
+            .outerjoin(WordReviewItem, WordReviewItem.session_id == self.model.id)
+            .where(self.model.id.in_(ids))
+            .group_by(self.model.id)
         )
+        result = await db.execute(query)
+        stats = {}
+        for session_id, total, correct in result.all():
+            correct = correct or 0
+            stats[session_id] = SessionStats(
+                total_reviews=total,
+                correct_reviews=correct,
+                accuracy=(correct / total) if total > 0 else 0.0
+            )
+        return stats
 
+    async def get_session_statistics(
+        self,
+        db: AsyncSession,
+        session_id: int
+    ) -> Optional[SessionStats]:
+        """Get statistics for a session, or None if it doesn't exist."""
+        stats = await self.get_statistics_many(db, [session_id])
+        return stats.get(session_id)
 
 session = CRUDSession(Session) 
\ No newline at end of file
@@ -1,15 +1,317 @@
-from typing import List, Optional, Tuple
-from sqlalchemy import func, select, case, literal_column
-from sqlalchemy.orm import selectinload
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, distinct, func, insert, literal, literal_column, select
+from sqlalchemy.orm import aliased, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.base import CRUDBase
-from app.models.word import Word
-from app.models.word_review_item import WordReviewItem
+from app.crud.base import CountMode, CRUDBase
+from app.models.word import Word, words_fts
+from app.models.word_group import WordGroup
+from app.models.word_part import WordPart
+from app.models.word_stats import WordStats
 from app.schemas.word import WordCreate, WordUpdate
 
+# CJK ideographs, including extension A and compatibility ideographs
+KANJI_PATTERN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]")
+
+# bm25 column weights: kanji, romaji, english, parts_kanji
+SEARCH_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+SEARCH_RANK = f"bm25({', '.join(map(str, SEARCH_WEIGHTS))})"
+
+
+def search_document(word: Word) -> Dict[str, Any]:
+    """Build the words_fts row of a word."""
+    parts_kanji: List[str] = []
+    for part in word.parts or []:
+        for char in KANJI_PATTERN.findall(str(part.get("kanji", ""))):
+            if char not in parts_kanji:
+                parts_kanji.append(char)
+    return {
+        "rowid": word.id,
+        "kanji": word.kanji,
+        "romaji": word.romaji,
+        "english": word.english,
+        # Space separated so each character is its own token
+        "parts_kanji": " ".join(parts_kanji),
+    }
+
+
+def component_rows(word: Word) -> List[Dict[str, Any]]:
+    """Build the word_parts rows of a word: one per part that contains kanji."""
+    rows = []
+    for position, part in enumerate(word.parts or []):
+        component = str(part.get("kanji", ""))
+        if not KANJI_PATTERN.search(component):
+            continue
+        romaji = part.get("romaji", [])
+        rows.append({
+            "word_id": word.id,
+            "position": position,
+            "component": component,
+            # A part's romaji lists its syllables, e.g. ["ha", "ra"] for 払
+            "reading": "".join(romaji) if isinstance(romaji, list) else str(romaji),
+        })
+    return rows
+
+
+def build_match_query(q: str) -> Optional[str]:
+    """
+    Turn user input into an FTS5 query where every term is a prefix.
+
+    Terms are quoted so FTS5 operators in the input are matched literally.
+    Returns None when the input has no searchable characters.
+    """
+    terms = [term for term in re.split(r"[\W_]+", q) if term]
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
 
 class CRUDWord(CRUDBase[Word, WordCreate, WordUpdate]):
+    async def create(self, db: AsyncSession, *, obj_in: WordCreate) -> Word:
+        """Create a word and add it to the search and component indexes."""
+        db_obj = self.model(**jsonable_encoder(obj_in))
+        db.add(db_obj)
+        await db.flush()  # Flush to get the ID
+        await self.index_words(db, [db_obj])
+        await self._commit(db)
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: Word,
+        obj_in: Union[WordUpdate, Dict[str, Any]]
+    ) -> Word:
+        """Update a word and refresh its search and component index entries."""
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.dict(exclude_unset=True)
+        for field in jsonable_encoder(db_obj):
+            if field in update_data:
+                setattr(db_obj, field, update_data[field])
+        db.add(db_obj)
+        await db.flush()
+        await self.index_words(db, [db_obj])
+        await self._commit(db)
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: int) -> Optional[Word]:
+        """Delete a word and its search and component index entries."""
+        obj = await db.execute(select(self.model).filter(self.model.id == id))
+        obj = obj.scalar_one_or_none()
+        if obj:
+            await db.delete(obj)
+            await db.execute(delete(words_fts).where(words_fts.c.rowid == id))
+            # The word_groups triggers decrement the counts of its groups
+            await self._commit(db, "word_groups", "groups", "word_review_items", "word_stats")
+        return obj
+
+    async def index_words(self, db: AsyncSession, words: Iterable[Word]) -> None:
+        """Replace the search and component index entries of `words`. Does not commit."""
+        words = list(words)
+        if not words:
+            return
+        word_ids = [w.id for w in words]
+        await db.execute(delete(words_fts).where(words_fts.c.rowid.in_(word_ids)))
+        await db.execute(insert(words_fts), [search_document(w) for w in words])
+
+        await db.execute(delete(WordPart).where(WordPart.word_id.in_(word_ids)))
+        components = [row for w in words for row in component_rows(w)]
+        if components:
+            await db.execute(insert(WordPart), components)
+
+    async def rebuild_search_index(self, db: AsyncSession) -> int:
+        """
+        Re-index every word for search and by component, and commit.
+
+        Returns the number of words indexed.
+        """
+        await db.execute(delete(words_fts))
+        await db.execute(delete(WordPart))
+        result = await db.execute(select(self.model))
+        words = result.scalars().all()
+        await self.index_words(db, words)
+        await self._commit(db)
+        return len(words)
+
+    async def search(
+        self,
+        db: AsyncSession,
+        *,
+        q: str,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Word], int]:
+        """
+        Search words by prefix over kanji, romaji, english and part kanji.
+
+        Results are ranked by bm25, with kanji and romaji matches weighted
+        above English ones, and carry their review statistics. FTS5 ranks
+        every match and keeps only the top skip + limit, so the words table
+        is read for one page; `total` is the exact number of matches.
+        """
+        match = build_match_query(q)
+        if match is None:
+            return [], 0
+        matches = literal_column("words_fts").op("MATCH")(match)
+
+        total = await db.scalar(select(func.count()).select_from(words_fts).where(matches))
+        if not total:
+            return [], 0
+
+        # The hidden rank column, computed by the bm25 call it is matched against
+        rank = literal_column("rank")
+        page = (
+            select(words_fts.c.rowid.label("word_id"), rank.label("rank"))
+            .where(matches, rank.op("MATCH")(SEARCH_RANK))
+            .order_by(rank, words_fts.c.rowid)
+            .offset(skip)
+            .limit(limit)
+            .subquery()
+        )
+        query = (
+            select(
+                self.model,
+                func.coalesce(WordStats.correct_count, 0),
+                func.coalesce(WordStats.wrong_count, 0)
+            )
+            .join(page, page.c.word_id == self.model.id)
+            .outerjoin(WordStats, self.model.id == WordStats.word_id)
+            .order_by(page.c.rank, page.c.word_id)
+        )
+        result = await db.execute(query)
+
+        words = []
+        for word, correct_count, wrong_count in result.all():
+            word.correct_count = correct_count
+            word.wrong_count = wrong_count
+            words.append(word)
+        return words, total
+
+    async def get_by_component(
+        self,
+        db: AsyncSession,
+        *,
+        component: str,
+        reading: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Word], int]:
+        """
+        Get words with `component` among their parts, by ID, with review statistics.
+
+        When `reading` is given only parts read that way match, e.g. 行 as
+        "i" in 行く but not as "kou" in 銀行. Answered from the word_parts
+        index.
+        """
+        matches = select(WordPart.word_id).where(WordPart.component == component)
+        if reading is not None:
+            matches = matches.where(WordPart.reading == reading)
+        matches = matches.distinct()
+
+        total = await db.scalar(select(func.count()).select_from(matches.subquery()))
+        if not total:
+            return [], 0
+
+        page = (
+            matches.order_by(WordPart.word_id)
+            .offset(skip)
+            .limit(limit)
+            .subquery()
+        )
+        query = (
+            select(
+                self.model,
+                func.coalesce(WordStats.correct_count, 0),
+                func.coalesce(WordStats.wrong_count, 0)
+            )
+            .join(page, page.c.word_id == self.model.id)
+            .outerjoin(WordStats, self.model.id == WordStats.word_id)
+            .order_by(self.model.id)
+        )
+        result = await db.execute(query)
+
+        words = []
+        for db_word, correct_count, wrong_count in result.all():
+            db_word.correct_count = correct_count
+            db_word.wrong_count = wrong_count
+            words.append(db_word)
+        return words, total
+
+    async def get_related(
+        self,
+        db: AsyncSession,
+        *,
+        word_id: int,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Tuple[Word, List[str]]], int]:
+        """
+        Get words sharing kanji components with a word, most shared first.
+
+        Only the word_parts index is read to find and rank them: the
+        word's components by its primary key, the words having them by
+        the component index.
+
+        Returns:
+            Tuple of (list of (word, shared components in the order of the
+            word's parts), total related words)
+        """
+        other = aliased(WordPart)
+        own_components = select(WordPart.component).where(WordPart.word_id == word_id)
+        shared = func.count(distinct(other.component))
+        related = (
+            select(
+                other.word_id,
+                shared.label("shared"),
+                func.group_concat(distinct(other.component)).label("components")
+            )
+            .where(other.component.in_(own_components), other.word_id != word_id)
+            .group_by(other.word_id)
+        )
+
+        total = await db.scalar(select(func.count()).select_from(related.subquery()))
+        if not total:
+            return [], 0
+
+        page = (
+            related.order_by(shared.desc(), other.word_id)
+            .offset(skip)
+            .limit(limit)
+            .subquery()
+        )
+        query = (
+            select(
+                self.model,
+                func.coalesce(WordStats.correct_count, 0),
+                func.coalesce(WordStats.wrong_count, 0),
+                page.c.components
+            )
+            .join(page, page.c.word_id == self.model.id)
+            .outerjoin(WordStats, self.model.id == WordStats.word_id)
+            .order_by(page.c.shared.desc(), page.c.word_id)
+        )
+        result = await db.execute(query)
+
+        # List shared components in the order they appear in the word
+        order = await db.execute(own_components.order_by(WordPart.position))
+        position: Dict[str, int] = {}
+        for component in order.scalars():
+            position.setdefault(component, len(position))
+        words = []
+        for db_word, correct_count, wrong_count, components in result.all():
+            db_word.correct_count = correct_count
+            db_word.wrong_count = wrong_count
+            words.append((db_word, sorted(components.split(","), key=position.__getitem__)))
+        return words, total
+
     async def get_with_groups(self, db: AsyncSession, *, word_id: int) -> Optional[Word]:
         """Get a word with its associated groups."""
         query = (
@@ -20,6 +322,88 @@ class CRUDWord(CRUDBase[Word, WordCreate, WordUpdate]):
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_missing_ids(
+        self,
+        db: AsyncSession,
+        word_ids: Iterable[int]
+    ) -> List[int]:
+        """Return the IDs in `word_ids` that have no word, using one IN query."""
+        word_ids = set(word_ids)
+        if not word_ids:
+            return []
+        result = await db.execute(
+            select(self.model.id).filter(self.model.id.in_(word_ids))
+        )
+        return sorted(word_ids - set(result.scalars().all()))
+
+    async def get_group_membership(
+        self,
+        db: AsyncSession,
+        *,
+        word_ids: Iterable[int],
+        group_id: Optional[int]
+    ) -> Dict[int, bool]:
+        """
+        Check many words against a group with one set-based query.
+
+        Returns a mapping of every existing word ID to whether it belongs to
+        `group_id`. Missing words are absent from the mapping. When
+        `group_id` is None every existing word counts as a member.
+        """
+        word_ids = set(word_ids)
+        if not word_ids:
+            return {}
+
+        if group_id is None:
+            query = select(self.model.id, literal(True)).filter(self.model.id.in_(word_ids))
+        else:
+            query = (
+                select(self.model.id, WordGroup.group_id.is_not(None))
+                .outerjoin(
+                    WordGroup,
+                    (WordGroup.word_id == self.model.id)
+                    & (WordGroup.group_id == group_id)
+                )
+                .filter(self.model.id.in_(word_ids))
+            )
+        result = await db.execute(query)
+        return {word_id: bool(in_group) for word_id, in_group in result.all()}
+
+    async def get_readings(
+        self,
+        db: AsyncSession,
+        word_ids: Iterable[int]
+    ) -> Dict[int, Tuple[List[Dict], str]]:
+        """Get the parts and romaji of words by ID, for compiling answer matchers."""
+        ids = list(dict.fromkeys(word_ids))
+        if not ids:
+            return {}
+        result = await db.execute(
+            select(self.model.id, self.model.parts, self.model.romaji)
+            .where(self.model.id.in_(ids))
+        )
+        return {word_id: (parts, romaji) for word_id, parts, romaji in result.all()}
+
+    async def get_many_with_stats(self, db: AsyncSession, word_ids: List[int]) -> List[Word]:
+        """Get words by ID with their review statistics, in the order of `word_ids`."""
+        if not word_ids:
+            return []
+        result = await db.execute(
+            select(
+                self.model,
+                func.coalesce(WordStats.correct_count, 0),
+                func.coalesce(WordStats.wrong_count, 0)
+            )
+            .outerjoin(WordStats, self.model.id == WordStats.word_id)
+            .where(self.model.id.in_(word_ids))
+        )
+        found = {}
+        for db_word, correct_count, wrong_count in result.all():
+            db_word.correct_count = correct_count
+            db_word.wrong_count = wrong_count
+            found[db_word.id] = db_word
+        return [found[word_id] for word_id in word_ids if word_id in found]
+
     async def get_multi_with_stats(
         self,
         db,
@@ -27,53 +411,44 @@ class CRUDWord(CRUDBase[Word, WordCreate, WordUpdate]):
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
-    ) -> Tuple[List[Word], int]:
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[Word], Optional[int]]:
         """Get multiple words with their review statistics."""
-        # Get total count
-        count_query = select(func.count()).select_from(self.model)
-        total = await db.scalar(count_query)
+        total = await self._total(db, count_mode)
 
-        # Subquery to compute review statistics
-        review_stats = (
-            select(
-                WordReviewItem.word_id,
-                func.count(case((WordReviewItem.correct == True, 1))).label("correct_count"),
-                func.count(case((WordReviewItem.correct == False, 1))).label("wrong_count")
-            )
-            .group_by(WordReviewItem.word_id)
-            .subquery()
+        # Review statistics come from the word_stats rollup, so the cost of
+        # this query does not depend on the size of the review history
+        correct_count = func.coalesce(WordStats.correct_count, 0)
+        wrong_count = func.coalesce(WordStats.wrong_count, 0)
+        query = select(
+            self.model,
+            correct_count.label("correct_count"),
+            wrong_count.label("wrong_count")
         )
 
-        # Build main query with computed fields
-        query = (
-            select(
-                self.model,
-                func.coalesce(review_stats.c.correct_count, 0).label("correct_count"),
-                func.coalesce(review_stats.c.wrong_count, 0).label("wrong_count")
-            )
-            .outerjoin(
-                review_stats,
-                self.model.id == review_stats.c.word_id
-            )
+        sort_column = id_column = None
+        if order_by in ("correct_count", "wrong_count"):
+            # Every word has a word_stats row, so the join drops none and the
+            # page is read in order from the (count, word_id) index
+            sort_column = getattr(WordStats, order_by)
+            id_column = WordStats.word_id
+            query = query.join(WordStats, self.model.id == WordStats.word_id)
+        else:
+            query = query.outerjoin(WordStats, self.model.id == WordStats.word_id)
+
+        query = self._paginate(
+            query,
+            order_by=order_by,
+            order=order,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            sort_column=sort_column,
+            id_column=id_column
         )
         
-        if order_by:
-            if order_by in ["correct_count", "wrong_count"]:
-                # Use the computed stats for sorting
-                column = func.coalesce(getattr(review_stats.c, order_by), 0)
-                if order == "desc":
-                    column = column.desc()
-                query = query.order_by(column)
-            else:
-                # Handle direct model fields
-                column = getattr(self.model, order_by)
-                if order == "desc":
-                    column = column.desc()
-                query = query.order_by(column)
-            
-        query = query.offset(skip).limit(limit)
-        
         result = await db.execute(query)
         rows = result.all()
         
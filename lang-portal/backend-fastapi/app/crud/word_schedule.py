@@ -0,0 +1,215 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from sqlalchemy import Connection, delete, func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.invalidation import record_writes, table_versions
+from app.models.word import Word
+from app.models.word_group import WordGroup
+from app.models.word_review_item import WordReviewItem
+from app.models.word_schedule import WordSchedule
+from app.models.word_stats import WordStats
+
+# SM-2 grades (0-5) given to a binary review result
+GRADE_CORRECT = 4
+GRADE_WRONG = 1
+
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+# Longest interval between reviews; without a cap, a long run of correct
+# answers grows it past the dates datetime can represent
+MAX_INTERVAL_DAYS = 36500.0
+
+# Rows read and written at a time when replaying the review history
+REPLAY_CHUNK_SIZE = 5000
+
+
+def sm2_step(state: Optional[Dict], correct: bool, reviewed_at: datetime) -> Dict:
+    """
+    Apply one review to a word's SM-2 state.
+
+    `state` is the previous row (repetitions, interval_days, ease), or None
+    for a word's first review. A correct answer grows the interval, 1 day,
+    then 6 days, then by the ease factor up to MAX_INTERVAL_DAYS; a miss
+    starts over at 1 day and lowers the ease, never below MIN_EASE.
+    """
+    repetitions = state["repetitions"] if state else 0
+    interval_days = state["interval_days"] if state else 0.0
+    ease = state["ease"] if state else INITIAL_EASE
+
+    grade = GRADE_CORRECT if correct else GRADE_WRONG
+    if correct:
+        if repetitions == 0:
+            interval_days = 1.0
+        elif repetitions == 1:
+            interval_days = 6.0
+        else:
+            interval_days = min(interval_days * ease, MAX_INTERVAL_DAYS)
+        repetitions += 1
+    else:
+        repetitions = 0
+        interval_days = 1.0
+    ease = max(MIN_EASE, ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+
+    return {
+        "repetitions": repetitions,
+        "interval_days": interval_days,
+        "ease": ease,
+        "last_reviewed_at": reviewed_at,
+        "next_due": reviewed_at + timedelta(days=interval_days),
+    }
+
+
+def replay_history(connection: Union[Connection, Session]) -> int:
+    """
+    Write the schedule of every reviewed word by replaying word_review_items.
+
+    Reviews are streamed in (word_id, created_at) order, so only one
+    word's state is held at a time, and rows are inserted in chunks. The
+    word_schedule table must be empty. Synchronous, for
+    AsyncSession.run_sync. Returns the number of scheduled words.
+    """
+    reviews = connection.execute(
+        select(WordReviewItem.word_id, WordReviewItem.correct, WordReviewItem.created_at)
+        .order_by(WordReviewItem.word_id, WordReviewItem.created_at, WordReviewItem.id)
+        .execution_options(yield_per=REPLAY_CHUNK_SIZE)
+    )
+    table = WordSchedule.__table__
+    rows: List[Dict] = []
+    scheduled = 0
+    current: Optional[Dict] = None
+    for word_id, correct, created_at in reviews:
+        if current is not None and current["word_id"] != word_id:
+            rows.append(current)
+            current = None
+            if len(rows) >= REPLAY_CHUNK_SIZE:
+                connection.execute(insert(table), rows)
+                scheduled += len(rows)
+                rows = []
+        current = {"word_id": word_id, **sm2_step(current, correct, created_at)}
+    if current is not None:
+        rows.append(current)
+    if rows:
+        connection.execute(insert(table), rows)
+        scheduled += len(rows)
+    return scheduled
+
+
+class CRUDWordSchedule:
+    def __init__(self, model: type[WordSchedule]):
+        self.model = model
+
+    async def get(self, db: AsyncSession, word_id: int) -> Optional[WordSchedule]:
+        """Get the schedule of a single word."""
+        result = await db.execute(
+            select(self.model).filter(self.model.word_id == word_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def record_reviews(
+        self,
+        db: AsyncSession,
+        reviews: Iterable[Tuple[int, bool, datetime]]
+    ) -> None:
+        """
+        Fold new (word_id, correct, created_at) reviews into the schedules.
+
+        The current state of every reviewed word is read in one query, the
+        reviews are applied in order with sm2_step, and the new states are
+        written with one upsert row per distinct word. Call this in the
+        transaction that inserts the reviews. Does not commit.
+        """
+        reviews = list(reviews)
+        if not reviews:
+            return
+
+        word_ids = list(dict.fromkeys(word_id for word_id, _, _ in reviews))
+        result = await db.execute(
+            select(
+                self.model.word_id,
+                self.model.repetitions,
+                self.model.interval_days,
+                self.model.ease
+            ).where(self.model.word_id.in_(word_ids))
+        )
+        states: Dict[int, Dict] = {row.word_id: row._asdict() for row in result.all()}
+        for word_id, correct, created_at in reviews:
+            states[word_id] = {
+                "word_id": word_id,
+                **sm2_step(states.get(word_id), correct, created_at)
+            }
+
+        stmt = sqlite_insert(self.model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.word_id],
+            set_={
+                column: stmt.excluded[column]
+                for column in (
+                    "repetitions", "interval_days", "ease", "last_reviewed_at", "next_due"
+                )
+            }
+        )
+        await db.execute(stmt, [states[word_id] for word_id in word_ids])
+
+    async def get_due(
+        self,
+        db: AsyncSession,
+        *,
+        now: datetime,
+        group_id: Optional[int] = None,
+        limit: int = 20
+    ) -> List[Tuple[Word, WordSchedule]]:
+        """
+        Get the words due for review at `now`, most overdue first.
+
+        Read in next_due order from idx_word_schedule_next_due, so the cost
+        depends on `limit` and not on the size of the review history.
+        With `group_id`, the group's words are read from
+        idx_word_groups_group_id instead and only those schedules sorted,
+        so a small group does not walk the schedules of every other word.
+        Words are returned with their review statistics.
+        """
+        query = (
+            select(
+                Word,
+                self.model,
+                func.coalesce(WordStats.correct_count, 0),
+                func.coalesce(WordStats.wrong_count, 0)
+            )
+            .join(self.model, self.model.word_id == Word.id)
+            .outerjoin(WordStats, WordStats.word_id == Word.id)
+            .where(self.model.next_due <= now)
+        )
+        if group_id is not None:
+            query = query.join(
+                WordGroup,
+                (WordGroup.word_id == self.model.word_id) & (WordGroup.group_id == group_id)
+            )
+        query = query.order_by(self.model.next_due, self.model.word_id).limit(limit)
+        result = await db.execute(query)
+
+        due = []
+        for db_word, schedule, correct_count, wrong_count in result.all():
+            db_word.correct_count = correct_count
+            db_word.wrong_count = wrong_count
+            due.append((db_word, schedule))
+        return due
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """
+        Replay the whole review history into fresh schedules and commit.
+
+        Used for backfills and after changing the scheduling rules. Returns
+        the number of scheduled words.
+        """
+        await db.execute(delete(self.model))
+        scheduled = await db.run_sync(replay_history)
+        await record_writes(db, [self.model.__tablename__])
+        await db.commit()
+        table_versions.bump(self.model.__tablename__)
+        return scheduled
+
+
+word_schedule = CRUDWordSchedule(WordSchedule)
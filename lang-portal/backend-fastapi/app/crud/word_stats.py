@@ -0,0 +1,108 @@
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from sqlalchemy import case, delete, func, insert, literal, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.invalidation import record_writes, table_versions
+from app.models.word import Word
+from app.models.word_review_item import WordReviewItem
+from app.models.word_stats import WordStats
+
+
+class CRUDWordStats:
+    def __init__(self, model: type[WordStats]):
+        self.model = model
+
+    async def get(self, db: AsyncSession, word_id: int) -> Optional[WordStats]:
+        """Get the review statistics of a single word."""
+        result = await db.execute(
+            select(self.model).filter(self.model.word_id == word_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def record_reviews(
+        self,
+        db: AsyncSession,
+        reviews: Iterable[Tuple[int, bool, datetime]]
+    ) -> None:
+        """
+        Fold new (word_id, correct, created_at) reviews into the rollup.
+
+        Reviews are aggregated per word first, so a batch costs one upsert
+        row per distinct word. Call this in the same transaction that
+        inserts the reviews so the counts never drift. Does not commit.
+        """
+        rows: Dict[int, Dict] = {}
+        for word_id, correct, created_at in reviews:
+            row = rows.setdefault(word_id, {
+                "word_id": word_id,
+                "correct_count": 0,
+                "wrong_count": 0,
+                "last_reviewed_at": created_at,
+            })
+            if correct:
+                row["correct_count"] += 1
+            else:
+                row["wrong_count"] += 1
+            if created_at > row["last_reviewed_at"]:
+                row["last_reviewed_at"] = created_at
+        if not rows:
+            return
+
+        stmt = sqlite_insert(self.model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.word_id],
+            set_={
+                "correct_count": self.model.correct_count + stmt.excluded.correct_count,
+                "wrong_count": self.model.wrong_count + stmt.excluded.wrong_count,
+                # Two-argument max() is NULL if either side is, hence coalesce
+                "last_reviewed_at": func.max(
+                    func.coalesce(
+                        self.model.last_reviewed_at,
+                        stmt.excluded.last_reviewed_at
+                    ),
+                    stmt.excluded.last_reviewed_at
+                ),
+            }
+        )
+        await db.execute(stmt, list(rows.values()))
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """
+        Recompute every row from word_review_items and commit.
+
+        Used for backfills and to repair drift. Words without reviews get a
+        row of zeros. Returns the number of words that have at least one
+        review.
+        """
+        await db.execute(delete(self.model))
+        aggregate = (
+            select(
+                WordReviewItem.word_id,
+                func.count(case((WordReviewItem.correct == True, 1))),
+                func.count(case((WordReviewItem.correct == False, 1))),
+                func.max(WordReviewItem.created_at)
+            )
+            .group_by(WordReviewItem.word_id)
+        )
+        result = await db.execute(
+            insert(self.model).from_select(
+                ["word_id", "correct_count", "wrong_count", "last_reviewed_at"],
+                aggregate
+            )
+        )
+        reviewed = select(self.model.word_id)
+        await db.execute(
+            insert(self.model).from_select(
+                ["word_id", "correct_count", "wrong_count"],
+                select(Word.id, literal(0), literal(0)).where(Word.id.not_in(reviewed))
+            )
+        )
+        await record_writes(db, [self.model.__tablename__])
+        await db.commit()
+        table_versions.bump(self.model.__tablename__)
+        return result.rowcount
+
+
+word_stats = CRUDWordStats(WordStats)
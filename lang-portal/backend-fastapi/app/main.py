@@ -1,19 +1,53 @@
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse, Response
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.core.cache import response_cache
 from app.core.config import get_settings
+from app.core.database import check_database, engine, read_engine
+from app.core.instrumentation import QueryInstrumentationMiddleware
+from app.core.invalidation import table_versions
+from app.core.metrics import CONTENT_TYPE, MetricsMiddleware, registry
 from app.core.exceptions import AppHTTPException, DatabaseError
 from app.core.exceptions import http_exception_handler, database_exception_handler
+from app.core.responses import (
+    EnvelopeJSONResponse,
+    envelope_http_exception_handler,
+    envelope_validation_exception_handler,
+)
 from app.api.v1.router import api_router
+from app.services.review_buffer import review_buffer
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Report the connection settings in effect before serving requests
+    await check_database()
+    if review_buffer is not None:
+        review_buffer.start()
+    yield
+    # Write the queued reviews while the engine is still open
+    if review_buffer is not None:
+        await review_buffer.stop()
+    table_versions.close()
+    await read_engine.dispose()
+    await engine.dispose()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
+    lifespan=lifespan,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    # Wrap every response in our standard format while it is serialized
+    default_response_class=EnvelopeJSONResponse,
 )
 
 # CORS middleware configuration
@@ -29,64 +63,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Statement counts and database time per request, when enabled
+if settings.SQL_INSTRUMENTATION:
+    app.add_middleware(
+        QueryInstrumentationMiddleware,
+        statement_threshold=settings.SQL_STATEMENT_THRESHOLD,
+        repeat_threshold=settings.SQL_REPEAT_THRESHOLD,
+    )
+
+# Outermost, so the recorded latency covers the other middleware too
+if settings.METRICS:
+    app.add_middleware(MetricsMiddleware)
+
 # Exception handlers
 app.add_exception_handler(AppHTTPException, http_exception_handler)
 app.add_exception_handler(DatabaseError, database_exception_handler)
+app.add_exception_handler(StarletteHTTPException, envelope_http_exception_handler)
+app.add_exception_handler(RequestValidationError, envelope_validation_exception_handler)
 
 # Add API router
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
 
-# Custom response middleware to wrap all responses in our standard format
-@app.middleware("http")
-async def wrap_response(request: Request, call_next):
-    response = await call_next(request)
-    
-    # Don't modify non-JSON responses (like OpenAPI docs)
-    if response.headers.get("content-type") != "application/json":
-        return response
-    
-    # Get the response body
-    body = b""
-    async for chunk in response.body_iterator:
-        body += chunk
-    
-    # If no body, return empty response
-    if not body:
-        return JSONResponse(
-            content={"data": None, "error": None},
-            status_code=response.status_code,
-        )
-    
-    try:
-        # Parse and wrap the response data
-        import json
-        data = json.loads(body)
-        if not isinstance(data, dict) or ("data" not in data and "error" not in data):
-            data = {"data": data, "error": None}
-        
-        # Create new response with wrapped data
-        return Response(
-            content=json.dumps(data),
-            status_code=response.status_code,
-            headers={
-                "content-type": "application/json",
-                **{
-                    k: v for k, v in response.headers.items()
-                    if k.lower() not in ("content-type", "content-length")
-                }
-            },
-        )
-    except json.JSONDecodeError:
-        # If response is not valid JSON, return it as-is
-        return Response(
-            content=body,
-            status_code=response.status_code,
-            headers=response.headers
-        )
-
-
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"} 
\ No newline at end of file
+    return {"status": "healthy"} 
+
+
+# Response cache counters
+@app.get("/cache/stats")
+async def cache_stats():
+    return response_cache.stats()
+
+
+# Prometheus scrape target
+if settings.METRICS:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,12 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class CacheGeneration(Base):
+    """Write generation per table, shared by all workers for cache invalidation."""
+    __tablename__ = "cache_generations"
+
+    table_name: Mapped[str] = mapped_column(String, primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
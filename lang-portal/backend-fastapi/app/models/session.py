@@ -28,5 +28,7 @@ class Session(Base, TimestampMixin):
     reviews: Mapped[List["WordReviewItem"]] = relationship(
         "WordReviewItem",
         back_populates="session",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        # In review order, whichever index the lookup by session uses
+        order_by="WordReviewItem.id"
     ) 
\ No newline at end of file
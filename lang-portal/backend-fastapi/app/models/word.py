@@ -1,9 +1,12 @@
-from typing import Dict, List
-from sqlalchemy import JSON, String
+from typing import Dict, List, Optional
+from sqlalchemy import DDL, JSON, Integer, String, column, event, table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 from app.models.word_group import WordGroup  # Import the junction table
 from app.models.word_review_item import WordReviewItem  # Fixed import path
+from app.models.word_stats import WordStats
+from app.models.word_schedule import WordSchedule
+from app.models.word_part import WordPart
 
 
 class Word(Base):
@@ -32,9 +35,52 @@ class Word(Base):
         back_populates="word",
         cascade="all, delete-orphan"
     )
+    stats: Mapped[Optional["WordStats"]] = relationship(
+        "WordStats",
+        back_populates="word",
+        cascade="all, delete-orphan",
+        uselist=False
+    )
+    schedule: Mapped[Optional["WordSchedule"]] = relationship(
+        "WordSchedule",
+        back_populates="word",
+        cascade="all, delete-orphan",
+        uselist=False
+    )
+    components: Mapped[List["WordPart"]] = relationship(
+        "WordPart",
+        back_populates="word",
+        cascade="all, delete-orphan",
+        order_by="WordPart.position"
+    )
 
     # Computed properties for review statistics
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.correct_count: int = 0
-        self.wrong_count: int = 0 
\ No newline at end of file
+        self.wrong_count: int = 0 
+
+
+# Full-text search index over each word's kanji, romaji, english and the
+# kanji characters of its parts; the rowid is the word ID. FTS5 virtual
+# tables cannot be mapped, so it is created and dropped together with the
+# words table and kept in sync by CRUDWord.
+words_fts = table(
+    "words_fts",
+    column("rowid", Integer),
+    column("kanji", String),
+    column("romaji", String),
+    column("english", String),
+    column("parts_kanji", String),
+)
+
+CREATE_WORDS_FTS = DDL(
+    "CREATE VIRTUAL TABLE IF NOT EXISTS words_fts USING fts5("
+    "kanji, romaji, english, parts_kanji, "
+    "tokenize = 'unicode61 remove_diacritics 2', "
+    "prefix = '1 2 3')"
+)
+DROP_WORDS_FTS = DDL("DROP TABLE IF EXISTS words_fts")
+
+event.listen(Word.__table__, "after_create", CREATE_WORDS_FTS.execute_if(dialect="sqlite"))
+event.listen(Word.__table__, "before_drop", DROP_WORDS_FTS.execute_if(dialect="sqlite"))
@@ -1,15 +1,92 @@
-from sqlalchemy import ForeignKey, UniqueConstraint
+from typing import Optional
+from sqlalchemy import DDL, ForeignKey, Index, Integer, UniqueConstraint, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 
 
 class WordGroup(Base):
     __tablename__ = "word_groups"
-    __table_args__ = (UniqueConstraint("word_id", "group_id"),)
+    __table_args__ = (
+        UniqueConstraint("word_id", "group_id"),
+        Index("idx_word_groups_position", "group_id", "position"),
+    )
 
     word_id: Mapped[int] = mapped_column(ForeignKey("words.id", ondelete="CASCADE"), primary_key=True)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id", ondelete="CASCADE"), primary_key=True)
+    # Dense 0..words_count-1 within the group, maintained by triggers, so a
+    # random member can be picked by position through the index
+    position: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Define relationships for easier access
     word: Mapped["Word"] = relationship("Word", back_populates="word_groups")
-    group: Mapped["Group"] = relationship("Group", back_populates="word_groups") 
\ No newline at end of file
+    group: Mapped["Group"] = relationship("Group", back_populates="word_groups")
+
+
+# groups.words_count is maintained by the database: every membership row
+# inserted, deleted (including cascades from deleted words and groups) or
+# moved to another group adjusts the count of its group in the same
+# statement. CRUDGroup can check and repair drift left by older versions.
+WORDS_COUNT_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS word_groups_count_insert "
+    "AFTER INSERT ON word_groups BEGIN "
+    "UPDATE groups SET words_count = COALESCE(words_count, 0) + 1 WHERE id = NEW.group_id; "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS word_groups_count_delete "
+    "AFTER DELETE ON word_groups BEGIN "
+    "UPDATE groups SET words_count = COALESCE(words_count, 0) - 1 WHERE id = OLD.group_id; "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS word_groups_count_update "
+    "AFTER UPDATE OF group_id ON word_groups "
+    "WHEN OLD.group_id IS NOT NEW.group_id BEGIN "
+    "UPDATE groups SET words_count = COALESCE(words_count, 0) - 1 WHERE id = OLD.group_id; "
+    "UPDATE groups SET words_count = COALESCE(words_count, 0) + 1 WHERE id = NEW.group_id; "
+    "END",
+]
+DROP_WORDS_COUNT_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS word_groups_count_insert",
+    "DROP TRIGGER IF EXISTS word_groups_count_delete",
+    "DROP TRIGGER IF EXISTS word_groups_count_update",
+]
+
+# word_groups.position stays dense the same way: a new member is appended
+# after the last position of its group, and a removed member's position
+# is taken over by the group's last member.
+_FILL_POSITION = (
+    "UPDATE word_groups SET position = OLD.position "
+    "WHERE group_id = OLD.group_id AND position > OLD.position AND position = ("
+    "SELECT MAX(position) FROM word_groups WHERE group_id = OLD.group_id); "
+)
+_APPEND_POSITION = (
+    "UPDATE word_groups SET position = ("
+    "SELECT COALESCE(MAX(position) + 1, 0) FROM word_groups "
+    "WHERE group_id = NEW.group_id AND word_id != NEW.word_id) "
+    "WHERE word_id = NEW.word_id AND group_id = NEW.group_id; "
+)
+POSITION_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS word_groups_position_insert "
+    "AFTER INSERT ON word_groups BEGIN " + _APPEND_POSITION + "END",
+    "CREATE TRIGGER IF NOT EXISTS word_groups_position_delete "
+    "AFTER DELETE ON word_groups BEGIN " + _FILL_POSITION + "END",
+    "CREATE TRIGGER IF NOT EXISTS word_groups_position_update "
+    "AFTER UPDATE OF group_id ON word_groups "
+    "WHEN OLD.group_id IS NOT NEW.group_id BEGIN " + _FILL_POSITION + _APPEND_POSITION + "END",
+]
+DROP_POSITION_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS word_groups_position_insert",
+    "DROP TRIGGER IF EXISTS word_groups_position_delete",
+    "DROP TRIGGER IF EXISTS word_groups_position_update",
+]
+
+# Renumber every group's members 0..n-1, e.g. after a bulk load without triggers
+RENUMBER_POSITIONS_SQL = (
+    "UPDATE word_groups SET position = numbered.position FROM ("
+    "SELECT word_id, group_id, "
+    "ROW_NUMBER() OVER (PARTITION BY group_id ORDER BY word_id) - 1 AS position "
+    "FROM word_groups) AS numbered "
+    "WHERE numbered.word_id = word_groups.word_id AND numbered.group_id = word_groups.group_id"
+)
+
+WORD_GROUPS_TRIGGERS = WORDS_COUNT_TRIGGERS + POSITION_TRIGGERS
+
+for statement in WORD_GROUPS_TRIGGERS:
+    event.listen(WordGroup.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
@@ -0,0 +1,32 @@
+from typing import TYPE_CHECKING
+from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base
+
+if TYPE_CHECKING:
+    from app.models.word import Word
+
+
+class WordPart(Base):
+    """
+    Inverted index of the kanji components in each word's `parts`.
+
+    One row per part that contains kanji, so words can be looked up by
+    component (and reading) without parsing the JSON column. Maintained by
+    CRUDWord together with the search index.
+    """
+    __tablename__ = "word_parts"
+    __table_args__ = (
+        Index("idx_word_parts_component", "component", "reading", "word_id"),
+    )
+
+    word_id: Mapped[int] = mapped_column(
+        ForeignKey("words.id", ondelete="CASCADE"), primary_key=True
+    )
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    component: Mapped[str] = mapped_column(String, nullable=False)
+    reading: Mapped[str] = mapped_column(String, nullable=False)
+
+    # Relationships
+    word: Mapped["Word"] = relationship("Word", back_populates="components")
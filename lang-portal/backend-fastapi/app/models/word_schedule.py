@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base
+
+if TYPE_CHECKING:
+    from app.models.word import Word
+
+
+class WordSchedule(Base):
+    """
+    Spaced-repetition (SM-2) state of each reviewed word.
+
+    Updated by CRUDWordSchedule in the same transaction as every review
+    write; the study queue is read from idx_word_schedule_next_due.
+    """
+    __tablename__ = "word_schedule"
+    __table_args__ = (
+        Index("idx_word_schedule_next_due", "next_due", "word_id"),
+    )
+
+    word_id: Mapped[int] = mapped_column(
+        ForeignKey("words.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Successful reviews in a row since the last miss
+    repetitions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    interval_days: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    ease: Mapped[float] = mapped_column(Float, nullable=False, default=2.5)
+    last_reviewed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    next_due: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    # Relationships
+    word: Mapped["Word"] = relationship("Word", back_populates="schedule")
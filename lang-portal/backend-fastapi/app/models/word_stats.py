@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Optional, TYPE_CHECKING
+from sqlalchemy import DDL, DateTime, ForeignKey, Index, Integer, event
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base
+
+if TYPE_CHECKING:
+    from app.models.word import Word
+
+
+class WordStats(Base):
+    """
+    Rollup of review results per word, maintained as reviews are written.
+
+    Every word has a row, zeros until its first review, so sorting words
+    by their counts is an index scan of this table.
+    """
+    __tablename__ = "word_stats"
+    __table_args__ = (
+        Index("idx_word_stats_correct_count", "correct_count", "word_id"),
+        Index("idx_word_stats_wrong_count", "wrong_count", "word_id"),
+    )
+
+    word_id: Mapped[int] = mapped_column(
+        ForeignKey("words.id", ondelete="CASCADE"), primary_key=True
+    )
+    correct_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    wrong_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_reviewed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )
+
+    # Relationships
+    word: Mapped["Word"] = relationship("Word", back_populates="stats")
+
+
+# A new word starts with zero counts. OR IGNORE keeps the row of a word
+# whose statistics were written first, e.g. by a bulk load.
+WORD_STATS_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS words_stats_insert "
+    "AFTER INSERT ON words BEGIN "
+    "INSERT OR IGNORE INTO word_stats (word_id, correct_count, wrong_count) "
+    "VALUES (NEW.id, 0, 0); "
+    "END",
+]
+
+# Created with word_stats, which needs the words table to exist first
+for statement in WORD_STATS_TRIGGERS:
+    event.listen(WordStats.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
@@ -16,23 +16,35 @@ T = TypeVar("T")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: List[T]
-    total: int = Field(ge=0, description="Total number of items")
+    total: Optional[int] = Field(
+        ge=0,
+        description="Total number of items, or null when not counted"
+    )
     page: int = Field(ge=1, description="Current page number (1-based)")
     per_page: int = Field(ge=1, description="Number of items per page")
-    total_pages: int = Field(ge=0, description="Total number of pages")
+    total_pages: Optional[int] = Field(
+        ge=0,
+        description="Total number of pages, or null when not counted"
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor for the next page, or null on the last page"
+    )
 
     @model_validator(mode="after")
     def validate_pagination(self):
         """Validate pagination values are consistent."""
-        if self.total < 0:
+        if (self.total is None) != (self.total_pages is None):
+            raise ValueError("Total and total pages must both be set or both be null")
+        if self.total is not None and self.total < 0:
             raise ValueError("Total items cannot be negative")
         if self.page < 1:
             raise ValueError("Page number must be greater than 0")
         if self.per_page < 1:
             raise ValueError("Items per page must be greater than 0")
-        if self.total_pages < 0:
+        if self.total_pages is not None and self.total_pages < 0:
             raise ValueError("Total pages cannot be negative")
-        if self.total > 0 and self.total_pages == 0:
+        if self.total and self.total_pages == 0:
             raise ValueError("Total pages must be greater than 0 when there are items")
         if len(self.items) > self.per_page:
             raise ValueError("Number of items exceeds per_page limit")
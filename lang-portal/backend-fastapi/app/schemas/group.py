@@ -41,4 +41,31 @@ class GroupWithWords(Group):
     words: List[Word]
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True 
+
+
+class GroupSample(BaseModel):
+    """Schema for a random study set drawn from a group."""
+    group_id: int
+    strategy: str = Field(..., description="uniform, or weak to favour often missed words")
+    items: List[Word]
+
+
+class GroupPackGroup(BaseModel):
+    id: int
+    name: str
+
+
+class GroupPack(BaseModel):
+    """Schema for every word of a group in columns, for games to preload."""
+    format: int = Field(..., description="Version of the pack layout")
+    group: GroupPackGroup
+    count: int = Field(..., description="Number of words, the length of every column")
+    id: List[int]
+    kanji: List[str]
+    romaji: List[str]
+    english: List[str]
+    parts: List[List[List[str]]] = Field(
+        ...,
+        description="Parts of each word as [kanji, syllable, ...] arrays"
+    )
@@ -33,6 +33,25 @@ class WordReviewCreate(WordReviewBase):
     pass
 
 
+class WordReviewBatchCreate(BaseModel):
+    """Schema for logging many word reviews of a session at once."""
+    reviews: List[WordReviewCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Reviews to log, in the order they happened"
+    )
+
+
+class WordReviewBatchResult(BaseModel):
+    """Outcome of a single item of a batch review request."""
+    index: int = Field(..., ge=0, description="Position of the item in the request")
+    word_id: int = Field(..., description="ID of the word being reviewed")
+    correct: bool = Field(..., description="Whether the answer was correct")
+    id: Optional[int] = Field(None, description="ID of the created review, if accepted")
+    error: Optional[str] = Field(None, description="Why the item was rejected, if it was")
+
+
 class WordReview(WordReviewBase):
     """Schema for word review responses, includes database fields."""
     id: int
@@ -75,6 +94,22 @@ class Session(SessionBase):
         return v
 
 
+class SessionSummary(SessionBase):
+    """Schema for session listings with review statistics instead of reviews."""
+    id: int
+    created_at: str
+    total_reviews: int = Field(0, ge=0, description="Total number of reviews")
+    correct_reviews: int = Field(0, ge=0, description="Number of correct reviews")
+    accuracy: float = Field(0.0, ge=0.0, le=1.0, description="Share of correct reviews")
+
+    @field_validator("created_at", mode="before")
+    @classmethod
+    def convert_datetime_to_str(cls, v):
+        if isinstance(v, datetime):
+            return v.isoformat()
+        return v
+
+
 class SessionStats(BaseModel):
     """Schema for session statistics."""
     total_reviews: int = Field(0, ge=0, description="Total number of reviews")
@@ -85,4 +120,19 @@ class SessionStats(BaseModel):
     def validate_stats(self):
         if self.total_reviews < self.correct_reviews:
             raise ValueError("Total reviews cannot be less than correct reviews")
-        return self 
\ No newline at end of file
+        return self
+
+
+class SessionStatsBatchRequest(BaseModel):
+    """Schema for requesting the statistics of many sessions at once."""
+    session_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="IDs of the sessions"
+    )
+
+
+class SessionStatsItem(SessionStats):
+    """Statistics of one session in a batch response."""
+    session_id: int = Field(..., description="ID of the session")
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel, Field
+
+from app.schemas.word import Word
+
+
+class DueWord(Word):
+    """Schema for a word due for review, with its spaced-repetition state."""
+    repetitions: int = Field(..., description="Correct reviews in a row since the last miss")
+    interval_days: float = Field(..., description="Days between the last review and next_due")
+    ease: float = Field(..., description="SM-2 ease factor, at least 1.3")
+    last_reviewed_at: datetime
+    next_due: datetime
+
+
+class StudyQueue(BaseModel):
+    """Schema for the words due for review, most overdue first."""
+    items: List[DueWord]
@@ -43,4 +43,42 @@ class Word(WordBase):
 
 
 class WordInGroup(Word):
-    group_ids: List[int] 
\ No newline at end of file
+    group_ids: List[int]
+
+
+class RelatedWord(Word):
+    """Schema for a word related to another through shared kanji components."""
+    shared_components: List[str] = Field(..., description="Kanji components shared with the other word")
+
+
+class AnswerCheck(BaseModel):
+    """Schema for checking a typed romaji answer, complete or not."""
+    answer: str = Field(..., max_length=100, description="Romaji typed so far")
+
+
+class AnswerCheckBatchItem(AnswerCheck):
+    word_id: int = Field(..., description="ID of the word being answered")
+
+
+class AnswerCheckBatch(BaseModel):
+    """Schema for checking answers to many words at once."""
+    items: List[AnswerCheckBatchItem] = Field(..., min_length=1, max_length=500)
+
+
+class AnswerCheckResult(BaseModel):
+    """Outcome of checking one answer."""
+    word_id: int
+    status: Optional[str] = Field(
+        None,
+        description="correct, partial (a prefix of an accepted answer) or wrong"
+    )
+    matched: Optional[int] = Field(
+        None,
+        description="Leading characters of the normalized answer that fit an accepted answer"
+    )
+    detail: Optional[str] = Field(None, description="Why the answer could not be checked, if it could not")
+
+
+class AnswerCheckBatchResult(BaseModel):
+    """Schema for the results of a batch answer check, in request order."""
+    items: List[AnswerCheckResult]
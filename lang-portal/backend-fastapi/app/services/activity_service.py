@@ -2,6 +2,7 @@ from typing import List, Optional, Tuple
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.base import CountMode
 from app.crud.activity import activity
 from app.models.activity import Activity
 from app.schemas.activity import ActivityCreate, ActivityUpdate
@@ -23,8 +24,10 @@ class ActivityService:
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
-    ) -> Tuple[List[Activity], int]:
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[Activity], Optional[int]]:
         """
         Get activities with pagination and sorting.
         
@@ -33,6 +36,8 @@ class ActivityService:
             limit: Maximum number of records to return
             order_by: Field to sort by
             order: Sort order ('asc' or 'desc')
+            cursor: Opaque keyset cursor; when given, skip is ignored
+            count_mode: "exact" for COUNT(*), "estimate" for a cached count, "none" to skip it
             
         Returns:
             Tuple of (list of activities, total count)
@@ -42,7 +47,9 @@ class ActivityService:
             skip=skip,
             limit=limit,
             order_by=order_by,
-            order=order
+            order=order,
+            cursor=cursor,
+            count_mode=count_mode
         )
 
     @staticmethod
@@ -1,12 +1,34 @@
-from typing import List, Optional, Tuple
+import random
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.base import CountMode
 from app.crud.group import group
 from app.crud.word import word
 from app.models.group import Group
 from app.models.word import Word
+from app.core.invalidation import table_versions
 from app.schemas.group import GroupCreate, GroupUpdate
+from app.services.word_pack import PACK_TABLES, EncodedPack, encode_pack, pack_cache
+
+# Candidates drawn per missing word in each sampling round, and the rounds
+# tried before the rest is filled with the best candidates seen
+SAMPLE_OVERDRAW = 4
+SAMPLE_MAX_ROUNDS = 10
+
+
+def sample_weight(strategy: str, correct_count: int, wrong_count: int) -> float:
+    """
+    Weight of a word in a random study set.
+
+    "weak" uses the smoothed miss rate, (wrong + 1) / (reviews + 2): a
+    word never reviewed weighs 0.5, one always missed close to 1 and one
+    always answered correctly close to 0.
+    """
+    if strategy == "weak":
+        return (wrong_count + 1) / (correct_count + wrong_count + 2)
+    return 1.0
 
 
 class GroupService:
@@ -22,8 +44,10 @@ class GroupService:
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
-    ) -> Tuple[List[Group], int]:
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[Group], Optional[int]]:
         """
         Get groups with their word counts.
         
@@ -32,13 +56,17 @@ class GroupService:
             limit: Maximum number of records to return
             order_by: Field to sort by
             order: Sort order ('asc' or 'desc')
+            cursor: Opaque keyset cursor; when given, skip is ignored
+            count_mode: "exact" for COUNT(*), "estimate" for a cached count, "none" to skip it
         """
         return await group.get_multi(
             db,
             skip=skip,
             limit=limit,
             order_by=order_by,
-            order=order
+            order=order,
+            cursor=cursor,
+            count_mode=count_mode
         )
 
     @staticmethod
@@ -49,8 +77,9 @@ class GroupService:
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
-    ) -> Tuple[List[Word], int]:
+        order: Optional[str] = "asc",
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[Word], Optional[int]]:
         """Get paginated words for a specific group."""
         return await group.get_group_words(
             db,
@@ -58,9 +87,127 @@ class GroupService:
             skip=skip,
             limit=limit,
             order_by=order_by,
-            order=order
+            order=order,
+            count_mode=count_mode
         )
 
+    @staticmethod
+    async def sample_words(
+        db: AsyncSession,
+        *,
+        group_id: int,
+        n: int,
+        strategy: str = "uniform",
+        rng: Optional[random.Random] = None
+    ) -> List[Word]:
+        """
+        Draw a random study set of up to n distinct words from a group.
+        
+        Members are picked by their dense position in the group through
+        idx_word_groups_position, never by sorting the group, so the cost
+        depends on n and not on the group size. With the "weak" strategy
+        candidates are kept with probability proportional to their
+        sample_weight (rejection sampling); after SAMPLE_MAX_ROUNDS rounds
+        the set is topped up with the heaviest candidates seen.
+        
+        Args:
+            group_id: ID of the group
+            n: Number of words wanted
+            strategy: "uniform" or "weak" (words missed more often come up more)
+            rng: Random generator, e.g. seeded in tests
+            
+        Returns:
+            The sampled words with review statistics, in random order
+            
+        Raises:
+            ValueError: If group doesn't exist
+        """
+        if not await group.get(db, group_id):
+            raise ValueError(f"Group {group_id} not found")
+        rng = rng or random.Random()
+
+        size = await group.get_position_count(db, group_id=group_id)
+        if size <= n:
+            # The whole group: only the order is random
+            members = await group.get_members_at(db, group_id=group_id, positions=range(size))
+            # Weighted shuffle: sort by u ** (1 / weight)
+            keys = {
+                position: rng.random() ** (1 / sample_weight(strategy, correct, wrong))
+                for position, (_, correct, wrong) in members.items()
+            }
+            order = sorted(keys, key=keys.__getitem__, reverse=True)
+            return await word.get_many_with_stats(db, [members[p][0] for p in order])
+
+        seen: Dict[int, Tuple[int, int, int]] = {}
+        chosen: List[int] = []
+        for _ in range(SAMPLE_MAX_ROUNDS):
+            missing = n - len(chosen)
+            if not missing:
+                break
+            draws = rng.sample(range(size), min(size, missing * SAMPLE_OVERDRAW))
+            seen.update(await group.get_members_at(
+                db, group_id=group_id, positions=[p for p in draws if p not in seen]
+            ))
+            for position in draws:
+                # Positions are dense, but skip any hole left by a concurrent delete
+                if position in chosen or position not in seen:
+                    continue
+                _, correct, wrong = seen[position]
+                if rng.random() < sample_weight(strategy, correct, wrong):
+                    chosen.append(position)
+                    if len(chosen) == n:
+                        break
+
+        if len(chosen) < n:
+            rest = sorted(
+                (p for p in seen if p not in chosen),
+                key=lambda p: sample_weight(strategy, seen[p][1], seen[p][2]),
+                reverse=True
+            )
+            chosen.extend(rest[:n - len(chosen)])
+        return await word.get_many_with_stats(db, [seen[p][0] for p in chosen])
+
+    @staticmethod
+    async def get_word_pack(db: AsyncSession, group_id: int) -> EncodedPack:
+        """
+        Get every word of a group as an encoded pack.
+        
+        Served from the pack cache until the group, its members or any
+        word changes; otherwise the words are read in one query.
+        
+        Raises:
+            ValueError: If the group doesn't exist
+        """
+        pack = pack_cache.get(group_id)
+        if pack is not None:
+            return pack
+
+        # Read the versions first: a write racing the queries leaves the
+        # pack tagged as older than it may be, never as newer
+        version = table_versions.get(PACK_TABLES)
+        db_group = await group.get(db, group_id)
+        if not db_group:
+            raise ValueError(f"Group {group_id} not found")
+        rows = await group.get_pack_rows(db, group_id=group_id)
+        pack = encode_pack(version, db_group.id, db_group.name, rows)
+        pack_cache.put(group_id, pack)
+        return pack
+
+    @staticmethod
+    async def _check_words_exist(db: AsyncSession, word_ids: List[int]) -> None:
+        """
+        Check that every word exists, with a single query.
+        
+        Raises:
+            ValueError: Listing all of the word IDs that were not found
+        """
+        missing = await word.get_missing_ids(db, word_ids)
+        if len(missing) == 1:
+            raise ValueError(f"Word with ID {missing[0]} not found")
+        if missing:
+            ids = ", ".join(str(word_id) for word_id in missing)
+            raise ValueError(f"Words with IDs {ids} not found")
+
     @staticmethod
     async def create_group(
         db: AsyncSession,
@@ -82,9 +229,7 @@ class GroupService:
 
         # Verify all words exist if word_ids provided
         if word_ids:
-            for word_id in word_ids:
-                if not await word.get(db, word_id):
-                    raise ValueError(f"Word with ID {word_id} not found")
+            await GroupService._check_words_exist(db, word_ids)
 
         # Create group with words
         group_in = GroupCreate(name=name, word_ids=word_ids)
@@ -107,17 +252,9 @@ class GroupService:
         """
         if group_in.word_ids is not None:
             # Verify all words exist
-            for word_id in group_in.word_ids:
-                if not await word.get(db, word_id):
-                    raise ValueError(f"Word with ID {word_id} not found")
-
-            # Update word list
-            await group.set_words(
-                db,
-                group_id=group_id,
-                word_ids=group_in.word_ids
-            )
+            await GroupService._check_words_exist(db, group_in.word_ids)
 
+        # Also replaces the word list when word_ids is given
         return await group.update(db, id=group_id, obj_in=group_in)
 
     @staticmethod
@@ -0,0 +1,225 @@
+"""
+Write-behind buffer for review writes.
+
+With REVIEW_WRITE_BEHIND on, POST /sessions/{id}/review validates the
+review, queues it here and answers right away. A background task writes
+the queue in grouped transactions: as soon as REVIEW_FLUSH_SIZE reviews
+are waiting, or REVIEW_FLUSH_INTERVAL_MS after the first one arrived. A
+burst of reviews then costs one commit per flush instead of one per
+request.
+
+The queue is bounded. When it is full, submitters wait up to
+REVIEW_SUBMIT_TIMEOUT seconds for room and then get
+`ReviewBufferUnavailable`, which the API turns into a 503. Queued reviews
+live only in memory: they are written on shutdown, but are lost if the
+process dies, and reads may lag behind by up to one flush interval.
+"""
+
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings, get_settings
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import registry
+from app.crud.session import session
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+FLUSH_SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+review_buffer_flush_size = registry.histogram(
+    "review_buffer_flush_size", "Reviews written per write-behind flush",
+    buckets=FLUSH_SIZE_BUCKETS,
+)
+review_buffer_write_errors = registry.counter(
+    "review_buffer_write_errors", "Buffered reviews dropped because they could not be written"
+)
+
+
+class ReviewBufferUnavailable(Exception):
+    """The buffer is full or not running, so the review was not accepted."""
+
+
+class ReviewBuffer:
+    """
+    Bounded in-memory queue of reviews, written by one background task.
+
+    Call `start` on a running event loop before submitting and `stop` on
+    shutdown; `stop` writes everything that was accepted.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        *,
+        max_size: int = 10000,
+        flush_interval: float = 0.05,
+        flush_size: int = 500,
+        submit_timeout: float = 1.0
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.submit_timeout = submit_timeout
+        self.written = 0
+        self.failed = 0
+        self.flushes = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        """Whether reviews are being accepted."""
+        return self._task is not None and not self._closing
+
+    @property
+    def depth(self) -> int:
+        """Reviews accepted but not yet handed to the writer."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self) -> None:
+        """Start the writer task on the current event loop."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(self.max_size)
+        self._batch_ready = asyncio.Event()
+        self._closing = False
+        self._task = asyncio.create_task(self._run(), name="review-buffer")
+
+    async def stop(self) -> None:
+        """Stop accepting reviews, write the ones already queued and stop the writer."""
+        if self._task is None:
+            return
+        self._closing = True
+        await self.flush()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def flush(self) -> None:
+        """Wait until every review accepted so far has been written (or dropped)."""
+        if self._queue is None:
+            return
+        self._batch_ready.set()
+        await self._queue.join()
+
+    async def submit(self, *, session_id: int, word_id: int, correct: bool) -> Dict:
+        """
+        Queue an already validated review for writing.
+
+        Returns:
+            The queued row: session_id, word_id, correct and created_at
+
+        Raises:
+            ReviewBufferUnavailable: If the buffer is not running, or stays
+                full for longer than `submit_timeout`
+        """
+        if not self.running:
+            raise ReviewBufferUnavailable("Review buffer is not accepting reviews")
+        row = {
+            "session_id": session_id,
+            "word_id": word_id,
+            "correct": correct,
+            "created_at": datetime.utcnow()
+        }
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            # Backpressure: hold the request until the writer makes room
+            try:
+                await asyncio.wait_for(self._queue.put(row), self.submit_timeout)
+            except asyncio.TimeoutError:
+                raise ReviewBufferUnavailable("Review buffer is full, retry later") from None
+        if self._queue.qsize() >= self.flush_size:
+            self._batch_ready.set()
+        return dict(row)
+
+    async def _run(self) -> None:
+        """Writer loop: gather up to `flush_size` reviews per transaction."""
+        while True:
+            batch = [await self._queue.get()]
+            if not self._closing and self._queue.qsize() + 1 < self.flush_size:
+                # Give the rest of the burst one interval to arrive
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval)
+            self._batch_ready.clear()
+            while len(batch) < self.flush_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, rows: List[Dict]) -> None:
+        """Write `rows` in one transaction, retrying them one by one if it fails."""
+        self.flushes += 1
+        review_buffer_flush_size.observe(len(rows))
+        try:
+            await self._insert(rows)
+            self.written += len(rows)
+            return
+        except Exception as e:
+            if len(rows) == 1:
+                self._drop(rows[0], e)
+                return
+            logger.warning(f"Writing {len(rows)} buffered reviews failed ({e}); retrying one by one")
+        # Keep one bad row (e.g. for a session deleted meanwhile) from losing the rest
+        for row in rows:
+            try:
+                await self._insert([row])
+                self.written += 1
+            except Exception as e:
+                self._drop(row, e)
+
+    async def _insert(self, rows: List[Dict]) -> None:
+        async with self.session_factory() as db:
+            # insert_reviews adds the new IDs to the rows; keep ours clean for retries
+            await session.insert_reviews(db, [dict(row) for row in rows])
+
+    def _drop(self, row: Dict, error: Exception) -> None:
+        self.failed += 1
+        review_buffer_write_errors.inc()
+        logger.error(f"Dropped buffered review {row}: {error}")
+
+
+def create_review_buffer(settings: Settings) -> Optional[ReviewBuffer]:
+    """The buffer configured by settings, or None when reviews are written directly."""
+    if not settings.REVIEW_WRITE_BEHIND:
+        return None
+    return ReviewBuffer(
+        AsyncSessionLocal,
+        max_size=settings.REVIEW_BUFFER_SIZE,
+        flush_interval=settings.REVIEW_FLUSH_INTERVAL_MS / 1000,
+        flush_size=settings.REVIEW_FLUSH_SIZE,
+        submit_timeout=settings.REVIEW_SUBMIT_TIMEOUT,
+    )
+
+
+review_buffer = create_review_buffer(settings)
+
+if review_buffer is not None:
+    registry.gauge(
+        "review_buffer_depth",
+        "Reviews accepted but not yet written",
+        collect=lambda: {(): review_buffer.depth},
+    )
+
+
+def get_review_buffer() -> Optional[ReviewBuffer]:
+    """Dependency: the write-behind buffer, or None when it is disabled."""
+    return review_buffer
@@ -0,0 +1,147 @@
+"""
+Review streams: the reviews of one session sent over a WebSocket.
+
+Games that log reviews at a high rate send them over /sessions/{id}/ws
+instead of one POST each. The connection gathers them and writes them
+with `SessionService.add_reviews`, so they get the validation of the batch
+endpoint (unknown words and words outside the session's group are
+rejected one by one) and one transaction per batch. A batch is written
+as soon as REVIEW_FLUSH_SIZE reviews are waiting, or REVIEW_FLUSH_INTERVAL_MS
+after the first of them arrived.
+
+After each batch the client gets the results and the session's running
+statistics. These are read once when the stream opens and then updated
+from the accepted reviews, so no query is needed to report them.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.crud.session import session
+from app.schemas.session import SessionStats, WordReviewBatchResult, WordReviewCreate
+from app.services.session_service import SessionService
+
+settings = get_settings()
+
+# Reviews accepted in one message, as in POST /sessions/{id}/reviews/batch
+MAX_MESSAGE_REVIEWS = 1000
+
+
+class ReviewStream:
+    """Pending reviews and running statistics of one session's stream."""
+
+    def __init__(
+        self,
+        session_id: int,
+        stats: SessionStats,
+        *,
+        flush_size: int = settings.REVIEW_FLUSH_SIZE,
+        flush_interval: float = settings.REVIEW_FLUSH_INTERVAL_MS / 1000
+    ) -> None:
+        self.session_id = session_id
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.total_reviews = stats.total_reviews
+        self.correct_reviews = stats.correct_reviews
+        self.received = 0  # Reviews received so far; the index of the next one
+        self.pending: List[WordReviewCreate] = []
+        self._first_pending_at: Optional[float] = None
+
+    @classmethod
+    async def open(cls, db: AsyncSession, session_id: int, **kwargs: Any) -> "ReviewStream":
+        """
+        Start a stream with the session's current statistics.
+
+        Raises:
+            ValueError: If session doesn't exist
+        """
+        stats = await session.get_session_statistics(db, session_id)
+        if stats is None:
+            raise ValueError(f"Session {session_id} not found")
+        return cls(session_id, stats, **kwargs)
+
+    @staticmethod
+    def parse(message: Any) -> List[WordReviewCreate]:
+        """
+        Reviews of a decoded message: one review object, or a list of them.
+
+        Raises:
+            ValueError: If the message is not a review or a list of reviews
+        """
+        items = message if isinstance(message, list) else [message]
+        if not items or len(items) > MAX_MESSAGE_REVIEWS:
+            raise ValueError(f"Send 1 to {MAX_MESSAGE_REVIEWS} reviews per message")
+        try:
+            return [WordReviewCreate.model_validate(item) for item in items]
+        except ValidationError as e:
+            raise ValueError(f"Invalid review: {e.errors()[0]['msg']}") from None
+
+    def add(self, reviews: List[WordReviewCreate]) -> None:
+        """Queue reviews for the next batch."""
+        if not self.pending:
+            self._first_pending_at = time.monotonic()
+        self.pending.extend(reviews)
+        self.received += len(reviews)
+
+    def due(self) -> bool:
+        """Whether the pending reviews should be written now."""
+        return len(self.pending) >= self.flush_size or (
+            bool(self.pending) and self.time_to_flush() == 0
+        )
+
+    def time_to_flush(self) -> Optional[float]:
+        """Seconds until the pending reviews are due, or None if there are none."""
+        if not self.pending:
+            return None
+        elapsed = time.monotonic() - self._first_pending_at
+        return max(self.flush_interval - elapsed, 0.0)
+
+    async def flush(self, db: AsyncSession) -> List[WordReviewBatchResult]:
+        """
+        Write the pending reviews in one transaction and update the statistics.
+
+        Returns:
+            One result per pending review; `index` counts from the first
+            review of the stream
+
+        Raises:
+            ValueError: If the session no longer exists
+        """
+        reviews, self.pending = self.pending, []
+        offset = self.received - len(reviews)
+        if not reviews:
+            return []
+
+        results = await SessionService.add_reviews(db, session_id=self.session_id, reviews=reviews)
+        for result in results:
+            result.index += offset
+            if result.error is None:
+                self.total_reviews += 1
+                self.correct_reviews += result.correct
+        return results
+
+    def stats(self) -> SessionStats:
+        """Statistics of the session including the reviews written so far."""
+        return SessionStats(
+            total_reviews=self.total_reviews,
+            correct_reviews=self.correct_reviews,
+            accuracy=(self.correct_reviews / self.total_reviews) if self.total_reviews else 0.0
+        )
+
+    def message(self, results: List[WordReviewBatchResult]) -> Dict[str, Any]:
+        """Server message reporting a written batch, in the standard envelope."""
+        accepted = sum(1 for result in results if result.error is None)
+        return {
+            "data": {
+                "session_id": self.session_id,
+                "accepted": accepted,
+                "rejected": len(results) - accepted,
+                "results": [result.model_dump() for result in results],
+                "stats": self.stats().model_dump()
+            },
+            "error": None
+        }
@@ -0,0 +1,256 @@
+"""
+Server-side romaji answer checking.
+
+A word's `parts` list the romaji syllables of each part in order, e.g.
+{"kanji": "動", "romaji": ["do", "u"]}. Each syllable may be typed in any
+common romanization (Hepburn "shi", Kunrei "si", ...), so the accepted
+answers are every combination of the syllables' spellings, plus the
+word's own `romaji` field.
+
+`RomajiMatcher.compile` turns those alternatives into a small DFA once,
+and also lists its prefixes when there are few. Checking an answer is then
+one dict lookup, or one per character, which is cheap enough to validate
+every keystroke: an answer is "correct", a "partial" prefix of an
+accepted one, or "wrong" after `matched` characters.
+
+Compiled matchers are kept in `matcher_cache`, an LRU keyed by word ID.
+Entries remember the "words" table version they were checked at and are
+re-validated against the word's current parts once it changes, so an
+updated word is never checked against its old readings.
+"""
+
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import product
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import get_settings
+from app.core.invalidation import table_versions
+
+settings = get_settings()
+
+# Hepburn spellings and their Kunrei/Nihon-shiki and common IME alternatives
+SPELLINGS: Dict[str, Tuple[str, ...]] = {
+    "shi": ("si",), "chi": ("ti",), "tsu": ("tu",), "fu": ("hu",), "ji": ("zi",),
+    "sha": ("sya",), "shu": ("syu",), "sho": ("syo",),
+    "cha": ("tya", "cya"), "chu": ("tyu", "cyu"), "cho": ("tyo", "cyo"),
+    "ja": ("zya", "jya"), "ju": ("zyu", "jyu"), "jo": ("zyo", "jyo"),
+}
+# Longest units first, so "sha" is not read as "s" + "ha"
+_UNITS = sorted(SPELLINGS, key=len, reverse=True)
+
+# Long vowels written with a macron or circumflex
+_LONG_VOWELS = str.maketrans({
+    "ā": "aa", "ī": "ii", "ū": "uu", "ē": "ee", "ō": "ou",
+    "â": "aa", "î": "ii", "û": "uu", "ê": "ee", "ô": "ou",
+})
+# Separators learners type between syllables, e.g. "kan'i"
+_IGNORED = str.maketrans("", "", " \t'-’")
+
+
+def normalize_answer(answer: str) -> str:
+    """Lowercase an answer, spell out long vowels and drop separators."""
+    if answer.isascii():
+        # What keyboards send; no full-width forms or macrons to fold
+        return answer.lower().translate(_IGNORED)
+    answer = unicodedata.normalize("NFKC", answer).lower()
+    return answer.translate(_LONG_VOWELS).translate(_IGNORED)
+
+
+def syllable_spellings(syllable: str) -> Tuple[str, ...]:
+    """
+    Every accepted spelling of one syllable, the given one first.
+
+    A trailing syllabic n may also be typed "nn", as IMEs require.
+    """
+    syllable = normalize_answer(syllable)
+    pieces: List[Tuple[str, ...]] = []
+    i = 0
+    while i < len(syllable):
+        for unit in _UNITS:
+            if syllable.startswith(unit, i):
+                pieces.append((unit, *SPELLINGS[unit]))
+                i += len(unit)
+                break
+        else:
+            pieces.append((syllable[i],))
+            i += 1
+    if syllable.endswith("n") and not syllable.endswith("nn"):
+        pieces[-1] = ("n", "nn")
+    return tuple(dict.fromkeys("".join(combo) for combo in product(*pieces)))
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    status: str  # "correct", "partial" or "wrong"
+    matched: int  # Characters of the normalized answer that fit an accepted answer
+
+
+# Matchers with at most this many distinct prefixes also keep them in a dict
+MAX_PREFIXES = 1024
+
+# NFA state: (path, slot, alternative, offset into the alternative)
+_NfaState = Tuple[int, int, int, int]
+
+
+class RomajiMatcher:
+    """DFA accepting the romaji answers of one word, and their prefixes."""
+
+    def __init__(self, transitions: List[Dict[str, int]], accepting: FrozenSet[int]) -> None:
+        self.transitions = transitions
+        self.accepting = accepting
+        self.prefixes = self._enumerate_prefixes()
+
+    def _enumerate_prefixes(self) -> Optional[Dict[str, "MatchResult"]]:
+        """
+        Every string the DFA can read, mapped to its result.
+
+        The DFA has no cycles, so this is finite; most words have a few
+        dozen prefixes and then a check is one dict lookup. None when there
+        are more than MAX_PREFIXES, and `match` walks the DFA instead.
+        """
+        prefixes: Dict[str, MatchResult] = {}
+        pending = [("", 0)]
+        while pending:
+            text, state = pending.pop()
+            status = "correct" if state in self.accepting else "partial"
+            prefixes[text] = MatchResult(status, len(text))
+            if len(prefixes) > MAX_PREFIXES:
+                return None
+            pending.extend((text + char, target) for char, target in self.transitions[state].items())
+        return prefixes
+
+    @classmethod
+    def compile(cls, parts: Sequence[Dict], romaji: Optional[str] = None) -> "RomajiMatcher":
+        """
+        Build the matcher of a word from its parts and romaji.
+
+        Each syllable of each part is a slot with its alternative spellings;
+        `romaji`, when given, is one more path with a single slot. The NFA
+        over these slots is turned into a DFA by subset construction.
+        """
+        syllables = [
+            syllable_spellings(str(syllable))
+            for part in parts
+            for syllable in (part.get("romaji") or [])
+        ]
+        paths: List[List[Tuple[str, ...]]] = [syllables] if syllables else []
+        if romaji:
+            paths.append([(normalize_answer(romaji),)])
+
+        def closure(states: Iterable[_NfaState]) -> FrozenSet[_NfaState]:
+            # Finishing an alternative moves on to every alternative of the next slot
+            done = set()
+            pending = list(states)
+            while pending:
+                state = pending.pop()
+                if state in done:
+                    continue
+                done.add(state)
+                path, slot, alt, offset = state
+                slots = paths[path]
+                if slot < len(slots) and offset == len(slots[slot][alt]):
+                    pending.extend(
+                        (path, slot + 1, next_alt, 0)
+                        for next_alt in range(len(slots[slot + 1]) if slot + 1 < len(slots) else 1)
+                    )
+            return frozenset(done)
+
+        start = closure((path, 0, alt, 0) for path in range(len(paths))
+                        for alt in range(len(paths[path][0]) if paths[path] else 1))
+        numbers: Dict[FrozenSet[_NfaState], int] = {start: 0}
+        subsets = [start]
+        transitions: List[Dict[str, int]] = []
+        accepting = set()
+        for number, subset in enumerate(subsets):
+            moves: Dict[str, List[_NfaState]] = {}
+            for path, slot, alt, offset in subset:
+                slots = paths[path]
+                if slot == len(slots):
+                    accepting.add(number)
+                    continue
+                spelling = slots[slot][alt]
+                if offset < len(spelling):
+                    moves.setdefault(spelling[offset], []).append((path, slot, alt, offset + 1))
+            edges = {}
+            for char, targets in moves.items():
+                target = closure(targets)
+                if target not in numbers:
+                    numbers[target] = len(subsets)
+                    subsets.append(target)
+                edges[char] = numbers[target]
+            transitions.append(edges)
+        return cls(transitions, frozenset(accepting))
+
+    def match(self, answer: str) -> MatchResult:
+        """Check a typed answer, which may be incomplete."""
+        answer = normalize_answer(answer)
+        if self.prefixes is not None:
+            result = self.prefixes.get(answer)
+            if result is not None:
+                return result
+        state = 0
+        transitions = self.transitions
+        for i, char in enumerate(answer):
+            state = transitions[state].get(char)
+            if state is None:
+                return MatchResult("wrong", i)
+        if state in self.accepting:
+            return MatchResult("correct", len(answer))
+        return MatchResult("partial", len(answer))
+
+
+@dataclass
+class _CacheEntry:
+    version: Tuple[int, ...]
+    source: Tuple[str, str]
+    matcher: RomajiMatcher
+
+
+class MatcherCache:
+    """Bounded LRU of compiled matchers by word ID, checked against the words table version."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[int, _CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.compiles = 0
+
+    def get(self, word_id: int) -> Optional[RomajiMatcher]:
+        """The matcher of a word, if cached and no word was written since."""
+        entry = self._entries.get(word_id)
+        if entry is None or entry.version != table_versions.get(("words",)):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(word_id)
+        self.hits += 1
+        return entry.matcher
+
+    def put(self, word_id: int, parts: Sequence[Dict], romaji: str) -> RomajiMatcher:
+        """
+        Cache the matcher for a word's current parts and romaji.
+
+        Recompiles only if they changed since the cached matcher was built.
+        """
+        source = (repr(parts), romaji)
+        entry = self._entries.get(word_id)
+        if entry is None or entry.source != source:
+            self.compiles += 1
+            entry = _CacheEntry((), source, RomajiMatcher.compile(parts, romaji))
+        entry.version = table_versions.get(("words",))
+        if self.maxsize > 0:
+            self._entries[word_id] = entry
+            self._entries.move_to_end(word_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry.matcher
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.compiles = 0
+
+
+matcher_cache = MatcherCache(maxsize=settings.MATCHER_CACHE_SIZE)
@@ -2,13 +2,23 @@ from typing import List, Optional, Tuple
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.base import CountMode
 from app.crud.session import session
 from app.crud.group import group
 from app.crud.word import word
 from app.models.session import Session
 from app.models.activity import Activity
-from app.schemas.session import SessionCreate, WordReviewCreate
+from app.models.word_review_item import WordReviewItem
+from app.schemas.session import (
+    SessionCreate,
+    SessionStats,
+    SessionStatsItem,
+    SessionSummary,
+    WordReviewCreate,
+    WordReviewBatchResult
+)
 from app.core.exceptions import AppHTTPException
+from app.services.review_buffer import ReviewBuffer
 
 
 class SessionService:
@@ -19,8 +29,10 @@ class SessionService:
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
-    ) -> Tuple[List[Session], int]:
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[Session], Optional[int]]:
         """
         Get multiple sessions with pagination and sorting.
         
@@ -29,6 +41,8 @@ class SessionService:
             limit: Maximum number of records to return
             order_by: Field to sort by
             order: Sort order ("asc" or "desc")
+            cursor: Opaque keyset cursor; when given, skip is ignored
+            count_mode: "exact" for COUNT(*), "estimate" for a cached count, "none" to skip it
             
         Returns:
             Tuple of (list of sessions, total count)
@@ -38,9 +52,61 @@ class SessionService:
             skip=skip,
             limit=limit,
             order_by=order_by,
-            order=order
+            order=order,
+            cursor=cursor,
+            count_mode=count_mode
         )
 
+    @staticmethod
+    async def get_session_summaries(
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[SessionSummary], Optional[int]]:
+        """
+        Get multiple sessions with review statistics instead of their reviews.
+
+        The page of sessions and the statistics of all of them take one
+        query each, however many reviews the sessions have.
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            order_by: Field to sort by
+            order: Sort order ("asc" or "desc")
+            cursor: Opaque keyset cursor; when given, skip is ignored
+            count_mode: "exact" for COUNT(*), "estimate" for a cached count, "none" to skip it
+            
+        Returns:
+            Tuple of (list of session summaries, total count)
+        """
+        sessions, total = await session.get_multi(
+            db,
+            skip=skip,
+            limit=limit,
+            order_by=order_by,
+            order=order,
+            cursor=cursor,
+            count_mode=count_mode
+        )
+        stats = await session.get_statistics_many(db, (s.id for s in sessions))
+        summaries = [
+            SessionSummary(
+                id=s.id,
+                group_id=s.group_id,
+                activity_id=s.activity_id,
+                created_at=s.created_at,
+                **stats.get(s.id, SessionStats()).model_dump()
+            )
+            for s in sessions
+        ]
+        return summaries, total
+
     @staticmethod
     async def get_session(
         db: AsyncSession,
@@ -49,6 +115,40 @@ class SessionService:
         """Get a session by ID with its reviews."""
         return await session.get_with_reviews(db, session_id)
 
+    @staticmethod
+    async def get_session_reviews(
+        db: AsyncSession,
+        session_id: int,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[WordReviewItem], int]:
+        """
+        Get one page of a session's reviews, oldest first.
+        
+        Args:
+            session_id: ID of the session
+            skip: Number of reviews to skip
+            limit: Maximum number of reviews to return
+            cursor: Opaque keyset cursor; when given, skip is ignored
+            
+        Returns:
+            Tuple of (list of reviews, total reviews of the session)
+            
+        Raises:
+            ValueError: If session doesn't exist or the cursor is invalid
+        """
+        if not await session.get(db, session_id):
+            raise ValueError(f"Session {session_id} not found")
+        return await session.get_reviews(
+            db,
+            session_id,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
+        )
+
     @staticmethod
     async def create_session(
         db: AsyncSession,
@@ -143,6 +243,121 @@ class SessionService:
             "created_at": review.created_at
         }
 
+    @staticmethod
+    async def add_reviews(
+        db: AsyncSession,
+        *,
+        session_id: int,
+        reviews: List[WordReviewCreate]
+    ) -> List[WordReviewBatchResult]:
+        """
+        Add many word reviews to a session in one transaction.
+
+        Words are validated with a single set-based query. Items for unknown
+        words or words outside the session's group are rejected individually;
+        the remaining items are inserted together.
+        
+        Args:
+            session_id: ID of the session
+            reviews: Reviews to log, each with word_id and correct status
+            
+        Returns:
+            One result per item, in request order
+            
+        Raises:
+            ValueError: If session doesn't exist
+        """
+        results, accepted = await SessionService._check_reviews(db, session_id, reviews)
+        created = await session.create_word_reviews(
+            db,
+            session_id=session_id,
+            reviews=[(result.word_id, result.correct) for result in accepted]
+        )
+        for result, row in zip(accepted, created):
+            result.id = row["id"]
+
+        return results
+
+    @staticmethod
+    async def _check_reviews(
+        db: AsyncSession,
+        session_id: int,
+        reviews: List[WordReviewCreate]
+    ) -> Tuple[List[WordReviewBatchResult], List[WordReviewBatchResult]]:
+        """
+        Validate reviews for a session with one set-based query.
+
+        Returns:
+            Tuple of (one result per review in order, with the reason for
+            rejected ones, the accepted results)
+
+        Raises:
+            ValueError: If session doesn't exist
+        """
+        db_session = await session.get(db, session_id)
+        if not db_session:
+            raise ValueError(f"Session {session_id} not found")
+
+        membership = await word.get_group_membership(
+            db,
+            word_ids=(review.word_id for review in reviews),
+            group_id=db_session.group_id
+        )
+
+        results = []
+        accepted = []
+        for index, review in enumerate(reviews):
+            result = WordReviewBatchResult(
+                index=index,
+                word_id=review.word_id,
+                correct=review.correct
+            )
+            if review.word_id not in membership:
+                result.error = f"Word {review.word_id} not found"
+            elif not membership[review.word_id]:
+                result.error = f"Word {review.word_id} does not belong to the session's group"
+            else:
+                accepted.append(result)
+            results.append(result)
+        return results, accepted
+
+    @staticmethod
+    async def queue_review(
+        db: AsyncSession,
+        buffer: ReviewBuffer,
+        *,
+        session_id: int,
+        word_id: int,
+        correct: bool
+    ) -> dict:
+        """
+        Validate a word review and hand it to the write-behind buffer.
+
+        The checks are those of add_review, but the review is written later
+        together with others, so it has no ID yet.
+        
+        Args:
+            buffer: Running write-behind buffer
+            session_id: ID of the session
+            word_id: ID of the word being reviewed
+            correct: Whether the answer was correct
+            
+        Returns:
+            The queued review, without an ID
+            
+        Raises:
+            ValueError: If session or word doesn't exist or word isn't in the session's group
+            ReviewBufferUnavailable: If the buffer stays full
+        """
+        results, accepted = await SessionService._check_reviews(
+            db,
+            session_id,
+            [WordReviewCreate(word_id=word_id, correct=correct)]
+        )
+        if not accepted:
+            raise ValueError(results[0].error)
+        return await buffer.submit(session_id=session_id, word_id=word_id, correct=correct)
+
     @staticmethod
     async def get_session_stats(
         db: AsyncSession,
@@ -152,4 +367,29 @@ class SessionService:
         stats = await session.get_session_statistics(db, session_id)
         if not stats:
             raise ValueError(f"Session {session_id} not found")
-        return stats.dict() 
\ No newline at end of file
+        return stats.dict()
+
+    @staticmethod
+    async def get_sessions_stats(
+        db: AsyncSession,
+        session_ids: List[int]
+    ) -> Tuple[List[SessionStatsItem], List[int]]:
+        """
+        Get statistics for many sessions with one grouped query.
+        
+        Args:
+            session_ids: IDs of the sessions; duplicates are answered once
+            
+        Returns:
+            Tuple of (statistics in request order, zeroed for sessions
+            without reviews, IDs of sessions that don't exist)
+        """
+        stats = await session.get_statistics_many(db, session_ids)
+        items = []
+        missing = []
+        for session_id in dict.fromkeys(session_ids):
+            if session_id in stats:
+                items.append(SessionStatsItem(session_id=session_id, **stats[session_id].model_dump()))
+            else:
+                missing.append(session_id)
+        return items, missing
@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.group import group
+from app.crud.word_schedule import word_schedule
+from app.schemas.study import DueWord
+from app.schemas.word import Word as WordSchema
+
+
+class StudyService:
+    @staticmethod
+    async def get_due_words(
+        db: AsyncSession,
+        *,
+        group_id: Optional[int] = None,
+        limit: int = 20,
+        now: Optional[datetime] = None
+    ) -> List[DueWord]:
+        """
+        Get the words due for review, most overdue first.
+        
+        Args:
+            group_id: Only words of this group
+            limit: Maximum number of words to return
+            now: Point in time to check against, the current time by default
+            
+        Returns:
+            List of due words with their schedules
+            
+        Raises:
+            ValueError: If group doesn't exist
+        """
+        if group_id is not None and not await group.get(db, group_id):
+            raise ValueError(f"Group {group_id} not found")
+        due = await word_schedule.get_due(
+            db,
+            now=now or datetime.utcnow(),
+            group_id=group_id,
+            limit=limit
+        )
+        return [
+            DueWord(
+                **WordSchema.model_validate(db_word).model_dump(),
+                repetitions=schedule.repetitions,
+                interval_days=schedule.interval_days,
+                ease=schedule.ease,
+                last_reviewed_at=schedule.last_reviewed_at,
+                next_due=schedule.next_due
+            )
+            for db_word, schedule in due
+        ]
@@ -0,0 +1,135 @@
+"""
+Whole-group word packs for games.
+
+A pack holds every word of a group in one columnar JSON document, so a
+game can preload a group with one request instead of paging through
+/groups/{id}. Each field is one array in position order, and the parts
+of a word are [kanji, syllable, ...] arrays:
+
+    {"format": 1, "group": {"id": 1, "name": "Verbs"}, "count": 2,
+     "id": [7, 9], "kanji": ["動かす", ...], "romaji": ["doukasu", ...],
+     "english": ["to move", ...],
+     "parts": [[["動", "do", "u"], ["か", "ka"], ["す", "su"]], ...]}
+
+Packs carry no review statistics, so reviews never change them. A pack is
+encoded once, together with a gzip copy, and its ETag is a hash of its
+content: it is the same on every worker and after restarts, and survives
+writes that leave the group's words as they were.
+"""
+
+import gzip
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import ujson
+
+from app.core.config import get_settings
+from app.core.invalidation import table_versions
+from app.core.responses import envelope
+
+settings = get_settings()
+
+PACK_FORMAT = 1
+# A pack is rebuilt after a write to any of these
+PACK_TABLES = ("groups", "word_groups", "words")
+GZIP_LEVEL = 6
+
+
+@dataclass(frozen=True)
+class EncodedPack:
+    version: Tuple[int, ...]  # Versions of PACK_TABLES the pack was read at
+    digest: str
+    count: int
+    body: bytes
+    gzip_body: Optional[bytes]  # None when compressing does not make it smaller
+
+    def etag(self, gzipped: bool) -> str:
+        """Strong ETag of the plain or gzip-encoded body."""
+        return f'"{self.digest}-gzip"' if gzipped else f'"{self.digest}"'
+
+
+def encode_pack(
+    version: Tuple[int, ...],
+    group_id: int,
+    name: str,
+    rows: Sequence[Tuple[int, str, str, str, Optional[str]]]
+) -> EncodedPack:
+    """Encode (id, kanji, romaji, english, parts JSON text) rows of a group as a pack."""
+    parts: List[List[Dict]] = [ujson.loads(row[4]) if row[4] else [] for row in rows]
+    pack = {
+        "format": PACK_FORMAT,
+        "group": {"id": group_id, "name": name},
+        "count": len(rows),
+        "id": [row[0] for row in rows],
+        "kanji": [row[1] for row in rows],
+        "romaji": [row[2] for row in rows],
+        "english": [row[3] for row in rows],
+        "parts": [
+            [[part.get("kanji"), *(part.get("romaji") or [])] for part in word_parts]
+            for word_parts in parts
+        ],
+    }
+    body = ujson.dumps(
+        envelope(pack), ensure_ascii=False, escape_forward_slashes=False
+    ).encode("utf-8")
+    gzip_body = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    return EncodedPack(
+        version=version,
+        digest=hashlib.blake2b(body, digest_size=12).hexdigest(),
+        count=len(rows),
+        body=body,
+        gzip_body=gzip_body if len(gzip_body) < len(body) else None,
+    )
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip."""
+    qualities = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        params = params.strip().lower()
+        try:
+            quality = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            quality = 0.0
+        qualities[name.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+class PackCache:
+    """Bounded LRU of encoded packs by group ID, checked against the table versions."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[int, EncodedPack]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, group_id: int) -> Optional[EncodedPack]:
+        """The pack of a group, if cached and none of PACK_TABLES was written since."""
+        pack = self._entries.get(group_id)
+        if pack is None or pack.version != table_versions.get(PACK_TABLES):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(group_id)
+        self.hits += 1
+        return pack
+
+    def put(self, group_id: int, pack: EncodedPack) -> None:
+        """Store a pack, evicting the least recently used ones over maxsize."""
+        if self.maxsize <= 0:
+            return
+        self._entries[group_id] = pack
+        self._entries.move_to_end(group_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+pack_cache = PackCache(maxsize=settings.WORD_PACK_CACHE_SIZE)
@@ -2,9 +2,12 @@ from typing import Dict, List, Optional, Tuple
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.base import CountMode
 from app.crud.word import word
 from app.models.word import Word
-from app.schemas.word import WordCreate, WordUpdate, WordPart
+from app.schemas.word import AnswerCheckResult, RelatedWord, WordCreate, WordUpdate, WordPart
+from app.schemas.word import Word as WordSchema
+from app.services.romaji_matcher import matcher_cache
 from app.core.exceptions import AppHTTPException
 
 
@@ -21,8 +24,10 @@ class WordService:
         skip: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order: Optional[str] = "asc"
-    ) -> Tuple[List[Word], int]:
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> Tuple[List[Word], Optional[int]]:
         """
         Get words with their review statistics.
         
@@ -31,6 +36,8 @@ class WordService:
             limit: Maximum number of records to return
             order_by: Field to sort by
             order: Sort order ('asc' or 'desc')
+            cursor: Opaque keyset cursor; when given, skip is ignored
+            count_mode: "exact" for COUNT(*), "estimate" for a cached count, "none" to skip it
             
         Returns:
             Tuple of (list of words, total count)
@@ -40,9 +47,149 @@ class WordService:
             skip=skip,
             limit=limit,
             order_by=order_by,
-            order=order
+            order=order,
+            cursor=cursor,
+            count_mode=count_mode
+        )
+
+    @staticmethod
+    async def search_words(
+        db: AsyncSession,
+        *,
+        q: str,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Word], int]:
+        """
+        Search words by kanji, romaji, English or the kanji of their parts.
+        
+        Args:
+            q: Search text; every term is matched as a prefix
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (list of words in rank order, total number of matches)
+        """
+        return await word.search(db, q=q, skip=skip, limit=limit)
+
+    @staticmethod
+    async def get_words_by_component(
+        db: AsyncSession,
+        *,
+        component: str,
+        reading: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Word], int]:
+        """
+        Get words containing a kanji component.
+        
+        Args:
+            component: Kanji of a word part, e.g. 動
+            reading: Only match parts read this way (romaji), e.g. "dou"
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (list of words by ID, total number of matches)
+        """
+        return await word.get_by_component(
+            db,
+            component=component,
+            reading=reading,
+            skip=skip,
+            limit=limit
         )
 
+    @staticmethod
+    async def get_related_words(
+        db: AsyncSession,
+        word_id: int,
+        *,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[RelatedWord], int]:
+        """
+        Get words sharing kanji components with a word, most shared first.
+        
+        Args:
+            word_id: ID of the word
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (list of related words with the components they share,
+            total number of related words)
+            
+        Raises:
+            ValueError: If word doesn't exist
+        """
+        if not await word.get(db, word_id):
+            raise ValueError(f"Word {word_id} not found")
+        related, total = await word.get_related(db, word_id=word_id, skip=skip, limit=limit)
+        items = [
+            RelatedWord(
+                **WordSchema.model_validate(db_word).model_dump(),
+                shared_components=components
+            )
+            for db_word, components in related
+        ]
+        return items, total
+
+    @staticmethod
+    async def check_answers(
+        db: AsyncSession,
+        answers: List[Tuple[int, str]]
+    ) -> List[AnswerCheckResult]:
+        """
+        Check typed romaji answers against the readings of their words.
+        
+        Matchers come from the in-memory cache; the readings of words that
+        are not cached (or were written since) are loaded in one query.
+        
+        Args:
+            answers: (word_id, answer) pairs; answers may be incomplete
+            
+        Returns:
+            One result per answer, in order, with its status or an error
+            for words that don't exist
+        """
+        matchers = {}
+        for word_id, _ in answers:
+            if word_id not in matchers:
+                matchers[word_id] = matcher_cache.get(word_id)
+        stale = [word_id for word_id, matcher in matchers.items() if matcher is None]
+        if stale:
+            readings = await word.get_readings(db, stale)
+            for word_id, (parts, romaji) in readings.items():
+                matchers[word_id] = matcher_cache.put(word_id, parts, romaji)
+
+        results = []
+        for word_id, answer in answers:
+            matcher = matchers[word_id]
+            if matcher is None:
+                results.append(AnswerCheckResult(word_id=word_id, detail=f"Word {word_id} not found"))
+                continue
+            match = matcher.match(answer)
+            results.append(
+                AnswerCheckResult(word_id=word_id, status=match.status, matched=match.matched)
+            )
+        return results
+
+    @staticmethod
+    async def check_answer(db: AsyncSession, *, word_id: int, answer: str) -> AnswerCheckResult:
+        """
+        Check a typed romaji answer to one word.
+        
+        Raises:
+            ValueError: If word doesn't exist
+        """
+        result = (await WordService.check_answers(db, [(word_id, answer)]))[0]
+        if result.detail:
+            raise ValueError(result.detail)
+        return result
+
     @staticmethod
     async def create_word(
         db: AsyncSession,
@@ -0,0 +1 @@
+"""Performance benchmarks for the portal backend (not part of the test suite)."""
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Generate a synthetic portal database at a chosen scale.
+
+The schema comes from scripts/db/init_db.py, the one deployments use, and
+the rows from a seeded random generator, so the same arguments always
+produce the same database. Reviews only use words of their session's
+group, and groups.words_count, word_stats (a row for every word) and
+word_schedule are filled in consistently.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.data data.db [--words 10000] [--groups 100] ...
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import sqlite3
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List
+
+# init_db.py reads the settings on import, which require a database URL
+os.environ.setdefault("DATABASE_URL", "sqlite:///./data/benchmark.db")
+
+INIT_DB_SCRIPT = Path(__file__).parents[2] / "scripts" / "db" / "init_db.py"
+
+SYLLABLES = [
+    "a", "i", "u", "e", "o", "ka", "ki", "ku", "ke", "ko", "sa", "shi", "su",
+    "se", "so", "ta", "chi", "tsu", "te", "to", "na", "ni", "nu", "ne", "no",
+    "ha", "hi", "fu", "he", "ho", "ma", "mi", "mu", "me", "mo", "ya", "yu",
+    "yo", "ra", "ri", "ru", "re", "ro", "wa", "n", "ga", "gi", "gu", "ge",
+    "go", "za", "ji", "zu", "ze", "zo", "da", "de", "do", "ba", "bi", "bu",
+]
+ENGLISH = [
+    "to eat", "to drink", "to see", "to go", "to come", "to read", "to write",
+    "big", "small", "new", "old", "hot", "cold", "red", "blue", "book",
+    "water", "mountain", "river", "tree", "person", "dog", "cat", "school",
+]
+# Common-use kanji block, so part characters are indexed by the search
+KANJI_FIRST, KANJI_LAST = 0x4E00, 0x4FFF
+
+
+@dataclass
+class DatasetSpec:
+    words: int = 10_000
+    groups: int = 100
+    group_size: int = 100
+    activities: int = 5
+    sessions: int = 5_000
+    reviews: int = 100_000
+    seed: int = 42
+
+
+def load_init_db() -> ModuleType:
+    """Import scripts/db/init_db.py, which is not part of the app package."""
+    spec = importlib.util.spec_from_file_location("init_db", INIT_DB_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _word(rng: random.Random, word_id: int) -> tuple:
+    parts = []
+    for _ in range(rng.randint(1, 3)):
+        readings = [rng.choice(SYLLABLES) for _ in range(rng.randint(1, 2))]
+        parts.append({"kanji": chr(rng.randint(KANJI_FIRST, KANJI_LAST)), "romaji": readings})
+    kanji = "".join(part["kanji"] for part in parts)
+    romaji = "".join("".join(part["romaji"]) for part in parts)
+    english = f"{rng.choice(ENGLISH)} {word_id}"
+    parts_kanji = " ".join(dict.fromkeys(part["kanji"] for part in parts))
+    return word_id, kanji, romaji, english, json.dumps(parts, ensure_ascii=False), parts_kanji, parts
+
+
+def generate(path: Path, spec: DatasetSpec) -> Dict[str, int]:
+    """
+    Create a database at `path` filled according to `spec`.
+
+    Raises:
+        FileExistsError: If `path` already exists
+
+    Returns:
+        Number of rows written per table
+    """
+    if path.exists():
+        raise FileExistsError(f"{path} already exists")
+    init_db = load_init_db()
+    # Imported here: importing the app reads the settings, and callers such
+    # as benchmarks.load set DATABASE_URL after importing this module
+    from app.crud.word_schedule import sm2_step
+    rng = random.Random(spec.seed)
+    start = datetime(2026, 1, 1)
+
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.executescript(init_db.CREATE_TABLES_SQL + init_db.CREATE_INDEXES_SQL)
+
+        words = [_word(rng, word_id) for word_id in range(1, spec.words + 1)]
+        conn.executemany(
+            "INSERT INTO words (id, kanji, romaji, english, parts) VALUES (?, ?, ?, ?, ?)",
+            [row[:5] for row in words],
+        )
+        conn.executemany(
+            "INSERT INTO words_fts (rowid, kanji, romaji, english, parts_kanji) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(row[0], row[1], row[2], row[3], row[5]) for row in words],
+        )
+        # Every generated part is a single kanji
+        conn.executemany(
+            "INSERT INTO word_parts (word_id, position, component, reading) VALUES (?, ?, ?, ?)",
+            [
+                (row[0], position, part["kanji"], "".join(part["romaji"]))
+                for row in words
+                for position, part in enumerate(row[6])
+            ],
+        )
+
+        group_size = min(spec.group_size, spec.words)
+        group_words: Dict[int, List[int]] = {
+            group_id: rng.sample(range(1, spec.words + 1), group_size)
+            for group_id in range(1, spec.groups + 1)
+        }
+        conn.executemany(
+            "INSERT INTO groups (id, name, words_count) VALUES (?, ?, ?)",
+            [(group_id, f"Group {group_id}", group_size) for group_id in group_words],
+        )
+        conn.executemany(
+            "INSERT INTO word_groups (word_id, group_id, position) VALUES (?, ?, ?)",
+            [
+                (word_id, group_id, position)
+                for group_id, ids in group_words.items()
+                for position, word_id in enumerate(ids)
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO activities (id, name, url, description) VALUES (?, ?, ?, ?)",
+            [
+                (activity_id, f"Activity {activity_id}",
+                 f"activity-{activity_id}", "Synthetic activity")
+                for activity_id in range(1, spec.activities + 1)
+            ],
+        )
+
+        # Sessions spread over 90 days, each studying one group
+        session_span = timedelta(days=90) / max(spec.sessions, 1)
+        sessions = [
+            (session_id, rng.randint(1, spec.groups), rng.randint(1, spec.activities),
+             start + session_span * session_id)
+            for session_id in range(1, spec.sessions + 1)
+        ]
+        conn.executemany(
+            "INSERT INTO sessions (id, group_id, activity_id, created_at) VALUES (?, ?, ?, ?)",
+            sessions,
+        )
+        reviews = []
+        for _ in range(spec.reviews):
+            session_id, group_id, _, created_at = rng.choice(sessions)
+            reviews.append((
+                rng.choice(group_words[group_id]),
+                session_id,
+                rng.random() < 0.7,
+                created_at + timedelta(seconds=rng.randint(1, 1800)),
+            ))
+        conn.executemany(
+            "INSERT INTO word_review_items (word_id, session_id, correct, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            reviews,
+        )
+        conn.execute(
+            "INSERT INTO word_stats (word_id, correct_count, wrong_count, last_reviewed_at) "
+            "SELECT words.id, COALESCE(SUM(correct), 0), COALESCE(SUM(NOT correct), 0), "
+            "MAX(created_at) FROM words LEFT JOIN word_review_items ON word_id = words.id "
+            "GROUP BY words.id"
+        )
+        # Replay each word's reviews in order, as CRUDWordSchedule does
+        schedules: Dict[int, Dict] = {}
+        for word_id, _, correct, created_at in sorted(reviews, key=lambda r: (r[0], r[3])):
+            schedules[word_id] = sm2_step(schedules.get(word_id), correct, created_at)
+        conn.executemany(
+            "INSERT INTO word_schedule "
+            "(word_id, repetitions, interval_days, ease, last_reviewed_at, next_due) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (word_id, state["repetitions"], state["interval_days"], state["ease"],
+                 state["last_reviewed_at"], state["next_due"])
+                for word_id, state in schedules.items()
+            ],
+        )
+        # Counts and positions were written with the groups; triggers take over from here
+        for statement in init_db.CREATE_TRIGGERS_SQL:
+            conn.execute(statement)
+        conn.commit()
+        return {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in (
+                "words", "groups", "word_groups", "activities",
+                "sessions", "word_review_items", "word_stats", "word_schedule",
+            )
+        }
+    finally:
+        conn.close()
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add one option per DatasetSpec field."""
+    for name, default in asdict(DatasetSpec()).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default)
+
+
+def spec_from_args(args: argparse.Namespace) -> DatasetSpec:
+    return DatasetSpec(**{name: getattr(args, name) for name in asdict(DatasetSpec())})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path)
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+    counts = generate(args.path, spec_from_args(args))
+    for table, count in counts.items():
+        print(f"{table:<20}{count:>10}")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Benchmark the response envelope on a 100-item /words page.
+
+Compares the legacy `wrap_response` middleware, which buffered every JSON
+body and ran json.loads/json.dumps on it, against `EnvelopeJSONResponse`,
+which applies the envelope once while the response is rendered.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.envelope [--requests 300]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import AsyncGenerator, Dict, List
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./data/benchmark.db")
+# Measure rendering, not replays from the response cache
+os.environ.setdefault("RESPONSE_CACHE_SIZE", "0")
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.v1.router import api_router
+from app.core.config import get_settings
+from app.core.database import get_db, get_read_db
+from app.main import app as envelope_app
+from app.models.base import Base
+from app.models.word import Word
+import app.models.group  # noqa: F401
+import app.models.activity  # noqa: F401
+
+settings = get_settings()
+PAGE_URL = f"{settings.API_V1_PREFIX}/words?per_page=100"
+
+
+async def legacy_wrap_response(request: Request, call_next):
+    """The middleware this benchmark replaces, kept verbatim for comparison."""
+    response = await call_next(request)
+    if response.headers.get("content-type") != "application/json":
+        return response
+    body = b""
+    async for chunk in response.body_iterator:
+        body += chunk
+    if not body:
+        return JSONResponse(
+            content={"data": None, "error": None},
+            status_code=response.status_code,
+        )
+    data = json.loads(body)
+    if not isinstance(data, dict) or ("data" not in data and "error" not in data):
+        data = {"data": data, "error": None}
+    return Response(
+        content=json.dumps(data),
+        status_code=response.status_code,
+        headers={
+            "content-type": "application/json",
+            **{
+                k: v for k, v in response.headers.items()
+                if k.lower() not in ("content-type", "content-length")
+            }
+        },
+    )
+
+
+def build_legacy_app() -> FastAPI:
+    legacy = FastAPI()
+    legacy.include_router(api_router, prefix=settings.API_V1_PREFIX)
+    legacy.middleware("http")(legacy_wrap_response)
+    return legacy
+
+
+async def seed(session_factory: async_sessionmaker, count: int = 100) -> None:
+    async with session_factory() as session:
+        for i in range(count):
+            session.add(Word(
+                kanji=f"単語{i}",
+                romaji=f"tango{i:03d}",
+                english=f"word number {i}",
+                parts=[
+                    {"kanji": "単", "romaji": ["tan"]},
+                    {"kanji": "語", "romaji": ["go"]},
+                ]
+            ))
+        await session.commit()
+
+
+async def measure(app: FastAPI, requests: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    peaks: List[int] = []
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(20):  # warm up
+            (await client.get(PAGE_URL)).raise_for_status()
+
+        tracemalloc.start()
+        for _ in range(requests):
+            tracemalloc.reset_peak()
+            start_mem = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            response = await client.get(PAGE_URL)
+            latencies.append((time.perf_counter() - start) * 1000)
+            peaks.append(tracemalloc.get_traced_memory()[1] - start_mem)
+            assert len(response.json()["data"]["items"]) == 100
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "peak_alloc_kib": statistics.median(peaks) / 1024,
+        "body_bytes": len(response.content),
+    }
+
+
+async def main(requests: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        await seed(session_factory)
+
+        async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+            async with session_factory() as session:
+                yield session
+
+        results = {}
+        for name, app in [("legacy middleware", build_legacy_app()),
+                          ("envelope response", envelope_app)]:
+            app.dependency_overrides[get_db] = override_get_db
+            app.dependency_overrides[get_read_db] = override_get_db
+            results[name] = await measure(app, requests)
+            app.dependency_overrides.clear()
+        await engine.dispose()
+
+    print(f"GET {PAGE_URL} x {requests}")
+    print(f"{'variant':<20}{'p50 ms':>10}{'p95 ms':>10}{'peak KiB':>12}{'bytes':>10}")
+    for name, r in results.items():
+        print(
+            f"{name:<20}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}"
+            f"{r['peak_alloc_kib']:>12.1f}{r['body_bytes']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Load-test the API against a synthetic database.
+
+Generates a database with `benchmarks.data` (or reuses one given with
+--database), points the app at it and drives `app.main:app` in process
+through httpx's ASGI transport, so no server or network is involved.
+Each endpoint gets the same number of requests, spread over --concurrency
+clients and over random IDs and pages. Latency percentiles and throughput
+per endpoint are printed and saved as JSON for `benchmarks.report`.
+
+The response cache is off unless --cache is given, so repeated URLs
+measure the database path rather than cache replays. --write-behind
+queues review POSTs in the write-behind buffer instead of committing
+each one.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.load [--requests 200] [--concurrency 4] [--words 10000] ...
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.data import DatasetSpec, add_spec_arguments, generate, spec_from_args
+from benchmarks.report import print_table, run_metadata, save, summarize
+
+# Builds the URL (and JSON body) of one request from the random generator
+RequestFactory = Callable[[random.Random], Tuple[str, Optional[Dict[str, Any]]]]
+
+
+@dataclass
+class Endpoint:
+    name: str
+    method: str
+    build: RequestFactory
+
+
+def review_targets(path: Path, rng: random.Random, count: int = 200) -> List[Tuple[int, int]]:
+    """(session_id, word_id) pairs that pass review validation."""
+    conn = sqlite3.connect(path)
+    try:
+        (sessions,) = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        targets = []
+        for session_id in rng.sample(range(1, sessions + 1), min(count, sessions)):
+            row = conn.execute(
+                "SELECT s.id, wg.word_id FROM sessions s "
+                "JOIN word_groups wg ON wg.group_id = s.group_id "
+                "WHERE s.id = ? LIMIT 1",
+                (session_id,),
+            ).fetchone()
+            if row:
+                targets.append(row)
+        return targets
+    finally:
+        conn.close()
+
+
+def endpoints(prefix: str, spec: DatasetSpec, targets: List[Tuple[int, int]]) -> List[Endpoint]:
+    """The requests a study session and the admin pages make, read-heavy first."""
+    pages = max(spec.words // 20, 1)
+
+    def review(rng: random.Random):
+        session_id, word_id = rng.choice(targets)
+        return f"{prefix}/sessions/{session_id}/review", {"word_id": word_id, "correct": True}
+
+    return [
+        Endpoint("words_first_page", "GET", lambda rng: (f"{prefix}/words", None)),
+        Endpoint("words_random_page", "GET", lambda rng: (
+            f"{prefix}/words?page={rng.randint(1, pages)}&sort_by=english", None)),
+        Endpoint("words_by_correct_count", "GET", lambda rng: (
+            f"{prefix}/words?sort_by=correct_count&order=desc&page={rng.randint(1, 50)}", None)),
+        Endpoint("words_search", "GET", lambda rng: (
+            f"{prefix}/words/search?q={rng.choice(['ka', 'to', 'shi', 'wat', 'big'])}", None)),
+        Endpoint("word_detail", "GET", lambda rng: (
+            f"{prefix}/words/{rng.randint(1, spec.words)}", None)),
+        Endpoint("groups", "GET", lambda rng: (f"{prefix}/groups?sort_by=words_count", None)),
+        Endpoint("group_words", "GET", lambda rng: (
+            f"{prefix}/groups/{rng.randint(1, spec.groups)}", None)),
+        Endpoint("activities", "GET", lambda rng: (f"{prefix}/activities", None)),
+        Endpoint("sessions", "GET", lambda rng: (
+            f"{prefix}/sessions?sort_by=created_at&order=desc", None)),
+        Endpoint("sessions_summary", "GET", lambda rng: (
+            f"{prefix}/sessions?sort_by=created_at&order=desc&include=summary", None)),
+        Endpoint("session_reviews", "GET", lambda rng: (
+            f"{prefix}/sessions/{rng.randint(1, spec.sessions)}/reviews", None)),
+        Endpoint("session_detail", "GET", lambda rng: (
+            f"{prefix}/sessions/{rng.randint(1, spec.sessions)}", None)),
+        Endpoint("session_review", "POST", review),
+    ]
+
+
+async def run_endpoint(
+    client,
+    endpoint: Endpoint,
+    *,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    seed: int
+) -> Dict[str, Any]:
+    """Send `requests` requests from `concurrency` clients and summarize them."""
+    rng = random.Random(seed)
+    plan = [endpoint.build(rng) for _ in range(warmup + requests)]
+    for url, body in plan[:warmup]:
+        await client.request(endpoint.method, url, json=body)
+
+    queue = iter(plan[warmup:])
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for url, body in queue:
+            start = time.perf_counter()
+            response = await client.request(endpoint.method, url, json=body)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return {
+        "method": endpoint.method,
+        "example": plan[warmup][0],
+        **summarize(latencies, errors, time.perf_counter() - start),
+    }
+
+
+async def drive(args: argparse.Namespace, spec: DatasetSpec, path: Path) -> Dict[str, Any]:
+    from httpx import ASGITransport, AsyncClient
+    from app.core.config import get_settings
+    from app.main import app
+
+    settings = get_settings()
+    targets = review_targets(path, random.Random(spec.seed))
+    results: Dict[str, Any] = {}
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            for i, endpoint in enumerate(endpoints(settings.API_V1_PREFIX, spec, targets)):
+                if args.only and endpoint.name not in args.only:
+                    continue
+                results[endpoint.name] = await run_endpoint(
+                    client,
+                    endpoint,
+                    requests=args.requests,
+                    concurrency=args.concurrency,
+                    warmup=args.warmup,
+                    seed=spec.seed + i,
+                )
+    return {
+        "meta": run_metadata(
+            dataset=asdict(spec),
+            requests=args.requests,
+            concurrency=args.concurrency,
+            warmup=args.warmup,
+            response_cache=settings.RESPONSE_CACHE_SIZE,
+            journal_mode=settings.SQLITE_JOURNAL_MODE,
+            review_write_behind=settings.REVIEW_WRITE_BEHIND,
+        ),
+        "endpoints": results,
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    spec = spec_from_args(args)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.database or Path(tmp) / "bench.db"
+        # Settings are read once, on first use, so configure the app first
+        os.environ["DATABASE_URL"] = f"sqlite://///{path.resolve()}"
+        if not args.cache:
+            os.environ["RESPONSE_CACHE_SIZE"] = "0"
+        if args.write_behind:
+            os.environ["REVIEW_WRITE_BEHIND"] = "true"
+        if not path.exists():
+            started = time.perf_counter()
+            generate(path, spec)
+            print(f"Generated {path} in {time.perf_counter() - started:.1f}s")
+        result = asyncio.run(drive(args, spec, path))
+
+    print_table(result)
+    print(f"Saved {save(result, args.output)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--cache", action="store_true", help="Keep the response cache on")
+    parser.add_argument("--only", nargs="*", help="Endpoint names to run")
+    parser.add_argument("--write-behind", action="store_true", help="Queue review POSTs in the write-behind buffer")
+    parser.add_argument("--database", type=Path, help="Database to reuse or generate")
+    parser.add_argument("--output", type=Path, help="Result file (default: results/<time>-<commit>.json)")
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+    # Keep the per-request logs of the app out of the measurements
+    logging.disable(logging.INFO)
+    main(args)
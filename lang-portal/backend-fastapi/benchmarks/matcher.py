@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Benchmark the romaji answer matcher behind POST /words/{id}/check.
+
+Replays typing every seed word one keystroke at a time, in a Hepburn and a
+Kunrei spelling, and reports checks per second for:
+
+- the compiled DFA (`RomajiMatcher.match`),
+- the DFA fetched from `matcher_cache` first, as the endpoint does on a hit,
+- a baseline that expands every accepted spelling into a list of strings
+  and tests the answer against each with startswith.
+
+Also reports the time to compile a matcher, paid once per word and again
+only when its readings change. A synthetic word of `--syllables` syllables
+with two spellings each shows how both approaches grow with the number of
+accepted spellings (2 ** syllables).
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.matcher [--rounds 20] [--syllables 12]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from itertools import product
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./data/benchmark.db")
+# Cache entries are checked against local table versions only
+os.environ.setdefault("CACHE_INVALIDATION", "local")
+
+from app.services.romaji_matcher import (
+    MatcherCache,
+    RomajiMatcher,
+    normalize_answer,
+    syllable_spellings
+)
+
+SEED_DIR = Path(__file__).parents[1] / "seed"
+
+
+def load_words() -> List[Dict]:
+    words = []
+    for word_file in sorted(SEED_DIR.glob("words.*.json")):
+        words.extend(json.loads(word_file.read_text(encoding="utf-8")))
+    return words
+
+
+def kunrei(word: Dict) -> str:
+    """The word typed with the last (Kunrei or IME) spelling of each syllable."""
+    return "".join(
+        syllable_spellings(syllable)[-1]
+        for part in word["parts"]
+        for syllable in part["romaji"]
+    )
+
+
+def expand(word: Dict) -> List[str]:
+    """Every accepted spelling of a word as a plain string."""
+    syllables = [
+        syllable_spellings(syllable)
+        for part in word["parts"]
+        for syllable in part["romaji"]
+    ]
+    return list(dict.fromkeys(
+        ["".join(combo) for combo in product(*syllables)] + [normalize_answer(word["romaji"])]
+    ))
+
+
+def expanded_check(spellings: Sequence[str], answer: str) -> str:
+    answer = normalize_answer(answer)
+    if answer in spellings:
+        return "correct"
+    if any(spelling.startswith(answer) for spelling in spellings):
+        return "partial"
+    return "wrong"
+
+
+def keystrokes(words: List[Dict]) -> List[Tuple[int, str]]:
+    """(word index, answer so far) for every prefix of two spellings of every word."""
+    checks = []
+    for i, word in enumerate(words):
+        for answer in (word["romaji"], kunrei(word)):
+            checks.extend((i, answer[:end]) for end in range(1, len(answer) + 1))
+    return checks
+
+
+def rate(run: Callable[[], None], checks: int, rounds: int) -> float:
+    """Median checks per second of `run` over `rounds` runs."""
+    run()  # warm up
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return checks / statistics.median(timings)
+
+
+def synthetic_word(syllables: int) -> Dict:
+    """A word whose every syllable has a Hepburn and a Kunrei spelling."""
+    cycle = ["shi", "tsu", "chi", "fu", "ji"]
+    romaji = [cycle[i % len(cycle)] for i in range(syllables)]
+    return {
+        "kanji": "合成",
+        "romaji": "".join(romaji),
+        "english": "synthetic",
+        "parts": [{"kanji": "合", "romaji": romaji}]
+    }
+
+
+def report(title: str, words: List[Dict], rounds: int) -> None:
+    checks = keystrokes(words)
+
+    start = time.perf_counter()
+    matchers = [RomajiMatcher.compile(w["parts"], w["romaji"]) for w in words]
+    compile_us = (time.perf_counter() - start) / len(words) * 1e6
+    states = statistics.mean(len(m.transitions) for m in matchers)
+
+    cache = MatcherCache(maxsize=len(words))
+    for i, w in enumerate(words):
+        cache.put(i, w["parts"], w["romaji"])
+    expanded = [expand(w) for w in words]
+
+    for i, answer in checks:
+        assert expanded_check(expanded[i], answer) == matchers[i].match(answer).status, answer
+
+    def run_dfa() -> None:
+        for i, answer in checks:
+            matchers[i].match(answer)
+
+    def run_cached() -> None:
+        for i, answer in checks:
+            cache.get(i).match(answer)
+
+    def run_expanded() -> None:
+        for i, answer in checks:
+            expanded_check(expanded[i], answer)
+
+    results = {
+        "compiled DFA": rate(run_dfa, len(checks), rounds),
+        "cache + DFA": rate(run_cached, len(checks), rounds),
+        "expanded strings": rate(run_expanded, len(checks), rounds),
+    }
+
+    spellings = statistics.mean(len(e) for e in expanded)
+    print(f"{title}: {len(words)} words, {len(checks)} keystroke checks per round, {rounds} rounds")
+    print(
+        f"compile: {compile_us:.1f} us/word, {states:.1f} DFA states and "
+        f"{spellings:.1f} spellings per word on average"
+    )
+    print(f"{'variant':<20}{'checks/s':>14}{'us/check':>10}")
+    for name, per_second in results.items():
+        print(f"{name:<20}{per_second:>14,.0f}{1e6 / per_second:>10.2f}")
+    print()
+
+
+def main(rounds: int, syllables: int) -> None:
+    report("seed words", load_words(), rounds)
+    report(f"{syllables} variant syllables", [synthetic_word(syllables)], rounds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--syllables", type=int, default=12)
+    args = parser.parse_args()
+    main(args.rounds, args.syllables)
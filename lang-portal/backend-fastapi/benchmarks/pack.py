@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark preloading a whole group: /groups/{id} pages against /pack.
+
+Generates a database with one group of --words words (5,000 by default),
+then fetches the group the way games did, page by page through
+/groups/{id}?per_page=100, and in one request through /groups/{id}/pack,
+plain and gzip-encoded. Reports bytes on the wire and latency of the first
+(uncached) and later requests, and of a revalidation answered with 304.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.pack [--words 5000] [--requests 50]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.data import DatasetSpec, generate
+
+PER_PAGE = 100
+
+
+async def timed(client, url: str, headers: Dict[str, str]):
+    start = time.perf_counter()
+    response = await client.get(url, headers=headers)
+    elapsed = (time.perf_counter() - start) * 1000
+    assert response.status_code in (200, 304), response.status_code
+    return response, elapsed
+
+
+async def fetch_pages(client, prefix: str, words: int) -> Dict[str, float]:
+    """Every page of group 1, as one preload; returns its bytes and time."""
+    size = 0
+    start = time.perf_counter()
+    for page in range(1, (words + PER_PAGE - 1) // PER_PAGE + 1):
+        response, _ = await timed(
+            client,
+            f"{prefix}/groups/1?per_page={PER_PAGE}&page={page}",
+            {"Accept-Encoding": "identity"},
+        )
+        size += len(response.content)
+    return {"bytes": size, "ms": (time.perf_counter() - start) * 1000}
+
+
+async def drive(words: int, requests: int) -> None:
+    from httpx import ASGITransport, AsyncClient
+    from app.core.config import get_settings
+    from app.main import app
+    from app.services.word_pack import pack_cache
+
+    prefix = get_settings().API_V1_PREFIX
+    pack_url = f"{prefix}/groups/1/pack"
+    rows: List[tuple] = []
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            await fetch_pages(client, prefix, words)  # warm up
+            pages = [await fetch_pages(client, prefix, words) for _ in range(3)]
+            # Pages are rebuilt on every request: the response cache is off
+            rows.append((
+                f"{words // PER_PAGE} pages of {PER_PAGE}",
+                pages[0]["bytes"],
+                pages[0]["ms"],
+                statistics.median(p["ms"] for p in pages[1:]),
+            ))
+
+            for name, encoding in [("pack", "identity"), ("pack, gzip", "gzip")]:
+                headers = {"Accept-Encoding": encoding}
+                cold = []
+                for _ in range(5):
+                    pack_cache.clear()
+                    response, elapsed = await timed(client, pack_url, headers)
+                    cold.append(elapsed)
+                warm = [(await timed(client, pack_url, headers))[1] for _ in range(requests)]
+                size = int(response.headers.get("content-length", len(response.content)))
+                rows.append((name, size, statistics.median(cold), statistics.median(warm)))
+
+            etag = response.headers["etag"]
+            revalidate = [
+                (await timed(client, pack_url, {"Accept-Encoding": "gzip", "If-None-Match": etag}))[1]
+                for _ in range(requests)
+            ]
+            rows.append(("pack, 304", 0, float("nan"), statistics.median(revalidate)))
+
+    print(f"Preloading a group of {words} words")
+    print(f"{'variant':<20}{'bytes':>12}{'first ms':>12}{'later ms':>12}")
+    for name, size, first, later in rows:
+        print(f"{name:<20}{size:>12,}{first:>12.1f}{later:>12.2f}")
+
+
+def main(args: argparse.Namespace) -> None:
+    spec = DatasetSpec(
+        words=args.words, groups=1, group_size=args.words,
+        sessions=100, reviews=1000,
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        # Settings are read once, on first use, so configure the app first
+        os.environ["DATABASE_URL"] = f"sqlite://///{path.resolve()}"
+        # Measure building the pages, not replays from the response cache
+        os.environ["RESPONSE_CACHE_SIZE"] = "0"
+        generate(path, spec)
+        asyncio.run(drive(args.words, args.requests))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    # Keep the per-request logs of the app out of the measurements
+    logging.disable(logging.INFO)
+    main(args)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Summarize benchmark latencies and compare saved result files.
+
+Result files are JSON documents written by `benchmarks.load`, with run
+metadata (commit, dataset, settings) and one entry per endpoint.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.report results/old.json results/new.json
+"""
+
+import argparse
+import json
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Columns shown when printing or comparing results
+COLUMNS = ["p50_ms", "p95_ms", "p99_ms", "throughput_rps"]
+
+
+def summarize(latencies_ms: List[float], errors: int, elapsed_s: float) -> Dict[str, Any]:
+    """Latency percentiles and throughput of one endpoint run."""
+    ordered = sorted(latencies_ms)
+    # 99 cut points; needs at least two samples
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else ordered * 99
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "mean_ms": statistics.fmean(ordered),
+        "p50_ms": cuts[49],
+        "p95_ms": cuts[94],
+        "p99_ms": cuts[98],
+        "max_ms": ordered[-1],
+        "throughput_rps": len(ordered) / elapsed_s if elapsed_s else 0.0,
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Short hash of the checked out commit, with a + if the tree is dirty."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}+" if dirty else commit
+
+
+def run_metadata(**extra: Any) -> Dict[str, Any]:
+    """Where and when a run happened, plus the caller's parameters."""
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        **extra,
+    }
+
+
+def save(result: Dict[str, Any], output: Optional[Path] = None) -> Path:
+    """Write a result document, by default to results/<time>-<commit>.json."""
+    if output is None:
+        meta = result["meta"]
+        stamp = meta["created_at"].replace(":", "").replace("-", "")[:15]
+        output = RESULTS_DIR / f"{stamp}-{meta['commit'] or 'unknown'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2) + "\n")
+    return output
+
+
+def print_table(result: Dict[str, Any]) -> None:
+    print(f"{'endpoint':<28}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}{'errors':>8}")
+    for name, r in result["endpoints"].items():
+        print(
+            f"{name:<28}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+            f"{r['throughput_rps']:>10.1f}{r['errors']:>8}"
+        )
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any]) -> None:
+    """Print the relative change of each column for endpoints in both runs."""
+    print(f"{old['meta'].get('commit')} -> {new['meta'].get('commit')}")
+    if old["meta"].get("dataset") != new["meta"].get("dataset"):
+        print("warning: the runs used different datasets", file=sys.stderr)
+    print(f"{'endpoint':<28}" + "".join(f"{column:>16}" for column in COLUMNS))
+    for name, after in new["endpoints"].items():
+        before = old["endpoints"].get(name)
+        if before is None:
+            continue
+        cells = []
+        for column in COLUMNS:
+            change = (after[column] - before[column]) / before[column] * 100 if before[column] else 0.0
+            cells.append(f"{after[column]:>9.2f} {change:>+5.0f}%")
+        print(f"{name:<28}" + "".join(f"{cell:>16}" for cell in cells))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("old", type=Path)
+    parser.add_argument("new", type=Path, nargs="?")
+    args = parser.parse_args()
+    old = json.loads(args.old.read_text())
+    if args.new is None:
+        print_table(old)
+    else:
+        compare(old, json.loads(args.new.read_text()))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Test client for the review stream: POST per review against /sessions/{id}/ws.
+
+Generates a database, opens a session on group 1, and logs --reviews
+reviews of its words the way a real-time game does: first with one
+POST /sessions/{id}/review each, then as messages of --per-message reviews
+over the session's WebSocket, reading the batch replies as they arrive.
+Checks that every streamed review was accepted, that the running
+statistics of the last reply match GET /sessions/{id}/reviews, and reports
+reviews per second of both.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.review_stream [--reviews 2000] [--per-message 1]
+"""
+
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.data import DatasetSpec, generate
+
+
+def post_reviews(client, prefix: str, session_id: int, reviews: List[Dict]) -> Dict:
+    """Log every review with its own request; returns the seconds taken."""
+    start = time.perf_counter()
+    for review in reviews:
+        response = client.post(f"{prefix}/sessions/{session_id}/review", json=review)
+        assert response.status_code == 200, response.text
+    return {"seconds": time.perf_counter() - start}
+
+
+def stream_reviews(
+    client, prefix: str, session_id: int, reviews: List[Dict], per_message: int
+) -> Dict:
+    """Stream the reviews; returns the seconds taken and the last stats reported."""
+    start = time.perf_counter()
+    with client.websocket_connect(f"{prefix}/sessions/{session_id}/ws") as websocket:
+        stats = websocket.receive_json()["data"]["stats"]
+        for i in range(0, len(reviews), per_message):
+            websocket.send_json(reviews[i:i + per_message])
+        written = 0
+        while written < len(reviews):
+            message = websocket.receive_json()
+            assert message["error"] is None, message["error"]
+            assert message["data"]["rejected"] == 0, message["data"]["results"]
+            written += message["data"]["accepted"]
+            stats = message["data"]["stats"]
+    return {"seconds": time.perf_counter() - start, "stats": stats}
+
+
+def drive(reviews: int, per_message: int) -> None:
+    from fastapi.testclient import TestClient
+    from app.core.config import get_settings
+    from app.main import app
+
+    prefix = get_settings().API_V1_PREFIX
+    with TestClient(app) as client:
+        words = client.get(f"{prefix}/groups/1/pack").json()["data"]["id"]
+        rng = random.Random(0)
+        batch = [
+            {"word_id": rng.choice(words), "correct": rng.random() < 0.8}
+            for _ in range(reviews)
+        ]
+
+        rows = []
+        for name, run in [
+            ("POST /review", lambda sid: post_reviews(client, prefix, sid, batch)),
+            ("WebSocket", lambda sid: stream_reviews(client, prefix, sid, batch, per_message)),
+        ]:
+            created = client.post(f"{prefix}/sessions", json={"group_id": 1, "activity_id": 1})
+            session_id = created.json()["data"]["id"]
+            result = run(session_id)
+            rows.append((name, reviews / result["seconds"]))
+
+        # Streamed reviews are all written, and the stats the stream kept match
+        logged = client.get(
+            f"{prefix}/sessions/{session_id}/reviews", params={"per_page": 1}
+        ).json()["data"]
+        assert logged["total"] == reviews, logged["total"]
+        correct = sum(review["correct"] for review in batch)
+        assert result["stats"]["total_reviews"] == reviews
+        assert result["stats"]["correct_reviews"] == correct
+
+    print(f"Logging {reviews} reviews, {per_message} per WebSocket message")
+    print(f"{'variant':<16}{'reviews/s':>12}")
+    for name, per_second in rows:
+        print(f"{name:<16}{per_second:>12,.0f}")
+
+
+def main(args: argparse.Namespace) -> None:
+    spec = DatasetSpec(words=1000, groups=10, sessions=100, reviews=1000)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        # Settings are read once, on first use, so configure the app first
+        os.environ["DATABASE_URL"] = f"sqlite://///{path.resolve()}"
+        generate(path, spec)
+        drive(args.reviews, args.per_message)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reviews", type=int, default=2000)
+    parser.add_argument("--per-message", type=int, default=1)
+    args = parser.parse_args()
+    # Keep the per-request logs of the app out of the measurements
+    logging.disable(logging.INFO)
+    main(args)
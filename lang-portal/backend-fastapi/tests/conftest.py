@@ -1,13 +1,23 @@
 import asyncio
+import os
 import pytest
 from typing import AsyncGenerator, Generator
+from sqlalchemy import DDL, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
+# Tests swap the app's sessions for an in-memory database, which other
+# processes cannot poll, so cache versions stay local to the test process
+os.environ.setdefault("CACHE_INVALIDATION", "local")
+
 from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
 from app.main import app
-from app.core.database import get_db
+from app.core.cache import response_cache
+from app.crud.base import count_cache
+from app.services.romaji_matcher import matcher_cache
+from app.services.word_pack import pack_cache
+from app.core.database import get_db, get_read_db
 from app.core.config import get_settings
 
 # Create a separate Base class for tests
@@ -36,17 +46,32 @@ TestingSessionLocal = sessionmaker(
 )
 
 # Import models after TestBase is defined
-from app.models.word import Word
+from app.models.word import Word, CREATE_WORDS_FTS, DROP_WORDS_FTS
 from app.models.group import Group
-from app.models.word_group import WordGroup
+from app.models.word_group import WordGroup, WORD_GROUPS_TRIGGERS
 from app.models.activity import Activity
 from app.models.session import Session
 from app.models.word_review_item import WordReviewItem
+from app.models.word_stats import WordStats, WORD_STATS_TRIGGERS
+from app.models.word_schedule import WordSchedule
+from app.models.word_part import WordPart
+from app.models.cache_generation import CacheGeneration
 
 # Register models with TestBase
-for model in [Word, Group, WordGroup, Activity, Session, WordReviewItem]:
+for model in [
+    Word, Group, WordGroup, Activity, Session, WordReviewItem, WordStats, WordSchedule,
+    WordPart, CacheGeneration
+]:
     model.__table__.to_metadata(TestBase.metadata)
 
+# DDL listeners are not copied by to_metadata; create the search index too
+event.listen(TestBase.metadata.tables["words"], "after_create", CREATE_WORDS_FTS)
+event.listen(TestBase.metadata.tables["words"], "before_drop", DROP_WORDS_FTS)
+for statement in WORD_GROUPS_TRIGGERS:
+    event.listen(TestBase.metadata.tables["word_groups"], "after_create", DDL(statement))
+for statement in WORD_STATS_TRIGGERS:
+    event.listen(TestBase.metadata.tables["word_stats"], "after_create", DDL(statement))
+
 # Import test data
 from tests.fixtures.test_data import (
     TEST_WORD,
@@ -68,6 +93,11 @@ def event_loop() -> Generator:
 @pytest.fixture(autouse=True, scope="function")
 async def setup_db() -> AsyncGenerator:
     """Create tables for test."""
+    # Tests insert rows directly, bypassing the CRUD version bumps
+    response_cache.clear()
+    count_cache.clear()
+    matcher_cache.clear()
+    pack_cache.clear()
     async with test_engine.begin() as conn:
         await conn.run_sync(TestBase.metadata.drop_all)
         await conn.run_sync(TestBase.metadata.create_all)
@@ -98,6 +128,7 @@ async def client(db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     
     transport = ASGITransport(app=app)
     async with AsyncClient(
@@ -0,0 +1,87 @@
+from httpx import AsyncClient
+
+from app.core.cache import CachedResponse, ResponseCache, response_cache
+from app.core.config import get_settings
+from app.core.database import get_read_db
+from app.main import app
+from tests.fixtures.test_data import TEST_GROUP, TEST_WORD
+
+settings = get_settings()
+
+
+async def test_conditional_get_returns_304(client: AsyncClient):
+    url = f"{settings.API_V1_PREFIX}/groups"
+    response = await client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response_cache.stats()["not_modified"] == 1
+
+
+async def test_repeated_get_skips_database(client: AsyncClient):
+    url = f"{settings.API_V1_PREFIX}/words?per_page=5"
+    first = await client.get(url)
+    assert first.status_code == 200
+
+    async def no_database():
+        raise AssertionError("cached response touched the database")
+        yield
+
+    app.dependency_overrides[get_read_db] = no_database
+    second = await client.get(url)
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+
+    stats = response_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+async def test_writes_change_the_etag(client: AsyncClient):
+    groups_url = f"{settings.API_V1_PREFIX}/groups"
+    words_url = f"{settings.API_V1_PREFIX}/words"
+    groups_etag = (await client.get(groups_url)).headers["etag"]
+    words_etag = (await client.get(words_url)).headers["etag"]
+
+    await client.post(groups_url, json=TEST_GROUP)
+
+    response = await client.get(groups_url, headers={"If-None-Match": groups_etag})
+    assert response.status_code == 200
+    assert response.json()["data"]["total"] == 1
+    assert response.headers["etag"] != groups_etag
+
+    # Tables the response does not depend on keep their version
+    response = await client.get(words_url, headers={"If-None-Match": words_etag})
+    assert response.status_code == 304
+
+    await client.post(words_url, json=TEST_WORD)
+    response = await client.get(words_url, headers={"If-None-Match": words_etag})
+    assert response.status_code == 200
+    assert response.json()["data"]["total"] == 1
+
+
+async def test_errors_are_not_cached(client: AsyncClient):
+    url = f"{settings.API_V1_PREFIX}/words/999"
+    response = await client.get(url)
+    assert response.status_code == 404
+    assert "etag" not in response.headers
+    assert response_cache.stats()["size"] == 0
+
+
+def test_lru_eviction():
+    cache = ResponseCache(maxsize=2)
+    for key in ("a", "b"):
+        cache.set(key, CachedResponse('"1"', key.encode(), "application/json"))
+    assert cache.get("a", '"1"') is not None  # "a" is now most recent
+    cache.set("c", CachedResponse('"1"', b"c", "application/json"))
+
+    assert cache.get("b", '"1"') is None
+    assert cache.get("a", '"1"') is not None
+    assert cache.get("c", '"2"') is None  # Stale version
+    assert cache.stats()["evictions"] == 1
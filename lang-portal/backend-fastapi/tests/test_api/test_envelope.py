@@ -0,0 +1,35 @@
+from httpx import AsyncClient
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+async def test_plain_content_is_wrapped(client: AsyncClient):
+    response = await client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"data": {"status": "healthy"}, "error": None}
+
+
+async def test_enveloped_content_is_not_wrapped_twice(client: AsyncClient):
+    response = await client.get(f"{settings.API_V1_PREFIX}/activities")
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body) == {"data", "error"}
+    assert "items" in body["data"]
+
+
+async def test_framework_errors_are_wrapped(client: AsyncClient):
+    response = await client.get(f"{settings.API_V1_PREFIX}/does-not-exist")
+    assert response.status_code == 404
+    assert response.json() == {"data": {"detail": "Not Found"}, "error": None}
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/words?page=0")
+    assert response.status_code == 422
+    assert "detail" in response.json()["data"]
+
+
+async def test_openapi_schema_is_not_wrapped(client: AsyncClient):
+    response = await client.get(f"{settings.API_V1_PREFIX}/openapi.json")
+    assert response.status_code == 200
+    assert "openapi" in response.json()
@@ -0,0 +1,81 @@
+from httpx import AsyncClient
+
+from app.core.config import get_settings
+from app.core.metrics import (
+    MetricsRegistry,
+    UNMATCHED_ROUTE,
+    http_request_duration,
+    http_requests,
+    http_response_size,
+    route_template,
+)
+from tests.fixtures.test_data import TEST_WORD
+
+settings = get_settings()
+
+
+def test_render_text_format():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests", "Requests served", ("route",))
+    latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    registry.gauge("connections", "Open connections", collect=lambda: {(): 3})
+
+    requests.inc('/a"b')
+    latency.observe(0.1, "/a")
+    latency.observe(0.5, "/a")
+    latency.observe(2, "/a")
+
+    assert registry.render().splitlines() == [
+        "# HELP requests Requests served",
+        "# TYPE requests counter",
+        'requests_total{route="/a\\"b"} 1',
+        "# HELP latency_seconds Latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 1',
+        'latency_seconds_bucket{route="/a",le="1"} 2',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 3',
+        'latency_seconds_sum{route="/a"} 2.6',
+        'latency_seconds_count{route="/a"} 3',
+        "# HELP connections Open connections",
+        "# TYPE connections gauge",
+        "connections 3",
+    ]
+
+
+def test_route_template_restores_placeholders():
+    scope = {
+        "path": "/api/sessions/3/words/3",
+        "endpoint": object(),
+        "path_params": {"session_id": 3, "word_id": 3},
+    }
+    assert route_template(scope) == "/api/sessions/{session_id}/words/{word_id}"
+    assert route_template({"path": "/nope"}) == UNMATCHED_ROUTE
+
+
+async def test_requests_are_labelled_by_route_template(client: AsyncClient):
+    template = f"{settings.API_V1_PREFIX}/words/{{word_id}}"
+    before = http_requests.value("GET", template, "200")
+    latencies_before = http_request_duration.count("GET", template)
+    missing_before = http_requests.value("GET", template, "404")
+
+    word_id = (await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD)).json()["data"]["id"]
+    await client.get(f"{settings.API_V1_PREFIX}/words/{word_id}")
+    await client.get(f"{settings.API_V1_PREFIX}/words/{word_id}")
+    await client.get(f"{settings.API_V1_PREFIX}/words/99999")
+
+    assert http_requests.value("GET", template, "200") == before + 2
+    assert http_requests.value("GET", template, "404") == missing_before + 1
+    assert http_request_duration.count("GET", template) == latencies_before + 3
+    assert http_response_size.count("GET", template) >= 3
+
+
+async def test_metrics_endpoint(client: AsyncClient):
+    await client.get("/health")
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/health",status="200"}' in body
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_requests_in_progress{method="GET"} 1' in body
+    assert "# TYPE db_pool_checkout_seconds histogram" in body
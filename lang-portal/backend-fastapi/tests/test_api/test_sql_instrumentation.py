@@ -0,0 +1,114 @@
+import json
+import logging
+import re
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.config import get_settings
+from app.core.instrumentation import (
+    QueryInstrumentationMiddleware,
+    install_query_instrumentation,
+    uninstall_query_instrumentation,
+)
+from app.main import app
+from tests.fixtures.test_data import TEST_WORD
+
+settings = get_settings()
+
+SERVER_TIMING = re.compile(r'^db;dur=[\d.]+;desc="(\d+) queries", app;dur=[\d.]+$')
+
+
+@pytest.fixture
+def instrumentation(db: AsyncSession):
+    """Hook the test engine, as SQL_INSTRUMENTATION does for the app's."""
+    install_query_instrumentation(db.bind)
+    yield
+    uninstall_query_instrumentation(db.bind)
+
+
+def instrumented(asgi_app, **thresholds) -> AsyncClient:
+    middleware = QueryInstrumentationMiddleware(asgi_app, **thresholds)
+    return AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test")
+
+
+def logged_requests(caplog):
+    return [
+        json.loads(record.getMessage())
+        for record in caplog.records
+        if record.name == "app.core.instrumentation"
+    ]
+
+
+async def test_disabled_by_default(client: AsyncClient):
+    response = await client.get(f"{settings.API_V1_PREFIX}/words")
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+
+
+async def test_reports_statements_per_request(client: AsyncClient, instrumentation, caplog):
+    await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD)
+
+    caplog.set_level(logging.INFO, logger="app.core.instrumentation")
+    async with instrumented(app) as instrumented_client:
+        response = await instrumented_client.get(f"{settings.API_V1_PREFIX}/words")
+    assert response.status_code == 200
+
+    match = SERVER_TIMING.match(response.headers["server-timing"])
+    assert match and int(match.group(1)) >= 1
+
+    [line] = logged_requests(caplog)
+    assert line["event"] == "sql_request"
+    assert line["method"] == "GET"
+    assert line["path"] == f"{settings.API_V1_PREFIX}/words"
+    assert line["status"] == 200
+    assert line["statements"] == int(match.group(1))
+    assert line["n_plus_one"] is False
+
+
+async def test_flags_repeated_statements(db: AsyncSession, instrumentation, caplog):
+    async def per_row_lookups(request):
+        for word_id in range(12):
+            await db.execute(text("SELECT id FROM words WHERE id = :id"), {"id": word_id})
+        return PlainTextResponse("ok")
+
+    loop_app = Starlette(routes=[Route("/loop", per_row_lookups)])
+    caplog.set_level(logging.INFO, logger="app.core.instrumentation")
+    async with instrumented(loop_app, statement_threshold=100, repeat_threshold=10) as c:
+        response = await c.get("/loop")
+
+    assert SERVER_TIMING.match(response.headers["server-timing"]).group(1) == "12"
+    [record] = [r for r in caplog.records if r.name == "app.core.instrumentation"]
+    assert record.levelno == logging.WARNING
+    line = json.loads(record.getMessage())
+    assert line["n_plus_one"] is True
+    assert line["repeats"] == 12
+    assert line["repeated_statement"] == "SELECT id FROM words WHERE id = ?"
+
+
+async def test_flags_too_many_statements(db: AsyncSession, instrumentation, caplog):
+    async def many_queries(request):
+        for table in ("words", "groups", "sessions", "activities"):
+            await db.execute(text(f"SELECT COUNT(*) FROM {table}"))
+        return PlainTextResponse("ok")
+
+    busy_app = Starlette(routes=[Route("/busy", many_queries)])
+    caplog.set_level(logging.INFO, logger="app.core.instrumentation")
+    async with instrumented(busy_app, statement_threshold=3, repeat_threshold=10) as c:
+        await c.get("/busy")
+
+    [line] = logged_requests(caplog)
+    assert line["statements"] == 4
+    assert line["n_plus_one"] is True
+    assert line["repeats"] == 1
+
+
+async def test_ignores_statements_outside_requests(db: AsyncSession, instrumentation, caplog):
+    caplog.set_level(logging.INFO, logger="app.core.instrumentation")
+    await db.execute(text("SELECT 1"))
+    assert logged_requests(caplog) == []
@@ -72,6 +72,24 @@ async def test_get_groups_sorting(client: AsyncClient, db: AsyncSession):
     assert items[1]["name"] == "Animals"  # Animals should come second
 
 
+async def test_get_groups_cursor_pagination(client: AsyncClient, db: AsyncSession):
+    for name in ["Verbs", "Animals", "Colors"]:
+        await client.post(f"{settings.API_V1_PREFIX}/groups", json={"name": name})
+
+    url = f"{settings.API_V1_PREFIX}/groups?sort_by=name&per_page=2"
+    response = await client.get(url)
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [g["name"] for g in data["items"]] == ["Animals", "Colors"]
+    assert data["next_cursor"]
+
+    response = await client.get(f"{url}&cursor={data['next_cursor']}")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [g["name"] for g in data["items"]] == ["Verbs"]
+    assert data["next_cursor"] is None
+
+
 async def test_get_group(client: AsyncClient, db: AsyncSession):
     # Create group
     create_response = await client.post(f"{settings.API_V1_PREFIX}/groups", json=TEST_GROUP)
@@ -115,6 +133,121 @@ async def test_get_group_details(client: AsyncClient, db: AsyncSession):
     assert {w["id"] for w in data["words"]} == set(word_ids)
 
 
+async def test_sample_group_words(client: AsyncClient, db: AsyncSession):
+    create_response = await client.post(f"{settings.API_V1_PREFIX}/groups", json=TEST_GROUP)
+    group_id = create_response.json()["data"]["id"]
+    word_ids = []
+    for word_data in (TEST_WORD, TEST_WORD_2):
+        word_response = await client.post(f"{settings.API_V1_PREFIX}/words", json=word_data)
+        word_ids.append(word_response.json()["data"]["id"])
+    await client.put(
+        f"{settings.API_V1_PREFIX}/groups/{group_id}",
+        json={"name": TEST_GROUP["name"], "word_ids": word_ids}
+    )
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/groups/{group_id}/sample",
+        params={"n": 1, "strategy": "weak"}
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["group_id"] == group_id
+    assert data["strategy"] == "weak"
+    assert len(data["items"]) == 1
+    assert data["items"][0]["id"] in word_ids
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/groups/{group_id}/sample")
+    assert {w["id"] for w in response.json()["data"]["items"]} == set(word_ids)
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/groups/{group_id}/sample", params={"strategy": "hard"}
+    )
+    assert response.status_code == 422
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/groups/999/sample")
+    assert response.status_code == 404
+    assert "not found" in response.json()["error"]
+
+
+async def test_get_group_pack(client: AsyncClient, db: AsyncSession):
+    create_response = await client.post(f"{settings.API_V1_PREFIX}/groups", json=TEST_GROUP)
+    group_id = create_response.json()["data"]["id"]
+    word_ids = []
+    for word_data in (TEST_WORD_2, TEST_WORD):
+        word_response = await client.post(f"{settings.API_V1_PREFIX}/words", json=word_data)
+        word_ids.append(word_response.json()["data"]["id"])
+    await client.put(
+        f"{settings.API_V1_PREFIX}/groups/{group_id}",
+        json={"name": TEST_GROUP["name"], "word_ids": word_ids}
+    )
+    url = f"{settings.API_V1_PREFIX}/groups/{group_id}/pack"
+
+    response = await client.get(url, headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    data = response.json()["data"]
+    assert data["group"] == {"id": group_id, "name": TEST_GROUP["name"]}
+    assert data["count"] == 2
+    assert data["id"] == word_ids
+    assert data["romaji"] == [TEST_WORD_2["romaji"], TEST_WORD["romaji"]]
+    assert data["parts"][1] == [["開", "a"], ["け", "ke"], ["る", "ru"]]
+    etag = response.headers["etag"]
+
+    response = await client.get(
+        url, headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    # A write that leaves the group's words as they were keeps the ETag
+    await client.post(f"{settings.API_V1_PREFIX}/words", json={**TEST_WORD, "kanji": "開く"})
+    response = await client.get(
+        url, headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    await client.put(
+        f"{settings.API_V1_PREFIX}/words/{word_ids[0]}", json={"english": "to build"}
+    )
+    response = await client.get(
+        url, headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["data"]["english"][0] == "to build"
+    assert response.headers["etag"] != etag
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/groups/999/pack")
+    assert response.status_code == 404
+
+
+async def test_get_group_pack_gzip(client: AsyncClient, db: AsyncSession):
+    word_ids = []
+    for i in range(50):
+        word_response = await client.post(
+            f"{settings.API_V1_PREFIX}/words",
+            json={**TEST_WORD, "kanji": f"開ける{i}"}
+        )
+        word_ids.append(word_response.json()["data"]["id"])
+    create_response = await client.post(
+        f"{settings.API_V1_PREFIX}/groups",
+        json={**TEST_GROUP, "word_ids": word_ids}
+    )
+    url = f"{settings.API_V1_PREFIX}/groups/{create_response.json()['data']['id']}/pack"
+
+    plain = await client.get(url, headers={"Accept-Encoding": "identity"})
+    response = await client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(plain.content)
+    # httpx decodes the body
+    assert response.content == plain.content
+    assert response.headers["etag"] != plain.headers["etag"]
+
+    response = await client.get(
+        url, headers={"Accept-Encoding": "gzip", "If-None-Match": plain.headers["etag"]}
+    )
+    assert response.status_code == 200
+
+
 async def test_update_group(client: AsyncClient, db: AsyncSession):
     # Create group
     create_response = await client.post(f"{settings.API_V1_PREFIX}/groups", json=TEST_GROUP)
@@ -1,9 +1,15 @@
+from contextlib import asynccontextmanager
+
 import pytest
+from fastapi.testclient import TestClient
 from httpx import AsyncClient
+from starlette.websockets import WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import encode_cursor
 from app.crud.session import session
 from app.main import app
+from app.services.review_buffer import ReviewBuffer, get_review_buffer
 from app.core.config import get_settings
 from tests.fixtures.test_data import (
     TEST_SESSION,
@@ -242,4 +248,255 @@ async def test_list_sessions(
     assert session2_found["group_id"] is None
     assert len(session1_found["reviews"]) == 1
     assert len(session2_found["reviews"]) == 0
-    assert session1_found["reviews"][0]["correct"] is True 
\ No newline at end of file
+    assert session1_found["reviews"][0]["correct"] is True 
+
+
+async def test_list_sessions_cursor_pagination(client: AsyncClient, db: AsyncSession):
+    """Test walking sessions with keyset cursors, including null sort values."""
+    created = []
+    for group_id in [TEST_SESSION["group_id"], None, TEST_SESSION["group_id"], None]:
+        db_session = await session.create(
+            db,
+            obj_in=SessionCreate(group_id=group_id, activity_id=TEST_SESSION["activity_id"])
+        )
+        created.append(db_session.id)
+
+    for order in ["asc", "desc"]:
+        url = f"/api/sessions?sort_by=group_id&order={order}&per_page=1"
+        seen = []
+        response = await client.get(url)
+        while True:
+            assert response.status_code == 200
+            data = response.json()["data"]
+            seen.extend(item["id"] for item in data["items"])
+            if not data["next_cursor"]:
+                break
+            response = await client.get(f"{url}&cursor={data['next_cursor']}")
+        assert sorted(seen) == sorted(created)
+        assert len(seen) == len(created)
+
+    response = await client.get("/api/sessions?cursor=bogus")
+    assert response.status_code == 400
+
+    # A well-formed cursor whose value does not fit the sort column
+    cursor = encode_cursor("created_at", 12345, created[0])
+    response = await client.get(f"/api/sessions?sort_by=created_at&cursor={cursor}")
+    assert response.status_code == 400
+
+
+
+async def test_create_word_reviews_batch(client: AsyncClient, db: AsyncSession):
+    """Test logging a batch of reviews in one request."""
+    response = await client.post("/api/sessions", json=TEST_SESSION)
+    session_id = response.json()["data"]["id"]
+    word_id = TEST_WORD_REVIEW["word_id"]
+
+    response = await client.post(
+        f"/api/sessions/{session_id}/reviews/batch",
+        json={"reviews": [
+            {"word_id": word_id, "correct": True},
+            {"word_id": 999999, "correct": True},
+            {"word_id": word_id, "correct": False},
+        ]}
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["accepted"] == 2
+    assert data["rejected"] == 1
+    assert data["results"][1]["error"] == "Word 999999 not found"
+    assert data["results"][1]["id"] is None
+
+    response = await client.get(f"/api/sessions/{session_id}")
+    reviews = response.json()["data"]["reviews"]
+    assert [r["correct"] for r in reviews] == [True, False]
+
+
+async def test_create_word_reviews_batch_invalid_session(client: AsyncClient, db: AsyncSession):
+    """Test logging a batch of reviews for a nonexistent session."""
+    response = await client.post(
+        "/api/sessions/999999/reviews/batch",
+        json={"reviews": [{"word_id": TEST_WORD_REVIEW["word_id"], "correct": True}]}
+    )
+    assert response.status_code == 404
+    assert "not found" in response.json()["error"]
+
+
+async def test_list_sessions_summary(client: AsyncClient, db: AsyncSession):
+    """Test listing sessions with review statistics instead of reviews."""
+    word_id = TEST_WORD_REVIEW["word_id"]
+    reviewed = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+    empty = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+    await session.create_word_reviews(
+        db,
+        session_id=reviewed.id,
+        reviews=[(word_id, True), (word_id, False), (word_id, True), (word_id, True)]
+    )
+
+    response = await client.get("/api/sessions?include=summary&sort_by=created_at")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total"] == 2
+    items = {item["id"]: item for item in data["items"]}
+    assert "reviews" not in items[reviewed.id]
+    assert items[reviewed.id]["total_reviews"] == 4
+    assert items[reviewed.id]["correct_reviews"] == 3
+    assert items[reviewed.id]["accuracy"] == 0.75
+    assert items[empty.id]["total_reviews"] == 0
+    assert items[empty.id]["accuracy"] == 0.0
+    assert items[empty.id]["group_id"] == TEST_SESSION["group_id"]
+
+    response = await client.get("/api/sessions?include=summary&per_page=1")
+    assert response.json()["data"]["next_cursor"]
+
+    response = await client.get("/api/sessions?include=everything")
+    assert response.status_code == 422
+
+
+async def test_list_session_reviews(client: AsyncClient, db: AsyncSession):
+    """Test paging through the reviews of a session."""
+    word_id = TEST_WORD_REVIEW["word_id"]
+    db_session = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+    created = await session.create_word_reviews(
+        db,
+        session_id=db_session.id,
+        reviews=[(word_id, i % 2 == 0) for i in range(5)]
+    )
+
+    url = f"/api/sessions/{db_session.id}/reviews?per_page=2"
+    response = await client.get(url)
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total"] == 5
+    assert data["total_pages"] == 3
+    assert [r["id"] for r in data["items"]] == [row["id"] for row in created[:2]]
+
+    seen = [r["id"] for r in data["items"]]
+    while data["next_cursor"]:
+        response = await client.get(f"{url}&cursor={data['next_cursor']}")
+        data = response.json()["data"]
+        seen.extend(r["id"] for r in data["items"])
+    assert seen == [row["id"] for row in created]
+
+    response = await client.get(f"{url}&page=3")
+    assert [r["correct"] for r in response.json()["data"]["items"]] == [True]
+
+    response = await client.get("/api/sessions/999999/reviews")
+    assert response.status_code == 404
+    response = await client.get(f"{url}&cursor=bogus")
+    assert response.status_code == 400
+
+
+async def test_get_sessions_stats(client: AsyncClient, db: AsyncSession):
+    """Test fetching statistics of many sessions at once."""
+    word_id = TEST_WORD_REVIEW["word_id"]
+    reviewed = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+    empty = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+    await session.create_word_reviews(
+        db,
+        session_id=reviewed.id,
+        reviews=[(word_id, True), (word_id, False)]
+    )
+
+    response = await client.post(
+        "/api/sessions/stats",
+        json={"session_ids": [empty.id, 999999, reviewed.id, empty.id]}
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["items"] == [
+        {"session_id": empty.id, "total_reviews": 0, "correct_reviews": 0, "accuracy": 0.0},
+        {"session_id": reviewed.id, "total_reviews": 2, "correct_reviews": 1, "accuracy": 0.5},
+    ]
+    assert data["missing"] == [999999]
+
+    response = await client.post("/api/sessions/stats", json={"session_ids": []})
+    assert response.status_code == 422
+
+
+async def test_create_word_review_write_behind(client: AsyncClient, db: AsyncSession):
+    @asynccontextmanager
+    async def shared_session():
+        # Each connection to the in-memory test database is a new database
+        async with AsyncSession(
+            bind=await db.connection(),
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        ) as writer:
+            yield writer
+
+    buffer = ReviewBuffer(shared_session, flush_interval=0.01)
+    app.dependency_overrides[get_review_buffer] = lambda: buffer
+    create_response = await client.post(f"{settings.API_V1_PREFIX}/sessions", json=TEST_SESSION)
+    session_id = create_response.json()["data"]["id"]
+    url = f"{settings.API_V1_PREFIX}/sessions/{session_id}/review"
+
+    # Not started yet, so nothing is accepted
+    response = await client.post(url, json=TEST_WORD_REVIEW)
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+    buffer.start()
+    try:
+        response = await client.post(url, json=TEST_WORD_REVIEW)
+        assert response.status_code == 202
+        data = response.json()["data"]
+        assert data["id"] is None
+        assert data["queued"] is True
+        assert data["word_id"] == TEST_WORD_REVIEW["word_id"]
+
+        # Validation still happens before the review is queued
+        response = await client.post(url, json={**TEST_WORD_REVIEW, "word_id": 999})
+        assert response.status_code == 404
+    finally:
+        await buffer.stop()
+
+    response = await client.get(f"{url}s")
+    assert response.json()["data"]["total"] == 1
+
+
+async def test_stream_word_reviews(client: AsyncClient, db: AsyncSession):
+    """Test streaming reviews over a WebSocket."""
+    create_response = await client.post(f"{settings.API_V1_PREFIX}/sessions", json=TEST_SESSION)
+    session_id = create_response.json()["data"]["id"]
+    word_id = TEST_WORD_REVIEW["word_id"]
+    url = f"{settings.API_V1_PREFIX}/sessions/{session_id}/ws"
+
+    # Not entered as a context manager, so the app's lifespan does not run
+    with TestClient(app).websocket_connect(url) as websocket:
+        data = websocket.receive_json()["data"]
+        assert data["results"] == []
+        assert data["stats"] == {"total_reviews": 0, "correct_reviews": 0, "accuracy": 0.0}
+
+        websocket.send_json([
+            {"word_id": word_id, "correct": True},
+            {"word_id": 999999, "correct": True}
+        ])
+        data = websocket.receive_json()["data"]
+        assert data["accepted"] == 1
+        assert data["results"][1]["error"] == "Word 999999 not found"
+        assert data["stats"]["total_reviews"] == 1
+
+        websocket.send_text("not json")
+        assert websocket.receive_json()["error"] is not None
+        websocket.send_json({"word_id": word_id})
+        assert "Invalid review" in websocket.receive_json()["error"]
+
+        websocket.send_json({"word_id": word_id, "correct": False})
+        data = websocket.receive_json()["data"]
+        # Indexes count every review sent over the connection
+        assert data["results"][0]["index"] == 2
+        assert data["stats"] == {"total_reviews": 2, "correct_reviews": 1, "accuracy": 0.5}
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/sessions/{session_id}/reviews")
+    assert [r["correct"] for r in response.json()["data"]["items"]] == [True, False]
+
+
+async def test_stream_word_reviews_invalid_session(client: AsyncClient, db: AsyncSession):
+    """Test streaming reviews to a nonexistent session."""
+    url = f"{settings.API_V1_PREFIX}/sessions/999999/ws"
+    with TestClient(app).websocket_connect(url) as websocket:
+        assert websocket.receive_json()["error"] == "Session 999999 not found"
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            websocket.receive_json()
+        assert exc_info.value.code == 4404
+
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.word_schedule import WordSchedule
+from tests.fixtures.test_data import setup_test_data
+
+settings = get_settings()
+
+
+async def test_get_due_words(client: AsyncClient, db: AsyncSession):
+    data = await setup_test_data(db)
+    session_response = await client.post(
+        f"{settings.API_V1_PREFIX}/sessions",
+        json={"group_id": data["group_id"], "activity_id": data["activity_id"]}
+    )
+    session_id = session_response.json()["data"]["id"]
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/sessions/{session_id}/review",
+        json={"word_id": data["word_id"], "correct": False}
+    )
+    assert response.status_code == 200
+
+    # A missed word comes back the next day
+    response = await client.get(f"{settings.API_V1_PREFIX}/study/due")
+    assert response.status_code == 200
+    assert response.json()["data"]["items"] == []
+
+    await db.execute(
+        update(WordSchedule).values(next_due=datetime.utcnow() - timedelta(minutes=1))
+    )
+    await db.commit()
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/study/due",
+        params={"group_id": data["group_id"], "limit": 5}
+    )
+    assert response.status_code == 200
+    items = response.json()["data"]["items"]
+    assert [item["id"] for item in items] == [data["word_id"]]
+    assert items[0]["wrong_count"] == 1
+    assert items[0]["repetitions"] == 0
+    assert items[0]["interval_days"] == 1.0
+
+
+async def test_get_due_words_nonexistent_group(client: AsyncClient, db: AsyncSession):
+    response = await client.get(f"{settings.API_V1_PREFIX}/study/due", params={"group_id": 999})
+    assert response.status_code == 404
+    assert "not found" in response.json()["error"]
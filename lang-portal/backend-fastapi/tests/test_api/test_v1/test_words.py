@@ -173,4 +173,188 @@ async def test_get_word_with_review_stats(client: AsyncClient, db: AsyncSession)
     assert "correct_count" in data
     assert "wrong_count" in data
     assert isinstance(data["correct_count"], int)
-    assert isinstance(data["wrong_count"], int) 
\ No newline at end of file
+    assert isinstance(data["wrong_count"], int) 
+
+async def test_get_words_cursor_pagination(client: AsyncClient, db: AsyncSession):
+    # Create words, two of which share the same english value
+    for kanji, romaji, english in [
+        ("猫", "neko", "cat"),
+        ("犬", "inu", "dog"),
+        ("鳥", "tori", "bird"),
+        ("狗", "ku", "dog"),
+    ]:
+        await client.post(f"{settings.API_V1_PREFIX}/words", json={
+            "kanji": kanji,
+            "romaji": romaji,
+            "english": english,
+            "parts": [{"kanji": kanji, "romaji": [romaji]}]
+        })
+
+    # Walk every page with the cursor
+    seen = []
+    url = f"{settings.API_V1_PREFIX}/words?sort_by=english&order=desc&per_page=1"
+    response = await client.get(url)
+    while True:
+        assert response.status_code == 200
+        data = response.json()["data"]
+        seen.extend(item["romaji"] for item in data["items"])
+        if not data["next_cursor"]:
+            break
+        response = await client.get(f"{url}&cursor={data['next_cursor']}")
+
+    assert seen == ["ku", "inu", "neko", "tori"]
+
+
+async def test_get_words_cursor_by_review_stats(client: AsyncClient, db: AsyncSession):
+    await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD)
+    await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD_2)
+
+    url = f"{settings.API_V1_PREFIX}/words?sort_by=correct_count&per_page=1"
+    first = (await client.get(url)).json()["data"]
+    second = (await client.get(f"{url}&cursor={first['next_cursor']}")).json()["data"]
+    assert first["items"][0]["id"] != second["items"][0]["id"]
+
+
+async def test_get_words_invalid_cursor(client: AsyncClient, db: AsyncSession):
+    await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD)
+    await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD_2)
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/words?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+    # A cursor issued for one sort field is rejected for another
+    first = await client.get(f"{settings.API_V1_PREFIX}/words?sort_by=kanji&per_page=1")
+    cursor = first.json()["data"]["next_cursor"]
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/words?sort_by=romaji&cursor={cursor}"
+    )
+    assert response.status_code == 400
+
+
+async def test_search_words(client: AsyncClient, db: AsyncSession):
+    await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD)
+    await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD_2)
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/words/search?q=tsu")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total"] == 1
+    assert data["items"][0]["kanji"] == TEST_WORD_2["kanji"]
+    assert data["items"][0]["correct_count"] == 0
+
+    # "to" prefixes the English of both words; page through them
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/words/search?q=to&per_page=1&page=2"
+    )
+    data = response.json()["data"]
+    assert data["total"] == 2
+    assert data["total_pages"] == 2
+    assert len(data["items"]) == 1
+
+
+async def test_search_words_requires_query(client: AsyncClient, db: AsyncSession):
+    response = await client.get(f"{settings.API_V1_PREFIX}/words/search")
+    assert response.status_code == 422
+
+
+async def test_get_words_count_modes(client: AsyncClient, db: AsyncSession):
+    await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD)
+    await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD_2)
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/words?per_page=1&count=estimate")
+    data = response.json()["data"]
+    assert data["total"] == 2
+    assert data["total_pages"] == 2
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/words?per_page=1&count=none")
+    data = response.json()["data"]
+    assert len(data["items"]) == 1
+    assert data["total"] is None
+    assert data["total_pages"] is None
+    assert data["next_cursor"]
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/words?count=approx")
+    assert response.status_code == 422
+
+
+async def test_get_words_by_component(client: AsyncClient, db: AsyncSession):
+    await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD)
+    await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD_2)
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/words/by-component", params={"component": "作"}
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total"] == 1
+    assert data["items"][0]["kanji"] == TEST_WORD_2["kanji"]
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/words/by-component",
+        params={"component": "作", "reading": "sa"}
+    )
+    assert response.json()["data"]["total"] == 0
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/words/by-component")
+    assert response.status_code == 422
+
+
+async def test_get_related_words(client: AsyncClient, db: AsyncSession):
+    response = await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD_2)
+    word_id = response.json()["data"]["id"]
+    await client.post(f"{settings.API_V1_PREFIX}/words", json={
+        "kanji": "作家",
+        "romaji": "sakka",
+        "english": "writer",
+        "parts": [{"kanji": "作", "romaji": ["sa"]}, {"kanji": "家", "romaji": ["kka"]}]
+    })
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/words/{word_id}/related")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total"] == 1
+    assert data["items"][0]["kanji"] == "作家"
+    assert data["items"][0]["shared_components"] == ["作"]
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/words/999/related")
+    assert response.status_code == 404
+
+
+async def test_check_answer(client: AsyncClient, db: AsyncSession):
+    response = await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD_2)
+    word_id = response.json()["data"]["id"]
+
+    for answer, status in [("tukuru", "correct"), ("tsuk", "partial"), ("tsuka", "wrong")]:
+        response = await client.post(
+            f"{settings.API_V1_PREFIX}/words/{word_id}/check",
+            json={"answer": answer}
+        )
+        assert response.status_code == 200
+        assert response.json()["data"]["status"] == status
+    assert response.json()["data"]["matched"] == 4
+
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/words/999/check",
+        json={"answer": "a"}
+    )
+    assert response.status_code == 404
+
+
+async def test_check_answers_batch(client: AsyncClient, db: AsyncSession):
+    response = await client.post(f"{settings.API_V1_PREFIX}/words", json=TEST_WORD)
+    word_id = response.json()["data"]["id"]
+
+    response = await client.post(f"{settings.API_V1_PREFIX}/words/check", json={
+        "items": [
+            {"word_id": word_id, "answer": "akeru"},
+            {"word_id": 999, "answer": "a"},
+            {"word_id": word_id, "answer": "ake"}
+        ]
+    })
+    assert response.status_code == 200
+    items = response.json()["data"]["items"]
+    assert [item["status"] for item in items] == ["correct", None, "partial"]
+    assert items[1]["detail"] == "Word 999 not found"
+
+    response = await client.post(f"{settings.API_V1_PREFIX}/words/check", json={"items": []})
+    assert response.status_code == 422
@@ -1,9 +1,11 @@
 import pytest
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.group import group
 from app.crud.word import word
 from app.models.group import Group
+from app.models.word_group import WordGroup
 from app.schemas.group import GroupCreate, GroupUpdate
 from app.schemas.word import WordCreate
 from tests.fixtures.test_data import TEST_GROUP, TEST_WORD, TEST_WORD_2
@@ -106,4 +108,129 @@ async def test_set_words_in_group(db: AsyncSession):
     
     # Verify word count
     updated_group = await group.get(db, id=db_group.id)
-    assert updated_group.words_count == len(word_ids) 
\ No newline at end of file
+    assert updated_group.words_count == len(word_ids) 
+
+async def test_set_words_applies_diff(db: AsyncSession):
+    db_group = await group.create(db, obj_in=GroupCreate(**TEST_GROUP))
+    db_word1 = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+    db_word2 = await word.create(db, obj_in=WordCreate(**TEST_WORD_2))
+    db_word3 = await word.create(db, obj_in=WordCreate(
+        kanji="見る", romaji="miru", english="to see",
+        parts=[{"kanji": "見", "romaji": ["mi"]}, {"kanji": "る", "romaji": ["ru"]}]
+    ))
+    await group.set_words(db, group_id=db_group.id, word_ids=[db_word1.id, db_word2.id])
+
+    # Swap word1 for word3; duplicates in the request are ignored
+    updated_group = await group.set_words(
+        db, group_id=db_group.id, word_ids=[db_word2.id, db_word3.id, db_word3.id]
+    )
+    assert updated_group.words_count == 2
+
+    result = await db.execute(
+        select(WordGroup.word_id).filter(WordGroup.group_id == db_group.id)
+    )
+    assert set(result.scalars().all()) == {db_word2.id, db_word3.id}
+
+
+async def test_count_modes(db: AsyncSession):
+    db_group = await group.create(db, obj_in=GroupCreate(**TEST_GROUP))
+    db_word = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+    await group.add_words(db, group_id=db_group.id, word_ids=[db_word.id])
+    await db.commit()
+
+    assert await group.count(db) == 1
+    assert await group.count_estimate(db) == 1
+    assert (await group.get_multi(db, count_mode="none"))[1] is None
+    _, total = await group.get_group_words(db, group_id=db_group.id, count_mode="estimate")
+    assert total == 1
+
+    # Rows written behind the CRUD layer are not seen by the cached count...
+    db.add(Group(name="Untracked"))
+    await db.commit()
+    assert await group.count(db) == 2
+    assert await group.count_estimate(db) == 1
+
+    # ...until the table is written through it
+    await group.create(db, obj_in=GroupCreate(name="Tracked"))
+    assert await group.count_estimate(db) == 3
+
+
+async def test_words_count_follows_memberships(db: AsyncSession):
+    db_group = await group.create(db, obj_in=GroupCreate(**TEST_GROUP))
+    db_word1 = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+    db_word2 = await word.create(db, obj_in=WordCreate(**TEST_WORD_2))
+
+    db_group = await group.add_words(db, group_id=db_group.id, word_ids=[db_word1.id, db_word2.id])
+    assert db_group.words_count == 2
+
+    # Deleting a word removes its memberships, which the triggers count
+    await word.remove(db, id=db_word1.id)
+    await db.refresh(db_group)
+    assert db_group.words_count == 1
+
+    db_group = await group.set_words(db, group_id=db_group.id, word_ids=[])
+    assert db_group.words_count == 0
+
+
+async def test_words_count_drift_repair(db: AsyncSession):
+    db_group = await group.create(db, obj_in=GroupCreate(**TEST_GROUP))
+    db_word = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+    await group.add_words(db, group_id=db_group.id, word_ids=[db_word.id])
+    assert await group.find_words_count_drift(db) == []
+
+    # Simulate a count written behind the triggers' back
+    await db.execute(update(Group).where(Group.id == db_group.id).values(words_count=5))
+    await db.commit()
+    assert await group.find_words_count_drift(db) == [(db_group.id, 5, 1)]
+
+    assert await group.repair_words_counts(db) == 1
+    assert await group.find_words_count_drift(db) == []
+    await db.refresh(db_group)
+    assert db_group.words_count == 1
+
+
+async def group_positions(db: AsyncSession, group_id: int) -> dict:
+    result = await db.execute(
+        select(WordGroup.position, WordGroup.word_id)
+        .where(WordGroup.group_id == group_id)
+        .order_by(WordGroup.position)
+    )
+    return dict(result.all())
+
+
+async def test_positions_stay_dense(db: AsyncSession):
+    db_group = await group.create(db, obj_in=GroupCreate(**TEST_GROUP))
+    word_ids = []
+    for i in range(5):
+        db_word = await word.create(
+            db, obj_in=WordCreate(**{**TEST_WORD, "romaji": f"akeru{i}"})
+        )
+        word_ids.append(db_word.id)
+
+    await group.add_words(db, group_id=db_group.id, word_ids=word_ids)
+    assert await group_positions(db, db_group.id) == dict(enumerate(word_ids))
+    assert await group.get_position_count(db, group_id=db_group.id) == 5
+
+    # The last member takes over the position of a removed one
+    await word.remove(db, id=word_ids[1])
+    positions = await group_positions(db, db_group.id)
+    assert positions == {0: word_ids[0], 1: word_ids[4], 2: word_ids[2], 3: word_ids[3]}
+
+    await group.set_words(db, group_id=db_group.id, word_ids=[word_ids[3], word_ids[2]])
+    positions = await group_positions(db, db_group.id)
+    assert sorted(positions) == [0, 1]
+    assert set(positions.values()) == {word_ids[2], word_ids[3]}
+
+    # Moving a member renumbers both groups
+    other = await group.create(db, obj_in=GroupCreate(name="Other", word_ids=[word_ids[0]]))
+    await db.execute(
+        update(WordGroup)
+        .where(WordGroup.group_id == db_group.id, WordGroup.word_id == positions[0])
+        .values(group_id=other.id)
+    )
+    await db.commit()
+    assert await group_positions(db, db_group.id) == {0: positions[1]}
+    assert await group_positions(db, other.id) == {0: word_ids[0], 1: positions[0]}
+
+    members = await group.get_members_at(db, group_id=other.id, positions=[1, 7])
+    assert members == {1: (positions[0], 0, 0)}
@@ -100,6 +100,27 @@ async def test_get_session_statistics(db: AsyncSession):
     assert stats.accuracy == 0.5  # 1 correct out of 2 total
 
 
+async def test_get_statistics_many(db: AsyncSession):
+    reviewed = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+    empty = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+    word_id = TEST_WORD_REVIEW["word_id"]
+    await session.create_word_reviews(
+        db,
+        session_id=reviewed.id,
+        reviews=[(word_id, True), (word_id, True), (word_id, False)]
+    )
+
+    stats = await session.get_statistics_many(db, [reviewed.id, empty.id, 999, reviewed.id])
+    assert set(stats) == {reviewed.id, empty.id}
+    assert stats[reviewed.id].total_reviews == 3
+    assert stats[reviewed.id].correct_reviews == 2
+    assert stats[empty.id].total_reviews == 0
+    assert stats[empty.id].correct_reviews == 0
+    assert stats[empty.id].accuracy == 0.0
+    assert await session.get_statistics_many(db, []) == {}
+    assert await session.get_session_statistics(db, 999) is None
+
+
 @pytest.mark.asyncio
 async def test_get_multi_with_reviews(db: AsyncSession):
     """Test getting multiple sessions with their reviews."""
@@ -1,11 +1,11 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import func, insert, select
 
 from app.crud.word import word
 from app.schemas.word import WordCreate
 from app.models.word import Word
-from tests.fixtures.test_data import TEST_WORD
+from tests.fixtures.test_data import TEST_WORD, TEST_WORD_2
 
 
 async def test_create_word(db: AsyncSession):
@@ -128,4 +128,135 @@ async def test_get_words_pagination(db: AsyncSession):
     
     # Get all words to verify total
     all_words = await word.get_multi(db)
-    assert len(all_words) == 2 
\ No newline at end of file
+    assert len(all_words) == 2 
+
+async def test_search_index_follows_writes(db: AsyncSession):
+    db_word = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+
+    words, total = await word.search(db, q="ake")
+    assert total == 1
+    assert words[0].id == db_word.id
+
+    # Kanji of the parts are searchable on their own
+    words, _ = await word.search(db, q="開")
+    assert [w.id for w in words] == [db_word.id]
+
+    # Updates replace the indexed text
+    await word.update(db, db_obj=db_word, obj_in={"english": "to unlock"})
+    assert (await word.search(db, q="open"))[1] == 0
+    assert (await word.search(db, q="unl"))[1] == 1
+
+    # Deleted words leave the index
+    await word.remove(db, id=db_word.id)
+    assert (await word.search(db, q="ake"))[1] == 0
+
+
+async def test_search_ranking_and_operators(db: AsyncSession):
+    make = await word.create(db, obj_in=WordCreate(**TEST_WORD_2))
+    await word.create(db, obj_in=WordCreate(
+        kanji="作家",
+        romaji="sakka",
+        english="writer who makes stories",
+        parts=[{"kanji": "作", "romaji": ["sa"]}, {"kanji": "家", "romaji": ["kka"]}]
+    ))
+
+    # A romaji match outranks an English one
+    words, total = await word.search(db, q="tsuku")
+    assert total == 1
+    words, total = await word.search(db, q="make")
+    assert total == 2
+    assert words[0].id == make.id
+
+    # FTS5 syntax in user input is treated as plain text
+    words, total = await word.search(db, q='"make* -(')
+    assert total == 2
+    assert (await word.search(db, q="***"))[1] == 0
+
+
+async def test_search_ranks_every_match(db: AsyncSession):
+    # Many weak English matches first in rowid order, the best match last
+    await db.execute(insert(Word), [
+        {"kanji": f"語{i}", "romaji": f"go{i}", "english": f"kawaii thing {i}", "parts": []}
+        for i in range(1500)
+    ])
+    best = await word.create(db, obj_in=WordCreate(
+        kanji="川", romaji="kawa", english="river", parts=[{"kanji": "川", "romaji": ["ka", "wa"]}]
+    ))
+    await word.rebuild_search_index(db)
+
+    words, total = await word.search(db, q="kaw", limit=5)
+    assert total == 1501
+    assert words[0].id == best.id
+
+
+async def test_rebuild_search_index(db: AsyncSession):
+    db.add(Word(**TEST_WORD))
+    await db.commit()
+    assert (await word.search(db, q="akeru"))[1] == 0
+
+    assert await word.rebuild_search_index(db) == 1
+    assert (await word.search(db, q="akeru"))[1] == 1
+    assert (await word.get_by_component(db, component="開"))[1] == 1
+
+
+async def test_component_index_follows_writes(db: AsyncSession):
+    tsukuru = await word.create(db, obj_in=WordCreate(**TEST_WORD_2))
+    sakka = await word.create(db, obj_in=WordCreate(
+        kanji="作家",
+        romaji="sakka",
+        english="writer",
+        parts=[{"kanji": "作", "romaji": ["sa"]}, {"kanji": "家", "romaji": ["kka"]}]
+    ))
+
+    words, total = await word.get_by_component(db, component="作")
+    assert total == 2
+    assert [w.id for w in words] == [tsukuru.id, sakka.id]
+    # The reading is the part's syllables joined; kana parts are not indexed
+    words, _ = await word.get_by_component(db, component="作", reading="tsuku")
+    assert [w.id for w in words] == [tsukuru.id]
+    assert (await word.get_by_component(db, component="る"))[1] == 0
+
+    related, total = await word.get_related(db, word_id=sakka.id)
+    assert total == 1
+    assert related[0][0].id == tsukuru.id
+    assert related[0][1] == ["作"]
+
+    # Updates replace the indexed parts, deletes remove them
+    await word.update(db, db_obj=sakka, obj_in={
+        "parts": [{"kanji": "家", "romaji": ["ie"]}]
+    })
+    assert (await word.get_by_component(db, component="作"))[1] == 1
+    assert (await word.get_by_component(db, component="家", reading="ie"))[1] == 1
+    await word.remove(db, id=sakka.id)
+    assert (await word.get_by_component(db, component="家"))[1] == 0
+
+
+async def test_related_words_ranked_by_shared_components(db: AsyncSession):
+    def parts(*kanji):
+        return [{"kanji": k, "romaji": ["x"]} for k in kanji]
+
+    undou = await word.create(db, obj_in=WordCreate(
+        kanji="運動する", romaji="undousuru", english="to exercise", parts=parts("運", "動", "す", "る")
+    ))
+    unten = await word.create(db, obj_in=WordCreate(
+        kanji="運転", romaji="unten", english="driving", parts=parts("運", "転")
+    ))
+    doubutsu = await word.create(db, obj_in=WordCreate(
+        kanji="動物", romaji="doubutsu", english="animal", parts=parts("動", "物")
+    ))
+    undouba = await word.create(db, obj_in=WordCreate(
+        kanji="運動場", romaji="undoujou", english="sports ground", parts=parts("運", "動", "場")
+    ))
+    await word.create(db, obj_in=WordCreate(
+        kanji="場所", romaji="basho", english="place", parts=parts("場", "所")
+    ))
+
+    related, total = await word.get_related(db, word_id=undou.id)
+    assert total == 3
+    assert [(w.id, shared) for w, shared in related] == [
+        (undouba.id, ["運", "動"]),
+        (unten.id, ["運"]),
+        (doubutsu.id, ["動"]),
+    ]
+    page, _ = await word.get_related(db, word_id=undou.id, skip=1, limit=1)
+    assert [w.id for w, _ in page] == [unten.id]
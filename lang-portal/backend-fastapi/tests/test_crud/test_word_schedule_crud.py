@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.group import group
+from app.crud.session import session
+from app.crud.word import word
+from app.crud.word_schedule import MAX_INTERVAL_DAYS, MIN_EASE, sm2_step, word_schedule
+from app.models.word_schedule import WordSchedule
+from app.schemas.group import GroupCreate
+from app.schemas.session import SessionCreate
+from app.schemas.word import WordCreate
+from tests.fixtures.test_data import TEST_SESSION, TEST_WORD, TEST_WORD_2
+
+
+def test_sm2_step():
+    start = datetime(2026, 1, 1)
+    state = None
+    intervals = []
+    for correct in [True, True, True]:
+        state = sm2_step(state, correct, start)
+        intervals.append(state["interval_days"])
+    assert intervals == [1.0, 6.0, 15.0]
+    assert state["repetitions"] == 3
+    assert state["next_due"] == start + timedelta(days=15)
+
+    # A miss starts the intervals over and makes the word harder
+    state = sm2_step(state, False, start)
+    assert (state["repetitions"], state["interval_days"]) == (0, 1.0)
+    assert state["ease"] == pytest.approx(1.96)
+    for _ in range(5):
+        state = sm2_step(state, False, start)
+    assert state["ease"] == MIN_EASE
+
+    # However long the streak, the next review stays a representable date
+    for _ in range(500):
+        state = sm2_step(state, True, start)
+    assert state["interval_days"] == MAX_INTERVAL_DAYS
+
+
+async def test_reviews_update_schedule(db: AsyncSession):
+    db_word = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+    db_session = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+
+    review = await session.create_word_review(
+        db, session_id=db_session.id, word_id=db_word.id, correct=True
+    )
+    schedule = await word_schedule.get(db, db_word.id)
+    assert schedule.repetitions == 1
+    assert schedule.next_due == review.created_at + timedelta(days=1)
+
+    # Reviews of the same word in one batch are applied in order
+    await session.create_word_reviews(
+        db, session_id=db_session.id, reviews=[(db_word.id, True), (db_word.id, True)]
+    )
+    await db.refresh(schedule)
+    assert schedule.repetitions == 3
+    assert schedule.interval_days == 15.0
+
+
+async def test_get_due(db: AsyncSession):
+    word_1 = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+    word_2 = await word.create(db, obj_in=WordCreate(**TEST_WORD_2))
+    db_group = await group.create(db, obj_in=GroupCreate(name="Due", word_ids=[word_2.id]))
+    db_session = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+    await session.create_word_reviews(
+        db,
+        session_id=db_session.id,
+        reviews=[(word_1.id, True), (word_1.id, True), (word_2.id, False)]
+    )
+
+    now = datetime.utcnow()
+    assert await word_schedule.get_due(db, now=now) == []
+
+    # word_2 (missed) is due after one day, word_1 after six
+    due = await word_schedule.get_due(db, now=now + timedelta(days=2))
+    assert [w.id for w, _ in due] == [word_2.id]
+    assert due[0][0].wrong_count == 1
+
+    due = await word_schedule.get_due(db, now=now + timedelta(days=7))
+    assert [w.id for w, _ in due] == [word_2.id, word_1.id]
+    due = await word_schedule.get_due(db, now=now + timedelta(days=7), limit=1)
+    assert [w.id for w, _ in due] == [word_2.id]
+    due = await word_schedule.get_due(
+        db, now=now + timedelta(days=7), group_id=db_group.id
+    )
+    assert [w.id for w, _ in due] == [word_2.id]
+
+
+async def test_rebuild_word_schedule(db: AsyncSession):
+    word_1 = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+    word_2 = await word.create(db, obj_in=WordCreate(**TEST_WORD_2))
+    db_session = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+    for word_id, correct in [(word_1.id, True), (word_2.id, False), (word_1.id, True)]:
+        await session.create_word_review(
+            db, session_id=db_session.id, word_id=word_id, correct=correct
+        )
+    expected = {
+        word_id: (s.repetitions, s.interval_days, s.ease, s.next_due)
+        for word_id in (word_1.id, word_2.id)
+        for s in [await word_schedule.get(db, word_id)]
+    }
+
+    # Simulate a missing backfill
+    await db.execute(delete(WordSchedule))
+    await db.commit()
+    assert await word_schedule.get(db, word_1.id) is None
+
+    assert await word_schedule.rebuild(db) == 2
+    for word_id, state in expected.items():
+        schedule = await word_schedule.get(db, word_id)
+        await db.refresh(schedule)
+        assert (schedule.repetitions, schedule.interval_days, schedule.ease, schedule.next_due) == state
@@ -0,0 +1,78 @@
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.session import session
+from app.crud.word import word
+from app.crud.word_stats import word_stats
+from app.models.word_stats import WordStats
+from app.schemas.session import SessionCreate
+from app.schemas.word import WordCreate
+from tests.fixtures.test_data import TEST_SESSION, TEST_WORD, TEST_WORD_2
+
+
+async def test_create_word_review_updates_stats(db: AsyncSession):
+    db_word = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+    db_session = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+
+    for correct in [True, True, False]:
+        review = await session.create_word_review(
+            db,
+            session_id=db_session.id,
+            word_id=db_word.id,
+            correct=correct
+        )
+
+    stats = await word_stats.get(db, db_word.id)
+    assert stats.correct_count == 2
+    assert stats.wrong_count == 1
+    assert stats.last_reviewed_at == review.created_at
+
+
+async def test_new_words_start_with_zero_stats(db: AsyncSession):
+    db_word = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+    stats = await word_stats.get(db, db_word.id)
+    assert (stats.correct_count, stats.wrong_count, stats.last_reviewed_at) == (0, 0, None)
+
+    # Rebuilding keeps a row for words that were never reviewed
+    await db.execute(delete(WordStats))
+    await db.commit()
+    assert await word_stats.rebuild(db) == 0
+    assert await word_stats.get(db, db_word.id) is not None
+
+
+async def test_words_sorted_by_rollup_stats(db: AsyncSession):
+    word_1 = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+    word_2 = await word.create(db, obj_in=WordCreate(**TEST_WORD_2))
+    db_session = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+    await session.create_word_review(
+        db, session_id=db_session.id, word_id=word_2.id, correct=False
+    )
+
+    words, total = await word.get_multi_with_stats(
+        db, order_by="wrong_count", order="desc"
+    )
+    assert total == 2
+    assert [w.id for w in words] == [word_2.id, word_1.id]
+    assert words[0].wrong_count == 1
+    assert words[1].wrong_count == 0
+
+
+async def test_rebuild_word_stats(db: AsyncSession):
+    db_word = await word.create(db, obj_in=WordCreate(**TEST_WORD))
+    db_session = await session.create(db, obj_in=SessionCreate(**TEST_SESSION))
+    for correct in [True, False, False]:
+        await session.create_word_review(
+            db, session_id=db_session.id, word_id=db_word.id, correct=correct
+        )
+
+    # Simulate a missing backfill
+    await db.execute(delete(WordStats))
+    await db.commit()
+    assert await word_stats.get(db, db_word.id) is None
+
+    rebuilt = await word_stats.rebuild(db)
+    assert rebuilt == 1
+    stats = await word_stats.get(db, db_word.id)
+    await db.refresh(stats)
+    assert stats.correct_count == 1
+    assert stats.wrong_count == 2
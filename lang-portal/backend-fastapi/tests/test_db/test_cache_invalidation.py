@@ -0,0 +1,88 @@
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core.cache import CachedResponse, ResponseCache
+from app.core.invalidation import SharedTableVersions
+
+BACKEND_DIR = Path(__file__).parents[2]
+
+# Another worker: commits a write through the same path the CRUD layer uses
+WRITER_SCRIPT = """
+import asyncio, sys
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from app.core.invalidation import record_writes
+
+async def main(path, table, count):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with AsyncSession(engine) as db:
+        for _ in range(count):
+            await record_writes(db, [table])
+            await db.commit()
+    await engine.dispose()
+
+asyncio.run(main(sys.argv[1], sys.argv[2], int(sys.argv[3])))
+"""
+
+
+def start_writer(path: Path, table: str, count: int = 1) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-c", WRITER_SCRIPT, str(path), table, str(count)],
+        cwd=BACKEND_DIR,
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path) -> Path:
+    path = tmp_path / "shared.db"
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE cache_generations ("
+        "table_name TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0)"
+    )
+    conn.close()
+    return path
+
+
+def test_write_in_other_process_invalidates(db_path: Path) -> None:
+    """Test that a commit by another process changes the affected ETags only."""
+    versions = SharedTableVersions(str(db_path))
+    cache = ResponseCache(maxsize=10)
+    words_etag = versions.etag(["words", "word_stats"])
+    groups_etag = versions.etag(["groups"])
+    cache.set("/api/words?", CachedResponse(words_etag, b"{}", "application/json"))
+
+    # Polling without writes does not re-read the generations
+    reloads = versions.reloads
+    assert versions.etag(["words", "word_stats"]) == words_etag
+    assert versions.reloads == reloads
+
+    assert start_writer(db_path, "words").wait(timeout=60) == 0
+
+    new_etag = versions.etag(["words", "word_stats"])
+    assert new_etag != words_etag
+    assert cache.get("/api/words?", new_etag) is None
+    assert versions.etag(["groups"]) == groups_etag
+    versions.close()
+
+
+def test_concurrent_writers_do_not_lose_generations(db_path: Path) -> None:
+    """Test that generations written by several processes all count."""
+    writers = [start_writer(db_path, "words", count=20) for _ in range(3)]
+    assert [writer.wait(timeout=120) for writer in writers] == [0, 0, 0]
+
+    versions = SharedTableVersions(str(db_path))
+    assert versions.get(["words"]) == (60,)
+    versions.close()
+
+
+def test_unreadable_generations_never_match(tmp_path: Path) -> None:
+    """Test that ETags change on every call while versions cannot be read."""
+    path = tmp_path / "empty.db"
+    sqlite3.connect(path).close()
+    versions = SharedTableVersions(str(path))
+    assert versions.etag(["words"]) != versions.etag(["words"])
@@ -0,0 +1,424 @@
+"""
+Query plan regression tests.
+
+Every scenario below drives the service and CRUD layer against a file
+database generated by `benchmarks.data`, which has the deployed schema
+and a large synthetic vocabulary and review history. Each statement
+executed is recorded and checked with `EXPLAIN QUERY PLAN`.
+A plan step that reads a whole table without an index fails the test, so
+a dropped index or a query that stops using one is caught here.
+"""
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Set, Tuple
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.pagination import encode_cursor
+from app.crud.activity import activity
+from app.crud.group import group
+from app.crud.session import session
+from app.crud.word import word
+from app.crud.word_schedule import word_schedule
+from app.crud.word_stats import word_stats
+from app.schemas.group import GroupUpdate
+from app.schemas.word import WordUpdate
+from app.services.activity_service import ActivityService
+from app.services.group_service import GroupService
+from app.services.session_service import SessionService
+from app.services.study_service import StudyService
+from app.services.word_service import WordService
+from benchmarks.data import DatasetSpec, generate
+
+DATASET = DatasetSpec(words=20_000, groups=200, sessions=5_000, reviews=100_000)
+
+# "SCAN t" (or "SCAN TABLE t" before SQLite 3.36) without an index; index
+# scans and virtual table lookups are reported with a suffix and pass
+FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)$")
+
+Scenario = Callable[[AsyncSession], Awaitable[object]]
+
+
+async def expect_error(call: Awaitable[object]) -> None:
+    """Run a call that is expected to fail validation after its lookups."""
+    try:
+        await call
+    except Exception:
+        pass
+
+
+async def add_review(db: AsyncSession) -> None:
+    """Review a word of the session's group, which passes validation."""
+    result = await db.execute(text(
+        "SELECT word_id FROM word_groups "
+        "WHERE group_id = (SELECT group_id FROM sessions WHERE id = 11) LIMIT 1"
+    ))
+    word_id = result.scalar_one()
+    await SessionService.add_review(db, session_id=11, word_id=word_id, correct=True)
+
+
+# name -> (scenario, tables it may scan in full and why)
+SCENARIOS: Dict[str, Tuple[Scenario, Set[str]]] = {
+    "words_by_romaji": (
+        lambda db: word.get_multi_with_stats(db, limit=20, order_by="romaji"),
+        set(),
+    ),
+    "words_by_english_desc_page_50": (
+        lambda db: word.get_multi_with_stats(
+            db, skip=1000, limit=20, order_by="english", order="desc"
+        ),
+        set(),
+    ),
+    "words_by_kanji_cursor": (
+        lambda db: word.get_multi_with_stats(
+            db, limit=20, order_by="kanji", cursor=encode_cursor("kanji", "語0500", 500)
+        ),
+        set(),
+    ),
+    "words_by_correct_count": (
+        lambda db: word.get_multi_with_stats(db, limit=20, order_by="correct_count"),
+        set(),
+    ),
+    "words_by_wrong_count_desc_page_50": (
+        lambda db: word.get_multi_with_stats(
+            db, skip=1000, limit=20, order_by="wrong_count", order="desc"
+        ),
+        set(),
+    ),
+    "words_by_english_desc_cursor": (
+        lambda db: word.get_multi_with_stats(
+            db, limit=20, order_by="english", order="desc",
+            cursor=encode_cursor("english", "word 500", 500)
+        ),
+        set(),
+    ),
+    "words_by_correct_count_cursor": (
+        lambda db: word.get_multi_with_stats(
+            db, limit=20, order_by="correct_count", cursor=encode_cursor("correct_count", 1, 500)
+        ),
+        set(),
+    ),
+    # Without a sort field rows are read in rowid order, stopping at LIMIT
+    "words_default_order_count_estimate": (
+        lambda db: word.get_multi_with_stats(db, limit=20, count_mode="estimate"),
+        {"words"},
+    ),
+    "word_search": (lambda db: word.search(db, q="wor"), set()),
+    "word_with_groups": (lambda db: word.get_with_groups(db, word_id=42), set()),
+    "word_missing_ids": (lambda db: word.get_missing_ids(db, [1, 2, DATASET.words + 1]), set()),
+    "word_group_membership": (
+        lambda db: word.get_group_membership(db, word_ids=[1, 2, 3], group_id=1),
+        set(),
+    ),
+    "word_stats": (lambda db: word_stats.get(db, 42), set()),
+    "words_by_component": (
+        lambda db: WordService.get_words_by_component(db, component=chr(0x4E42)),
+        set(),
+    ),
+    "words_by_component_reading": (
+        lambda db: word.get_by_component(db, component=chr(0x4E42), reading="ka"),
+        set(),
+    ),
+    "related_words": (lambda db: WordService.get_related_words(db, 42), set()),
+    "create_duplicate_word": (
+        lambda db: expect_error(WordService.create_word(
+            db, kanji="語1", romaji="go", english="word", parts=[]
+        )),
+        set(),
+    ),
+    "update_word": (
+        lambda db: WordService.update_word(
+            db, word_id=7, word_in=WordUpdate(english="renamed word")
+        ),
+        set(),
+    ),
+    "delete_word": (lambda db: WordService.delete_word(db, word_id=99), set()),
+    "groups_by_name": (
+        lambda db: group.get_multi(db, limit=20, order_by="name"),
+        set(),
+    ),
+    "groups_by_words_count": (
+        lambda db: group.get_multi(db, limit=20, order_by="words_count", order="desc"),
+        set(),
+    ),
+    "group_words": (
+        lambda db: group.get_group_words(db, group_id=3, limit=20, order_by="romaji"),
+        set(),
+    ),
+    "group_words_count_estimate": (
+        lambda db: group.get_group_words(db, group_id=3, count_mode="estimate"),
+        set(),
+    ),
+    "sample_group_words": (
+        lambda db: GroupService.sample_words(db, group_id=3, n=20),
+        set(),
+    ),
+    "sample_group_words_weak": (
+        lambda db: GroupService.sample_words(db, group_id=3, n=20, strategy="weak"),
+        set(),
+    ),
+    "group_pack": (
+        lambda db: GroupService.get_word_pack(db, 3),
+        set(),
+    ),
+    "create_duplicate_group": (
+        lambda db: expect_error(GroupService.create_group(db, name="Group 1")),
+        set(),
+    ),
+    "set_group_words": (
+        lambda db: GroupService.update_group(
+            db, group_id=5, group_in=GroupUpdate(word_ids=list(range(200, 350)))
+        ),
+        set(),
+    ),
+    "add_group_words": (
+        lambda db: group.add_words(db, group_id=6, word_ids=[1, 2, 3]),
+        set(),
+    ),
+    "study_due": (lambda db: StudyService.get_due_words(db, limit=20), set()),
+    "study_due_in_group": (
+        lambda db: StudyService.get_due_words(db, group_id=3, limit=20),
+        set(),
+    ),
+    # Replays the whole history by design
+    "rebuild_word_schedule": (word_schedule.rebuild, {"word_review_items"}),
+    "activities_by_name": (
+        lambda db: activity.get_multi(db, limit=20, order_by="name"),
+        set(),
+    ),
+    "create_duplicate_activity": (
+        lambda db: expect_error(ActivityService.create_activity(
+            db, name="Activity 1", url="http://example.com", description="d"
+        )),
+        set(),
+    ),
+    "sessions_default_order": (
+        lambda db: session.get_multi_with_reviews(db, limit=20),
+        {"sessions"},
+    ),
+    "sessions_by_created_at": (
+        lambda db: session.get_multi_with_reviews(db, limit=20, order_by="created_at"),
+        set(),
+    ),
+    "sessions_by_group": (
+        lambda db: session.get_multi_with_reviews(db, limit=20, order_by="group_id"),
+        set(),
+    ),
+    "sessions_by_activity": (
+        lambda db: session.get_multi_with_reviews(db, limit=20, order_by="activity_id"),
+        set(),
+    ),
+    "sessions_by_created_at_desc_cursor": (
+        lambda db: session.get_multi(
+            db, limit=20, order_by="created_at", order="desc",
+            cursor=encode_cursor("created_at", datetime(2026, 2, 1), 2000)
+        ),
+        set(),
+    ),
+    # group_id is nullable: its NULL rows follow every group when descending
+    "sessions_by_group_desc_cursor": (
+        lambda db: session.get_multi(
+            db, limit=20, order_by="group_id", order="desc",
+            cursor=encode_cursor("group_id", 100, 2000)
+        ),
+        set(),
+    ),
+    "session_with_reviews": (lambda db: session.get_with_reviews(db, 10), set()),
+    "session_stats": (lambda db: SessionService.get_session_stats(db, 10), set()),
+    "sessions_stats_batch": (
+        lambda db: SessionService.get_sessions_stats(db, list(range(100, 160))),
+        set(),
+    ),
+    "session_summaries": (
+        lambda db: SessionService.get_session_summaries(
+            db, limit=20, order_by="created_at", order="desc", count_mode="none"
+        ),
+        set(),
+    ),
+    "session_reviews_page": (
+        lambda db: session.get_reviews(db, 10, cursor=encode_cursor(None, None, 5)),
+        set(),
+    ),
+    "add_review": (add_review, set()),
+}
+
+
+# Scenarios whose page must be read in order from an index, not sorted
+INDEX_ORDERED = {
+    "words_by_romaji",
+    "words_by_correct_count",
+    "words_by_wrong_count_desc_page_50",
+    "words_by_correct_count_cursor",
+    "session_reviews_page",
+}
+SORT_STEP = re.compile(r"^USE TEMP B-TREE FOR (?:RIGHT PART OF )?ORDER BY$")
+
+# Scenarios that page with a cursor, which must seek past it in an index
+CURSOR_PAGES = {
+    "words_by_kanji_cursor",
+    "words_by_english_desc_cursor",
+    "words_by_correct_count_cursor",
+    "sessions_by_created_at_desc_cursor",
+    "sessions_by_group_desc_cursor",
+    "session_reviews_page",
+}
+INDEX_WALK = re.compile(r"^SCAN (?:TABLE )?\w+ USING (?:COVERING )?INDEX ")
+INDEX_SEEK = re.compile(r"^SEARCH (?:TABLE )?\w+ USING (?:COVERING )?INDEX \w+ \([^)]*[<>]\?\)$")
+
+# Scenarios whose page must start from a narrow index seek, and its first step
+BOUNDED_BY = {
+    "study_due_in_group": re.compile(
+        r"^SEARCH word_groups USING (?:COVERING )?INDEX idx_word_groups_group_id \(group_id=\?\)$"
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def seeded_db(tmp_path_factory) -> Tuple[Path, Set[str]]:
+    """The generated database and the names of its tables."""
+    path = tmp_path_factory.mktemp("plans") / "plans.db"
+    generate(path, DATASET)
+    conn = sqlite3.connect(path)
+    try:
+        tables = {
+            name for name, in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+    finally:
+        conn.close()
+    return path, tables
+
+
+def query_plan(conn: sqlite3.Connection, statement: str, parameters) -> List[str]:
+    """The detail column of every step of the plan of `statement`."""
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [detail for *_, detail in plan]
+
+
+def full_scans(
+    conn: sqlite3.Connection,
+    statement: str,
+    parameters,
+    tables: Set[str]
+) -> Set[str]:
+    """Tables the plan of `statement` reads in full."""
+    plan = query_plan(conn, statement, parameters)
+    # Subqueries and CTEs show up as scans of their alias; only tables count
+    return {
+        m.group(1) for detail in plan
+        if (m := FULL_SCAN.match(detail)) and m.group(1) in tables
+    }
+
+
+async def run_scenario(path: Path, scenario: Scenario) -> List[Tuple[str, tuple]]:
+    """Run a scenario on the database at `path`; returns the statements it executed."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    statements: List[Tuple[str, tuple]] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "INSERT")):
+            statements.append((statement, parameters[0] if executemany else parameters))
+
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await scenario(db)
+    finally:
+        await engine.dispose()
+    assert statements
+    return statements
+
+
+@pytest.mark.parametrize("name", list(SCENARIOS))
+async def test_crud_queries_use_indexes(
+    seeded_db: Tuple[Path, Set[str]],
+    name: str
+) -> None:
+    """Test that no query of the scenario scans a whole table unexpectedly."""
+    path, tables = seeded_db
+    scenario, allowed = SCENARIOS[name]
+    statements = await run_scenario(path, scenario)
+
+    conn = sqlite3.connect(path)
+    try:
+        offenders = {
+            statement: scans
+            for statement, parameters in statements
+            if (scans := full_scans(conn, statement, parameters, tables) - allowed)
+        }
+    finally:
+        conn.close()
+    assert not offenders, f"Full table scans in {name}: {offenders}"
+
+
+@pytest.mark.parametrize("name", sorted(INDEX_ORDERED))
+async def test_pages_read_in_index_order(
+    seeded_db: Tuple[Path, Set[str]],
+    name: str
+) -> None:
+    """Test that sorted pages are not sorted in a temporary b-tree."""
+    path, _ = seeded_db
+    scenario, _ = SCENARIOS[name]
+    statements = await run_scenario(path, scenario)
+
+    conn = sqlite3.connect(path)
+    try:
+        for statement, parameters in statements:
+            if "ORDER BY" not in statement:
+                continue
+            plan = query_plan(conn, statement, parameters)
+            assert not any(SORT_STEP.match(detail) for detail in plan), plan
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("name", sorted(CURSOR_PAGES))
+async def test_cursor_pages_seek(
+    seeded_db: Tuple[Path, Set[str]],
+    name: str
+) -> None:
+    """Test that a cursor page seeks to its start instead of walking an index from the first row."""
+    path, _ = seeded_db
+    scenario, _ = SCENARIOS[name]
+    statements = await run_scenario(path, scenario)
+
+    conn = sqlite3.connect(path)
+    try:
+        pages = [
+            query_plan(conn, statement, parameters)
+            for statement, parameters in statements
+            if "ORDER BY" in statement
+        ]
+    finally:
+        conn.close()
+    assert pages
+    for plan in pages:
+        assert not any(INDEX_WALK.match(detail) for detail in plan), plan
+        assert any(INDEX_SEEK.match(detail) for detail in plan), plan
+
+
+@pytest.mark.parametrize("name", sorted(BOUNDED_BY))
+async def test_pages_start_from_narrow_seek(
+    seeded_db: Tuple[Path, Set[str]],
+    name: str
+) -> None:
+    """Test that a filtered page is read from its filter's index, not a wider ordered index."""
+    path, _ = seeded_db
+    scenario, _ = SCENARIOS[name]
+    statements = await run_scenario(path, scenario)
+
+    conn = sqlite3.connect(path)
+    try:
+        pages = [
+            query_plan(conn, statement, parameters)
+            for statement, parameters in statements
+            if "ORDER BY" in statement
+        ]
+    finally:
+        conn.close()
+    assert pages
+    for plan in pages:
+        assert BOUNDED_BY[name].match(plan[0]), plan
@@ -0,0 +1,128 @@
+import logging
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import get_settings
+from app.core.database import (
+    check_database,
+    create_read_engine,
+    engine_options,
+    install_sqlite_pragmas,
+    read_only_url,
+    sqlite_pragmas,
+)
+
+
+@pytest.fixture
+async def file_engine(tmp_path):
+    """Engine on a temporary database file with the configured pragmas."""
+    settings = get_settings().model_copy(
+        update={"DATABASE_URL": f"sqlite+aiosqlite:///{tmp_path / 'tuning.db'}"}
+    )
+    engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings))
+    install_sqlite_pragmas(engine, sqlite_pragmas(settings))
+    yield engine, settings
+    await engine.dispose()
+
+
+def test_engine_options() -> None:
+    """Test that echo is off by default and file databases get a sized pool."""
+    settings = get_settings().model_copy(update={
+        "DATABASE_URL": "sqlite+aiosqlite:////tmp/app.db",
+        "DB_POOL_SIZE": 3,
+        "DB_MAX_OVERFLOW": 2,
+    })
+    options = engine_options(settings)
+    assert options["echo"] is False
+    assert options["pool_size"] == 3
+    assert options["max_overflow"] == 2
+
+    memory = settings.model_copy(update={"DATABASE_URL": "sqlite+aiosqlite:///:memory:"})
+    assert "pool_size" not in engine_options(memory)
+
+
+async def test_pragmas_applied_to_connections(file_engine) -> None:
+    """Test that every pooled connection has the configured pragmas."""
+    engine, settings = file_engine
+    report = await check_database(engine, settings)
+    assert report["journal_mode"] == "wal"
+    assert report["synchronous"] == 1
+    assert report["cache_size"] == settings.SQLITE_CACHE_SIZE
+    assert report["temp_store"] == 2
+    assert report["busy_timeout"] == settings.SQLITE_BUSY_TIMEOUT_MS
+    assert report["pool_size"] == settings.DB_POOL_SIZE
+
+    # A second, concurrently checked out connection is tuned as well
+    async with engine.connect() as first, engine.connect() as second:
+        for conn in (first, second):
+            result = await conn.execute(text("PRAGMA busy_timeout"))
+            assert result.scalar() == settings.SQLITE_BUSY_TIMEOUT_MS
+
+
+async def test_writer_not_blocked_by_open_reader(file_engine) -> None:
+    """Test that a review write commits while a read transaction is open."""
+    engine, _ = file_engine
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        await conn.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+    async with engine.connect() as reader, engine.connect() as writer:
+        await reader.exec_driver_sql("BEGIN")
+        result = await reader.execute(text("SELECT COUNT(*) FROM items"))
+        assert result.scalar() == 1
+
+        # With a rollback journal this commit would wait for the reader
+        await writer.execute(text("INSERT INTO items (id) VALUES (2)"))
+        await writer.commit()
+
+        # The reader keeps its snapshot until its transaction ends
+        result = await reader.execute(text("SELECT COUNT(*) FROM items"))
+        assert result.scalar() == 1
+        await reader.exec_driver_sql("COMMIT")
+
+
+async def test_check_database_warns_on_mismatch(caplog) -> None:
+    """Test that the self-check reports pragmas SQLite did not accept."""
+    settings = get_settings()
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    install_sqlite_pragmas(engine, sqlite_pragmas(settings))
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.core.database"):
+            report = await check_database(engine, settings)
+    finally:
+        await engine.dispose()
+    # In-memory databases cannot use WAL
+    assert report["journal_mode"] == "memory"
+    assert "journal_mode" in caplog.text
+
+
+async def test_read_engine_is_read_only(file_engine) -> None:
+    """Test that the read engine sees committed data but cannot write."""
+    engine, settings = file_engine
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        await conn.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+    read_engine = create_read_engine(settings, engine)
+    assert read_engine is not engine
+    try:
+        async with read_engine.connect() as conn:
+            result = await conn.execute(text("SELECT COUNT(*) FROM items"))
+            assert result.scalar() == 1
+            assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+            with pytest.raises(OperationalError, match="readonly|read-only"):
+                await conn.execute(text("INSERT INTO items (id) VALUES (2)"))
+    finally:
+        await read_engine.dispose()
+
+
+def test_read_engine_falls_back_for_memory() -> None:
+    """Test that in-memory databases share the write engine."""
+    assert read_only_url("sqlite+aiosqlite:///:memory:") is None
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    settings = get_settings().model_copy(
+        update={"DATABASE_URL": "sqlite+aiosqlite:///:memory:"}
+    )
+    assert create_read_engine(settings, engine) is engine
@@ -85,6 +85,24 @@ def test_paginated_response():
     assert empty_response.total == 0
     assert empty_response.total_pages == 0
 
+    # Totals may be left uncounted, but only together
+    uncounted_response = PaginatedResponse[TestItem](
+        items=items,
+        total=None,
+        page=1,
+        per_page=2,
+        total_pages=None
+    )
+    assert uncounted_response.total is None
+    with pytest.raises(ValidationError):
+        PaginatedResponse[TestItem](
+            items=items,
+            total=None,
+            page=1,
+            per_page=2,
+            total_pages=5
+        )
+
     # Test invalid data
     with pytest.raises(ValidationError):
         PaginatedResponse[TestItem](
@@ -1,10 +1,13 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy import event, text
+
+import random
 
 from app.services.group_service import GroupService
 from app.models.group import Group
 from app.models.word import Word
+from app.models.word_stats import WordStats
 from app.schemas.group import GroupUpdate
 
 pytestmark = pytest.mark.asyncio
@@ -143,6 +146,31 @@ async def test_create_group_invalid_word(db: AsyncSession) -> None:
         )
     assert "not found" in str(exc_info.value)
 
+async def test_create_group_reports_all_missing_words(
+    db: AsyncSession, test_word: Word
+) -> None:
+    """Test that one existence check reports every missing word ID."""
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    engine = db.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        with pytest.raises(ValueError) as exc_info:
+            await GroupService.create_group(
+                db,
+                name="Test Group",
+                word_ids=[999998, test_word.id, 999999]
+            )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert "999998, 999999 not found" in str(exc_info.value)
+    # One query for the name check, one for all of the words
+    assert len(statements) == 2
+
 async def test_update_group(db: AsyncSession, test_group: Group) -> None:
     """Test updating a group's name."""
     group_update = GroupUpdate(name="Updated Group")
@@ -238,4 +266,49 @@ async def test_delete_group(db: AsyncSession, test_group: Group) -> None:
     """Test deleting a group."""
     await GroupService.delete_group(db, group_id=test_group.id)
     deleted_group = await GroupService.get_group(db, test_group.id)
-    assert deleted_group is None 
\ No newline at end of file
+    assert deleted_group is None 
+
+async def test_sample_words(db: AsyncSession, test_group: Group) -> None:
+    """Test drawing random study sets, uniform and favouring missed words."""
+    words = [
+        Word(kanji="語", romaji=f"go{i}", english=f"word {i}", parts=[])
+        for i in range(30)
+    ]
+    db.add_all(words)
+    await db.flush()
+    # Three words missed every time, the rest always answered correctly
+    weak_ids = {w.id for w in words[:3]}
+    for w in words:
+        await db.merge(WordStats(word_id=w.id, correct_count=0 if w.id in weak_ids else 20,
+                                 wrong_count=20 if w.id in weak_ids else 0))
+    await db.commit()
+    await GroupService.update_group(
+        db,
+        group_id=test_group.id,
+        group_in=GroupUpdate(word_ids=[w.id for w in words])
+    )
+
+    rng = random.Random(7)
+    sample = await GroupService.sample_words(db, group_id=test_group.id, n=10, rng=rng)
+    assert len({w.id for w in sample}) == 10
+    assert all(w.id in {x.id for x in words} for w in sample)
+
+    picked = []
+    for _ in range(20):
+        sample = await GroupService.sample_words(
+            db, group_id=test_group.id, n=3, strategy="weak", rng=rng
+        )
+        assert len({w.id for w in sample}) == 3
+        picked.extend(w.id for w in sample)
+    # 10% of the picks if drawn uniformly, about 70% with these weights
+    assert sum(word_id in weak_ids for word_id in picked) > len(picked) * 0.5
+
+    # Asking for more than the group holds returns all of it
+    sample = await GroupService.sample_words(db, group_id=test_group.id, n=50, strategy="weak")
+    assert {w.id for w in sample} == {w.id for w in words}
+    assert next(w for w in sample if w.id in weak_ids).wrong_count == 20
+
+async def test_sample_words_nonexistent_group(db: AsyncSession) -> None:
+    """Test sampling from a nonexistent group raises ValueError."""
+    with pytest.raises(ValueError, match="Group 999999 not found"):
+        await GroupService.sample_words(db, group_id=999999, n=5)
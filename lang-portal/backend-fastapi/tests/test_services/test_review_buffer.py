@@ -0,0 +1,147 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.group import group
+from app.crud.word_stats import word_stats
+from app.models.group import Group
+from app.models.session import Session
+from app.models.word import Word
+from app.models.word_review_item import WordReviewItem
+from app.services.review_buffer import ReviewBuffer, ReviewBufferUnavailable
+from app.services.session_service import SessionService
+
+
+@pytest.fixture
+def session_factory(db: AsyncSession):
+    """Sessions on the test connection, since each connection to :memory: is a new database."""
+    @asynccontextmanager
+    async def shared_session():
+        connection = await db.connection()
+        async with AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+    return shared_session
+
+
+@pytest.fixture
+async def buffer(session_factory):
+    review_buffer = ReviewBuffer(session_factory, flush_interval=0.01, flush_size=50)
+    review_buffer.start()
+    yield review_buffer
+    await review_buffer.stop()
+
+
+async def review_count(db: AsyncSession) -> int:
+    return await db.scalar(select(func.count()).select_from(WordReviewItem))
+
+
+async def test_buffered_reviews_share_a_flush(
+    db: AsyncSession,
+    buffer: ReviewBuffer,
+    test_session: Session,
+    test_word: Word
+) -> None:
+    for i in range(20):
+        await buffer.submit(session_id=test_session.id, word_id=test_word.id, correct=i % 2 == 0)
+    assert await review_count(db) == 0
+
+    await buffer.flush()
+    assert await review_count(db) == 20
+    assert buffer.written == 20
+    assert buffer.flushes == 1
+
+    stats = await word_stats.get(db, test_word.id)
+    assert (stats.correct_count, stats.wrong_count) == (10, 10)
+
+
+async def test_flush_size_flushes_early(
+    db: AsyncSession,
+    session_factory,
+    test_session: Session,
+    test_word: Word
+) -> None:
+    review_buffer = ReviewBuffer(session_factory, flush_interval=60, flush_size=5)
+    review_buffer.start()
+    try:
+        for _ in range(5):
+            await review_buffer.submit(session_id=test_session.id, word_id=test_word.id, correct=True)
+        for _ in range(100):
+            if review_buffer.written == 5:
+                break
+            await asyncio.sleep(0.01)
+        assert review_buffer.written == 5
+    finally:
+        await review_buffer.stop()
+
+
+async def test_full_buffer_pushes_back(
+    db: AsyncSession,
+    session_factory,
+    test_session: Session,
+    test_word: Word
+) -> None:
+    # The writer holds the first review for the whole interval, the queue the second
+    review_buffer = ReviewBuffer(
+        session_factory, max_size=1, flush_interval=60, submit_timeout=0.01
+    )
+    review_buffer.start()
+    try:
+        await review_buffer.submit(session_id=test_session.id, word_id=test_word.id, correct=True)
+        await asyncio.sleep(0)
+        await review_buffer.submit(session_id=test_session.id, word_id=test_word.id, correct=True)
+        with pytest.raises(ReviewBufferUnavailable, match="full"):
+            await review_buffer.submit(session_id=test_session.id, word_id=test_word.id, correct=True)
+    finally:
+        await review_buffer.stop()
+
+    # Stopping writes what was accepted and turns new reviews away
+    assert await review_count(db) == 2
+    with pytest.raises(ReviewBufferUnavailable):
+        await review_buffer.submit(session_id=test_session.id, word_id=test_word.id, correct=True)
+
+
+async def test_failed_row_does_not_lose_batch(
+    db: AsyncSession,
+    buffer: ReviewBuffer,
+    test_session: Session,
+    test_word: Word
+) -> None:
+    await buffer.submit(session_id=test_session.id, word_id=test_word.id, correct=True)
+    # Bypasses validation; violates NOT NULL when written
+    await buffer.submit(session_id=None, word_id=test_word.id, correct=True)
+    await buffer.submit(session_id=test_session.id, word_id=test_word.id, correct=False)
+
+    await buffer.flush()
+    assert await review_count(db) == 2
+    assert (buffer.written, buffer.failed) == (2, 1)
+
+
+async def test_queue_review_validates(
+    db: AsyncSession,
+    buffer: ReviewBuffer,
+    test_session: Session,
+    test_word: Word,
+    test_group: Group
+) -> None:
+    with pytest.raises(ValueError, match="does not belong"):
+        await SessionService.queue_review(
+            db, buffer, session_id=test_session.id, word_id=test_word.id, correct=True
+        )
+    with pytest.raises(ValueError, match="Session 999 not found"):
+        await SessionService.queue_review(
+            db, buffer, session_id=999, word_id=test_word.id, correct=True
+        )
+
+    await group.add_words(db, group_id=test_group.id, word_ids=[test_word.id])
+    queued = await SessionService.queue_review(
+        db, buffer, session_id=test_session.id, word_id=test_word.id, correct=True
+    )
+    assert queued["session_id"] == test_session.id
+    assert "id" not in queued
@@ -0,0 +1,84 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.group import group
+from app.models.group import Group
+from app.models.session import Session
+from app.models.word import Word
+from app.schemas.session import WordReviewCreate
+from app.services.review_stream import MAX_MESSAGE_REVIEWS, ReviewStream
+from app.services.session_service import SessionService
+
+
+def test_parse_messages() -> None:
+    """Test a message is one review or a list of them."""
+    assert ReviewStream.parse({"word_id": 1, "correct": True}) == [
+        WordReviewCreate(word_id=1, correct=True)
+    ]
+    assert len(ReviewStream.parse([{"word_id": 1, "correct": True}] * 2)) == 2
+
+    for message in [[], [{"word_id": 1, "correct": True}] * (MAX_MESSAGE_REVIEWS + 1)]:
+        with pytest.raises(ValueError, match="reviews per message"):
+            ReviewStream.parse(message)
+    for message in [{"word_id": 1}, "review", None]:
+        with pytest.raises(ValueError, match="Invalid review"):
+            ReviewStream.parse(message)
+
+
+async def test_open_nonexistent_session(db: AsyncSession) -> None:
+    """Test a stream cannot be opened for a missing session."""
+    with pytest.raises(ValueError, match="Session 999999 not found"):
+        await ReviewStream.open(db, 999999)
+
+
+async def test_due_by_size_and_interval(db: AsyncSession, test_session: Session) -> None:
+    """Test pending reviews are due once flush_size are queued or flush_interval has passed."""
+    review = WordReviewCreate(word_id=1, correct=True)
+
+    stream = await ReviewStream.open(db, test_session.id, flush_size=2, flush_interval=60)
+    assert stream.time_to_flush() is None
+    stream.add([review])
+    assert not stream.due()
+    stream.add([review])
+    assert stream.due()
+
+    stream = await ReviewStream.open(db, test_session.id, flush_size=2, flush_interval=0)
+    assert not stream.due()
+    stream.add([review])
+    assert stream.due()
+    assert stream.time_to_flush() == 0
+
+
+async def test_flush_updates_stats(
+    db: AsyncSession,
+    test_session: Session,
+    test_word: Word,
+    test_group: Group
+) -> None:
+    """Test batches keep stream-wide indexes and the running statistics match the database."""
+    await group.add_words(db, group_id=test_group.id, word_ids=[test_word.id])
+    await SessionService.add_review(db, session_id=test_session.id, word_id=test_word.id, correct=True)
+
+    stream = await ReviewStream.open(db, test_session.id)
+    assert stream.stats().total_reviews == 1
+
+    stream.add([WordReviewCreate(word_id=test_word.id, correct=False)])
+    assert [r.index for r in await stream.flush(db)] == [0]
+    stream.add([
+        WordReviewCreate(word_id=999999, correct=True),
+        WordReviewCreate(word_id=test_word.id, correct=True)
+    ])
+    results = await stream.flush(db)
+    assert [r.index for r in results] == [1, 2]
+    assert results[0].error == "Word 999999 not found"
+    assert await stream.flush(db) == []
+
+    message = stream.message(results)["data"]
+    assert (message["accepted"], message["rejected"]) == (1, 1)
+    stats = await SessionService.get_session_stats(db, test_session.id)
+    assert stream.stats().model_dump() == {
+        "total_reviews": stats["total_reviews"],
+        "correct_reviews": stats["correct_reviews"],
+        "accuracy": stats["accuracy"]
+    }
+    assert stats["total_reviews"] == 3
@@ -0,0 +1,130 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.invalidation import table_versions
+from app.models.word import Word
+from app.schemas.word import WordUpdate
+from app.services.romaji_matcher import (
+    MatcherCache,
+    RomajiMatcher,
+    normalize_answer,
+    syllable_spellings
+)
+from app.services.word_service import WordService
+
+DOUKASU = [
+    {"kanji": "動", "romaji": ["do", "u"]},
+    {"kanji": "か", "romaji": ["ka"]},
+    {"kanji": "す", "romaji": ["su"]}
+]
+SHITSUMON = [
+    {"kanji": "質", "romaji": ["shi", "tsu"]},
+    {"kanji": "問", "romaji": ["mo", "n"]}
+]
+
+
+def test_normalize_answer() -> None:
+    """Test answers are lowercased, long vowels spelled out and separators dropped."""
+    assert normalize_answer("DŌ kasu") == "doukasu"
+    assert normalize_answer("kan'i") == "kani"
+    assert normalize_answer("ｓｈｉ") == "shi"
+
+
+def test_syllable_spellings() -> None:
+    """Test every romanization of a syllable is accepted, the given one first."""
+    assert syllable_spellings("shi") == ("shi", "si")
+    assert set(syllable_spellings("cho")) == {"cho", "tyo", "cyo"}
+    assert syllable_spellings("n") == ("n", "nn")
+    assert syllable_spellings("ka") == ("ka",)
+
+
+def test_match_statuses() -> None:
+    """Test complete, incomplete and wrong answers."""
+    matcher = RomajiMatcher.compile(DOUKASU, "doukasu")
+    assert matcher.match("doukasu").status == "correct"
+    assert matcher.match("dōkasu").status == "correct"
+    assert matcher.match("DOU KASU").status == "correct"
+    assert matcher.match("douka").status == "partial"
+    assert matcher.match("").status == "partial"
+
+    result = matcher.match("douks")
+    assert result.status == "wrong"
+    assert result.matched == 4
+
+
+def test_match_romanization_variants() -> None:
+    """Test any mix of Hepburn and Kunrei spellings is accepted."""
+    matcher = RomajiMatcher.compile(SHITSUMON, "shitsumon")
+    for answer in ["shitsumon", "situmon", "shitumon", "situmonn"]:
+        assert matcher.match(answer).status == "correct", answer
+    assert matcher.match("shitsumo").status == "partial"
+    assert matcher.match("shitsumin").status == "wrong"
+
+
+def test_match_romaji_field_without_parts() -> None:
+    """Test a word's romaji is accepted even when its parts list no readings."""
+    matcher = RomajiMatcher.compile([{"kanji": "動", "romaji": []}], "ugoku")
+    assert matcher.match("ugoku").status == "correct"
+    assert matcher.match("x").status == "wrong"
+
+
+def test_cache_revalidates_after_words_change() -> None:
+    """Test cached matchers are dropped on writes and recompiled only if the readings changed."""
+    cache = MatcherCache(maxsize=2)
+    cache.put(1, DOUKASU, "doukasu")
+    assert cache.get(1) is not None
+    assert cache.compiles == 1
+
+    table_versions.bump("words")
+    assert cache.get(1) is None
+    cache.put(1, DOUKASU, "doukasu")
+    assert cache.compiles == 1
+    assert cache.get(1) is not None
+
+    table_versions.bump("words")
+    assert cache.get(1) is None
+    matcher = cache.put(1, SHITSUMON, "shitsumon")
+    assert cache.compiles == 2
+    assert matcher.match("situmon").status == "correct"
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Test the cache keeps at most maxsize matchers."""
+    cache = MatcherCache(maxsize=2)
+    cache.put(1, DOUKASU, "doukasu")
+    cache.put(2, SHITSUMON, "shitsumon")
+    cache.get(1)
+    cache.put(3, DOUKASU, "doukasu")
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+    assert cache.get(3) is not None
+
+
+async def test_check_answer_after_update(db: AsyncSession, test_word: Word) -> None:
+    """Test an updated word is checked against its new readings."""
+    result = await WordService.check_answer(db, word_id=test_word.id, answer="akeru")
+    assert result.status == "correct"
+
+    await WordService.update_word(
+        db,
+        word_id=test_word.id,
+        word_in=WordUpdate(
+            romaji="shitsumon",
+            parts=SHITSUMON
+        )
+    )
+    result = await WordService.check_answer(db, word_id=test_word.id, answer="akeru")
+    assert result.status == "wrong"
+    result = await WordService.check_answer(db, word_id=test_word.id, answer="situmon")
+    assert result.status == "correct"
+
+
+async def test_check_answers_missing_word(db: AsyncSession, test_word: Word) -> None:
+    """Test a batch reports missing words without failing the other answers."""
+    results = await WordService.check_answers(db, [(999999, "a"), (test_word.id, "a")])
+    assert results[0].detail == "Word 999999 not found"
+    assert results[0].status is None
+    assert results[1].status == "partial"
+
+    with pytest.raises(ValueError):
+        await WordService.check_answer(db, word_id=999999, answer="a")
@@ -9,7 +9,7 @@ from app.models.activity import Activity
 from app.crud.group import group
 from app.core.exceptions import AppHTTPException
 from app.crud.session import session
-from app.schemas.session import SessionCreate
+from app.schemas.session import SessionCreate, WordReviewCreate
 
 pytestmark = pytest.mark.asyncio
 
@@ -175,6 +175,49 @@ async def test_add_review_session_without_group(
     assert review["session_id"] == session.id
     assert review["correct"] is True
 
+async def test_add_reviews_batch(
+    db: AsyncSession,
+    test_session: Session,
+    test_word: Word,
+    test_word_2: Word,
+    test_group: Group
+) -> None:
+    """Test adding a batch of reviews with per-item validation."""
+    await group.add_words(db, group_id=test_group.id, word_ids=[test_word.id])
+
+    results = await SessionService.add_reviews(
+        db,
+        session_id=test_session.id,
+        reviews=[
+            WordReviewCreate(word_id=test_word.id, correct=True),
+            WordReviewCreate(word_id=test_word_2.id, correct=True),
+            WordReviewCreate(word_id=999999, correct=False),
+            WordReviewCreate(word_id=test_word.id, correct=False),
+        ]
+    )
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert results[0].id is not None and results[0].error is None
+    assert "does not belong to the session's group" in results[1].error
+    assert "not found" in results[2].error
+    assert results[3].id is not None and results[3].id != results[0].id
+
+    stats = await SessionService.get_session_stats(db, test_session.id)
+    assert stats["total_reviews"] == 2
+    assert stats["correct_reviews"] == 1
+
+async def test_add_reviews_batch_nonexistent_session(
+    db: AsyncSession,
+    test_word: Word
+) -> None:
+    """Test adding a batch to a nonexistent session raises error."""
+    with pytest.raises(ValueError) as exc_info:
+        await SessionService.add_reviews(
+            db,
+            session_id=999999,
+            reviews=[WordReviewCreate(word_id=test_word.id, correct=True)]
+        )
+    assert "not found" in str(exc_info.value)
+
 async def test_get_session_stats(
     db: AsyncSession,
     test_session: Session,
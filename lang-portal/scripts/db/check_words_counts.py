@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Check groups.words_count against word_groups for the Language Learning Portal.
+
+The counts are maintained by triggers on word_groups. Run this script to
+find groups whose count drifted (e.g. rows changed with the triggers
+missing) and pass --repair to recount them. Exits with status 1 when
+drift is found and not repaired.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add backend to Python path
+backend_dir = Path(__file__).parents[2] / "backend-fastapi"
+sys.path.append(str(backend_dir))
+
+from app.core.database import AsyncSessionLocal
+from app.crud.group import group
+
+# Import all models so that mapper relationships can be resolved
+from app.models.word import Word  # noqa: F401
+from app.models.group import Group  # noqa: F401
+from app.models.activity import Activity  # noqa: F401
+from app.models.session import Session  # noqa: F401
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+async def check_words_counts(repair: bool = False) -> int:
+    """Report drifted groups, recount them if `repair`; returns the number left drifted."""
+    async with AsyncSessionLocal() as session:
+        try:
+            drift = await group.find_words_count_drift(session)
+            for group_id, stored, actual in drift:
+                logger.warning(f"Group {group_id}: words_count is {stored}, has {actual} words")
+            if not drift:
+                logger.info("All group word counts are consistent")
+                return 0
+            if not repair:
+                logger.info(f"{len(drift)} groups drifted; run with --repair to fix them")
+                return len(drift)
+            repaired = await group.repair_words_counts(session)
+            logger.info(f"Repaired word counts of {repaired} groups")
+            return 0
+        except Exception as e:
+            logger.error(f"Error checking group word counts: {e}")
+            await session.rollback()
+            raise
+
+def main() -> None:
+    """Entry point for the check script."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repair", action="store_true", help="Recount drifted groups")
+    args = parser.parse_args()
+    try:
+        drifted = asyncio.run(check_words_counts(repair=args.repair))
+    except Exception as e:
+        logger.error(f"Failed to check group word counts: {e}")
+        sys.exit(1)
+    if drifted:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@ import asyncio
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine
 from app.core.config import get_settings
+from app.models.word_group import WORD_GROUPS_TRIGGERS
+from app.models.word_stats import WORD_STATS_TRIGGERS
 
 # Setup logging
 logging.basicConfig(
@@ -51,6 +53,7 @@ CREATE TABLE groups (
 CREATE TABLE word_groups (
     word_id INTEGER NOT NULL,
     group_id INTEGER NOT NULL,
+    position INTEGER,
     PRIMARY KEY (word_id, group_id),
     FOREIGN KEY (word_id) REFERENCES words (id) ON DELETE CASCADE,
     FOREIGN KEY (group_id) REFERENCES groups (id) ON DELETE CASCADE
@@ -84,6 +87,49 @@ CREATE TABLE word_review_items (
     FOREIGN KEY (word_id) REFERENCES words (id) ON DELETE CASCADE,
     FOREIGN KEY (session_id) REFERENCES sessions (id) ON DELETE CASCADE
 );
+
+-- Word Stats rollup table (maintained on every review write)
+CREATE TABLE word_stats (
+    word_id INTEGER PRIMARY KEY,
+    correct_count INTEGER NOT NULL DEFAULT 0,
+    wrong_count INTEGER NOT NULL DEFAULT 0,
+    last_reviewed_at DATETIME,
+    FOREIGN KEY (word_id) REFERENCES words (id) ON DELETE CASCADE
+);
+
+-- Spaced-repetition (SM-2) schedule per reviewed word (maintained on every review write)
+CREATE TABLE word_schedule (
+    word_id INTEGER PRIMARY KEY,
+    repetitions INTEGER NOT NULL DEFAULT 0,
+    interval_days FLOAT NOT NULL DEFAULT 0,
+    ease FLOAT NOT NULL DEFAULT 2.5,
+    last_reviewed_at DATETIME NOT NULL,
+    next_due DATETIME NOT NULL,
+    FOREIGN KEY (word_id) REFERENCES words (id) ON DELETE CASCADE
+);
+
+-- Kanji components of each word's parts (maintained by the backend)
+CREATE TABLE word_parts (
+    word_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    component TEXT NOT NULL,
+    reading TEXT NOT NULL,
+    PRIMARY KEY (word_id, position),
+    FOREIGN KEY (word_id) REFERENCES words (id) ON DELETE CASCADE
+);
+
+-- Cache generations (write counter per table, shared by all workers)
+CREATE TABLE cache_generations (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+-- Word search index (FTS5, rowid = words.id, maintained by the backend)
+CREATE VIRTUAL TABLE words_fts USING fts5(
+    kanji, romaji, english, parts_kanji,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '1 2 3'
+);
 """
 
 # SQL statements for index creation
@@ -91,19 +137,42 @@ CREATE_INDEXES_SQL = """
 -- Performance indexes
 CREATE INDEX idx_words_kanji ON words(kanji);
 CREATE INDEX idx_words_romaji ON words(romaji);
+CREATE INDEX idx_words_english ON words(english);
 CREATE INDEX idx_groups_name ON groups(name);
+CREATE INDEX idx_groups_words_count ON groups(words_count);
+CREATE INDEX idx_activities_name ON activities(name);
 CREATE INDEX idx_sessions_created_at ON sessions(created_at);
 CREATE INDEX idx_word_review_items_created_at ON word_review_items(created_at);
 
 -- Foreign key indexes
-CREATE INDEX idx_word_groups_word_id ON word_groups(word_id);
-CREATE INDEX idx_word_groups_group_id ON word_groups(group_id);
+-- (word_groups lookups by word_id use its primary key)
+CREATE INDEX idx_word_groups_group_id ON word_groups(group_id, word_id);
+-- Group members by dense position, for random sampling
+CREATE INDEX idx_word_groups_position ON word_groups(group_id, position);
 CREATE INDEX idx_sessions_group_id ON sessions(group_id);
 CREATE INDEX idx_sessions_activity_id ON sessions(activity_id);
 CREATE INDEX idx_word_review_items_word_id ON word_review_items(word_id);
+-- Reviews of a session in id order (the index ends with the rowid)
 CREATE INDEX idx_word_review_items_session_id ON word_review_items(session_id);
+-- Correct counts per session without reading the reviews
+CREATE INDEX idx_word_review_items_session_correct ON word_review_items(session_id, correct);
+
+-- Sort indexes for the word_stats rollup
+CREATE INDEX idx_word_stats_correct_count ON word_stats(correct_count, word_id);
+CREATE INDEX idx_word_stats_wrong_count ON word_stats(wrong_count, word_id);
+
+-- Study queue: schedules in due order
+CREATE INDEX idx_word_schedule_next_due ON word_schedule(next_due, word_id);
+
+-- Word lookups by kanji component (and reading)
+CREATE INDEX idx_word_parts_component ON word_parts(component, reading, word_id);
 """
 
+# Triggers contain semicolons, so they are kept as separate statements
+# groups.words_count and word_groups.position follow word_groups inserts and deletes,
+# and every new word gets a word_stats row
+CREATE_TRIGGERS_SQL = WORD_GROUPS_TRIGGERS + WORD_STATS_TRIGGERS
+
 async def init_db(force: bool = False) -> None:
     """Initialize the database with schema."""
     db_url = settings.DATABASE_URL
@@ -165,6 +234,11 @@ async def init_db(force: bool = False) -> None:
                 if statement.strip():
                     await conn.execute(text(statement))
             
+            # Create triggers
+            logger.info("Creating database triggers...")
+            for statement in CREATE_TRIGGERS_SQL:
+                await conn.execute(text(statement))
+            
             logger.info("Database initialization completed successfully")
             
     except Exception as e:
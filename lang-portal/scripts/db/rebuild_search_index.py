@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Rebuild the word search indexes for the Language Learning Portal.
+
+Rebuilds the words_fts full-text index and the word_parts component
+index. Both are normally kept up to date as words are created, updated and
+deleted through the API. Run this script after importing words directly
+into the database or to repair a drifted index.
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add backend to Python path
+backend_dir = Path(__file__).parents[2] / "backend-fastapi"
+sys.path.append(str(backend_dir))
+
+from app.core.database import AsyncSessionLocal
+from app.crud.word import word
+
+# Import all models so that mapper relationships can be resolved
+from app.models.word import Word  # noqa: F401
+from app.models.group import Group  # noqa: F401
+from app.models.activity import Activity  # noqa: F401
+from app.models.session import Session  # noqa: F401
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+async def rebuild_search_index() -> None:
+    """Re-index every word for full-text search and by component."""
+    async with AsyncSessionLocal() as session:
+        try:
+            count = await word.rebuild_search_index(session)
+            logger.info(f"Indexed {count} words for search")
+        except Exception as e:
+            logger.error(f"Error rebuilding search index: {e}")
+            await session.rollback()
+            raise
+
+def main() -> None:
+    """Entry point for the rebuild script."""
+    try:
+        asyncio.run(rebuild_search_index())
+    except Exception as e:
+        logger.error(f"Failed to rebuild search index: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Rebuild the spaced-repetition schedules for the Language Learning Portal.
+
+Every review written through the API updates the SM-2 schedule of its
+word. Run this script to replay the whole review history after bulk
+imports of reviews or after changing the scheduling rules.
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add backend to Python path
+backend_dir = Path(__file__).parents[2] / "backend-fastapi"
+sys.path.append(str(backend_dir))
+
+from app.core.database import AsyncSessionLocal
+from app.crud.word_schedule import word_schedule
+
+# Import all models so that mapper relationships can be resolved
+from app.models.word import Word  # noqa: F401
+from app.models.group import Group  # noqa: F401
+from app.models.activity import Activity  # noqa: F401
+from app.models.session import Session  # noqa: F401
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+async def rebuild_word_schedule() -> None:
+    """Replay word_review_items into word_schedule."""
+    async with AsyncSessionLocal() as session:
+        try:
+            count = await word_schedule.rebuild(session)
+            logger.info(f"Rebuilt review schedules for {count} words")
+        except Exception as e:
+            logger.error(f"Error rebuilding word schedules: {e}")
+            await session.rollback()
+            raise
+
+def main() -> None:
+    """Entry point for the rebuild script."""
+    try:
+        asyncio.run(rebuild_word_schedule())
+    except Exception as e:
+        logger.error(f"Failed to rebuild word schedules: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Rebuild the word_stats rollup table for the Language Learning Portal.
+
+The rollup is normally kept up to date as reviews are written. Run this
+script after bulk imports of review history or to repair drifted counts.
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add backend to Python path
+backend_dir = Path(__file__).parents[2] / "backend-fastapi"
+sys.path.append(str(backend_dir))
+
+from app.core.database import AsyncSessionLocal
+from app.crud.word_stats import word_stats
+
+# Import all models so that mapper relationships can be resolved
+from app.models.word import Word  # noqa: F401
+from app.models.group import Group  # noqa: F401
+from app.models.activity import Activity  # noqa: F401
+from app.models.session import Session  # noqa: F401
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+async def rebuild_word_stats() -> None:
+    """Recompute word_stats from word_review_items."""
+    async with AsyncSessionLocal() as session:
+        try:
+            count = await word_stats.rebuild(session)
+            logger.info(f"Rebuilt review statistics for {count} words")
+        except Exception as e:
+            logger.error(f"Error rebuilding word stats: {e}")
+            await session.rollback()
+            raise
+
+def main() -> None:
+    """Entry point for the rebuild script."""
+    try:
+        asyncio.run(rebuild_word_stats())
+    except Exception as e:
+        logger.error(f"Failed to rebuild word stats: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
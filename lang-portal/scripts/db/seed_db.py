@@ -19,6 +19,7 @@ import sys
 sys.path.append(str(backend_dir))
 
 from app.core.database import AsyncSessionLocal
+from app.crud.word import word as word_crud
 from app.models.word import Word
 from app.models.group import Group
 from app.models.activity import Activity
@@ -63,12 +64,16 @@ async def seed_words(session: AsyncSession, words_data: List[Dict[str, Any]]) ->
     await session.commit()
     logger.info(f"Seeded {len(words_data)} words")
 
+    # Words added directly bypass CRUDWord, so index them in one pass
+    indexed = await word_crud.rebuild_search_index(session)
+    logger.info(f"Indexed {indexed} words for search")
+
 async def seed_groups(session: AsyncSession, groups_data: List[Dict[str, Any]]) -> None:
     """Seed groups table with data."""
     for group_data in groups_data:
         group = Group(
             name=group_data["name"],
-            words_count=0  # Will be updated when word_groups are added
+            words_count=0  # Counted by the word_groups triggers
         )
         session.add(group)
     
@@ -76,10 +81,7 @@ async def seed_groups(session: AsyncSession, groups_data: List[Dict[str, Any]])
     logger.info(f"Seeded {len(groups_data)} groups")
 
 async def seed_word_groups(session: AsyncSession, word_groups_data: List[Dict[str, Any]]) -> None:
-    """Seed word_groups table with data and update group word counts."""
-    # Track word counts per group
-    group_word_counts: Dict[int, int] = {}
-    
+    """Seed word_groups table with data; triggers keep group word counts."""
     # Create word_group associations
     for assoc in word_groups_data:
         word_id = assoc["word_id"]
@@ -101,20 +103,9 @@ async def seed_word_groups(session: AsyncSession, word_groups_data: List[Dict[st
             group_id=group_id
         )
         session.add(word_group)
-        
-        # Update word count for this group
-        group_word_counts[group_id] = group_word_counts.get(group_id, 0) + 1
-    
-    await session.commit()
-    
-    # Update word counts for each group
-    for group_id, count in group_word_counts.items():
-        group = await session.get(Group, group_id)
-        if group:
-            group.words_count = count
     
     await session.commit()
-    logger.info(f"Seeded word-group associations and updated group word counts")
+    logger.info(f"Seeded word-group associations")
 
 async def seed_activities(
     session: AsyncSession,
@@ -1,4 +1,11 @@
-import { ApiClient, Session, WordReview, ApiResponse } from '../types';
+import {
+  ApiClient,
+  Session,
+  WordReview,
+  ApiResponse,
+  ReviewStream,
+  ReviewStreamMessage,
+} from '../types';
 
 class ApiClientImpl implements ApiClient {
   private baseUrl: string;
@@ -44,6 +51,35 @@ class ApiClientImpl implements ApiClient {
         throw new Error('Failed to submit review');
       }
     },
+
+    stream: (
+      sessionId: number,
+      onMessage: (message: ApiResponse<ReviewStreamMessage>) => void
+    ): ReviewStream => {
+      const url = `${this.baseUrl.replace(/^http/, 'ws')}/sessions/${sessionId}/ws`;
+      const socket = new WebSocket(url);
+      // Reviews sent before the connection opens are queued, not dropped
+      const queued: WordReview[] = [];
+
+      socket.onopen = () => {
+        if (queued.length) {
+          socket.send(JSON.stringify(queued.splice(0)));
+        }
+      };
+      socket.onmessage = (event) => onMessage(JSON.parse(event.data));
+
+      return {
+        send: (reviews: WordReview | WordReview[]) => {
+          const items = Array.isArray(reviews) ? reviews : [reviews];
+          if (socket.readyState === WebSocket.OPEN) {
+            socket.send(JSON.stringify(items));
+          } else {
+            queued.push(...items);
+          }
+        },
+        close: () => socket.close(),
+      };
+    },
   };
 }
 
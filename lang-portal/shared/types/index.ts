@@ -36,6 +36,37 @@ export interface WordReview {
     correct: boolean;
 }
 
+// Word Review result, one per review written by a stream batch
+export interface WordReviewResult {
+    index: number;
+    word_id: number;
+    correct: boolean;
+    id: number | null;
+    error: string | null;
+}
+
+// Running statistics of a session
+export interface SessionStats {
+    total_reviews: number;
+    correct_reviews: number;
+    accuracy: number;
+}
+
+// Message sent by the review stream after each written batch
+export interface ReviewStreamMessage {
+    session_id: number;
+    accepted: number;
+    rejected: number;
+    results: WordReviewResult[];
+    stats: SessionStats;
+}
+
+// Open review stream of a session
+export interface ReviewStream {
+    send: (reviews: WordReview | WordReview[]) => void;
+    close: () => void;
+}
+
 // Game component props interface
 export interface GameProps {
     apiClient: ApiClient;
@@ -49,5 +80,9 @@ export interface ApiClient {
     sessions: {
         create: (groupId: number, activityId: number) => Promise<Session>;
         review: (sessionId: number, data: WordReview) => Promise<void>;
+        stream: (
+            sessionId: number,
+            onMessage: (message: ApiResponse<ReviewStreamMessage>) => void
+        ) => ReviewStream;
     };
 } 
\ No newline at end of file